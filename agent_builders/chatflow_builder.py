@@ -1,235 +1,284 @@
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.checkpoint.redis import RedisSaver, AsyncRedisSaver
-from langgraph.constants import START, END
-from langgraph.graph import StateGraph
-from pymilvus import AsyncMilvusClient
-from config.config_setup import ChatFlowConfig
-from elements.edge_initialization import create_edges, create_knowledge_edges, create_global_edges, \
-    create_knowledge_transfer_edges
-from elements.hang_up_node import hang_up
-from elements.node_initialization import create_base_node, create_transfer_node, create_knowledge_reply_node, \
-    create_global_reply_node, create_knowledge_transfer_node
-from functionals.log_utils import logger_chatflow
-from functionals.matchers import KeywordMatcher, SemanticMatcher
-from functionals.milvus import initialize_milvus_async
-from functionals.state import ChatState
-
-async def build_chatflow(chatflow_config: ChatFlowConfig, redis_checkpointer: RedisSaver | AsyncRedisSaver | None = None):
-    # TODO: Load all the resources
-    agent_config = chatflow_config.agent_config
-    knowledge_context = chatflow_config.knowledge_context
-    chatflow_design_context = chatflow_config.chatflow_design_context
-    global_config_context = chatflow_config.global_config_context
-    intentions = chatflow_config.intentions
-
-    # TODO: Set up matchers for knowledge
-    """
-    When use_llm is off or 
-    llm_threshold > 0 even if use_llm is on (meaning we still use the traditional approaches if user input is below this threshold),
-    We initialize the matchers of these traditional approaches: keyword and semantic
-    """
-    knowledge_keyword_matcher = None
-    knowledge_semantic_matcher = None
-    milvus_client = AsyncMilvusClient()
-
-    if agent_config.enable_nlp == 1: # Use semantic matching globally
-        if agent_config.use_llm !=1 or agent_config.llm_threshold > 0:
-            # for intentions from knowledge
-            knowledge_keyword_matcher = KeywordMatcher(knowledge_context.knowledge)
-
-            # Initialize Milvus client - Async
-            milvus_client: AsyncMilvusClient = await initialize_milvus_async(
-                agent_config.vector_db_url,
-                agent_config.collection_name,
-                intentions,
-                knowledge_context.knowledge
-            )
-
-            # Initialize knowledge_semantic_matcher
-            knowledge_semantic_matcher = SemanticMatcher(
-                agent_config.collection_name,
-                [item.get("intention_id") for item in knowledge_context.knowledge],
-                milvus_client,
-            )
-    else:
-        if agent_config.use_llm != 1 or agent_config.llm_threshold > 0:
-            # for intentions from knowledge
-            knowledge_keyword_matcher = KeywordMatcher(knowledge_context.knowledge)
-
-    knowledge_context.keyword_matcher=knowledge_keyword_matcher
-    knowledge_context.semantic_matcher=knowledge_semantic_matcher
-
-    # TODO: Router function to directly the conversation back to the last node in the state stack before assistant's response
-    def route_to_workflow(state: ChatState) -> str:
-        dialog_state = state.get("dialog_state", [])
-        if not dialog_state:  # At the beginning, send to the first node
-            return f"{chatflow_design_context.starting_node_id}_reply"
-        elif dialog_state[-1] == "hang_up":
-            return END
-        else:
-            return dialog_state[-1]
-
-    # TODO: Start to build the Graph officially
-    graph = StateGraph(ChatState)
-    # Create hang_up node. It's better to be created first, other the factory functions later will
-    # automatically build edges connected to this node.
-    graph.add_node("hang_up", hang_up)
-
-    # TODO: Iterate and build the main flows:
-    for main_flow in chatflow_design_context.chatflow_design:
-        if not main_flow:
-            e_m = "主流程不应为空"
-            logger_chatflow.error(e_m)
-            raise TypeError(e_m)
-
-        main_flow_content = main_flow.get("main_flow_content")
-        if not main_flow_content:
-            e_m = (f"{main_flow.get('main_flow_id')}-{main_flow.get('main_flow_name')}"
-                   f"主流程不包含任何节点")
-            logger_chatflow.error(e_m)
-            raise TypeError(e_m)
-
-        # Create base nodes:
-        base_nodes = main_flow_content.get("base_nodes", [])
-        for base_node in base_nodes:
-            create_base_node(
-                graph,
-                main_flow,
-                "regular",
-                base_node,
-                agent_config,
-                knowledge_context,
-                global_config_context,
-                chatflow_design_context,
-                intentions,
-                milvus_client
-            )
-
-        # Create transfer nodes
-        transfer_nodes = main_flow_content.get("transfer_nodes", [])
-        for transfer_node in transfer_nodes:
-            create_transfer_node(
-                graph,
-                main_flow,
-                "regular",
-                transfer_node,
-                agent_config,
-                chatflow_design_context,
-                knowledge_context
-            )
-
-        # Create the conditional edges from the base nodes
-        edge_setups = main_flow_content.get("edge_setups", [])
-        for edge_setup in edge_setups:
-            create_edges(
-                graph,
-                main_flow,
-                edge_setup,
-                chatflow_design_context,
-                knowledge_context
-            )
-
-    # TODO: Create nodes and edges of knowledge
-    # Create knowledge reply nodes
-    for knowledge_info in knowledge_context.knowledge:
-        if knowledge_info.get("answer_type") == 1: #  1-单轮回答 2-多轮回答
-            # Only when single round reply is checked, we create knowledge reply node
-            create_knowledge_reply_node(
-                graph,
-                knowledge_info,
-                agent_config,
-                chatflow_design_context
-            )
-            create_knowledge_edges(
-                graph,
-                knowledge_info,
-                chatflow_design_context
-            )
-
-    # Create knowledge main flows if any
-    knowledge_main_flow = knowledge_context.main_flow
-    if knowledge_main_flow: # Only
-        for main_flow in knowledge_main_flow:
-            if not main_flow:
-                e_m = "知识库流程不应为空"
-                logger_chatflow.error(e_m)
-                raise TypeError(e_m)
-
-            main_flow_content = main_flow.get("main_flow_content", {})
-            if not main_flow_content:
-                e_m = (f"{main_flow.get('main_flow_id')}-{main_flow.get('main_flow_name')}"
-                       f"知识库流程不包含任何节点")
-                logger_chatflow.error(e_m)
-                raise TypeError(e_m)
-
-            # Create knowledge base nodes:
-            base_nodes = main_flow_content.get("base_nodes", [])
-            for base_node in base_nodes:
-                create_base_node(
-                    graph,
-                    main_flow,
-                    "knowledge",
-                    base_node,
-                    agent_config,
-                    knowledge_context,
-                    global_config_context,
-                    chatflow_design_context,
-                    intentions,
-                    milvus_client
-                )
-
-            # Create knowledge transfer nodes
-            transfer_nodes = main_flow_content.get("transfer_nodes", [])
-            for transfer_node in transfer_nodes:
-                create_knowledge_transfer_node(
-                    graph,
-                    main_flow,
-                    "knowledge",
-                    transfer_node,
-                    agent_config,
-                    chatflow_design_context
-                )
-
-            # Create conditional edges from these transfer nodes
-            for transfer_node in transfer_nodes:
-                create_knowledge_transfer_edges(
-                    graph,
-                    main_flow,
-                    transfer_node,
-                    chatflow_design_context
-                )
-
-            # Create the conditional edges from the knowledge base nodes
-            edge_setups = main_flow_content.get("edge_setups", [])
-            for edge_setup in edge_setups:
-                create_edges(
-                    graph,
-                    main_flow,
-                    edge_setup,
-                    chatflow_design_context,
-                    knowledge_context
-                )
-
-    # TODO: Create nodes and edges of globals
-    # Create knowledge reply nodes
-    for global_config in global_config_context.global_configs:
-        create_global_reply_node(
-            graph,
-            global_config,
-            agent_config,
-            chatflow_design_context
-        )
-        # Create the conditional edges from knowledge reply nodes
-        create_global_edges(
-            graph,
-            global_config,
-            chatflow_design_context
-        )
-
-    # TODO: Create the conditional edges from the START node
-    graph.add_conditional_edges(START, route_to_workflow)
-
-    if redis_checkpointer: # In production environment, use Redis as the checkpointer
-        return graph.compile(checkpointer=redis_checkpointer), milvus_client
-
-    return graph.compile(checkpointer=MemorySaver()), milvus_client
\ No newline at end of file
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.redis import RedisSaver, AsyncRedisSaver
+from langgraph.constants import START, END
+from langgraph.graph import StateGraph
+from pymilvus import AsyncMilvusClient
+from config.config_setup import ChatFlowConfig
+from elements.edge_initialization import create_edges, create_knowledge_edges, create_global_edges, \
+    create_knowledge_transfer_edges
+from elements.hang_up_node import hang_up
+from elements.node_initialization import create_base_node, create_transfer_node, create_knowledge_reply_node, \
+    create_global_reply_node, create_knowledge_transfer_node
+from functionals.embedding_functions import warm_up_embedding_cache
+from functionals.log_utils import logger_chatflow
+from functionals.matchers import KeywordMatcher, SemanticMatcher
+from functionals.milvus import initialize_milvus_async, milvus_client_pool
+from functionals.vector_index import InProcessVectorIndex
+from functionals.state import ChatState
+
+def keyword_matcher_sources(chatflow_config: ChatFlowConfig) -> list:
+    """What the agent's KeywordMatcher is compiled from, in order."""
+    return chatflow_config.intentions + chatflow_config.knowledge_context.knowledge
+
+async def build_chatflow(chatflow_config: ChatFlowConfig, redis_checkpointer: RedisSaver | AsyncRedisSaver | None = None,
+                         keyword_matcher: KeywordMatcher | None = None):
+    # TODO: Load all the resources
+    agent_config = chatflow_config.agent_config
+    knowledge_context = chatflow_config.knowledge_context
+    chatflow_design_context = chatflow_config.chatflow_design_context
+    global_config_context = chatflow_config.global_config_context
+    intentions = chatflow_config.intentions
+
+    # TODO: Set up matchers for knowledge
+    """
+    When use_llm is off or 
+    llm_threshold > 0 even if use_llm is on (meaning we still use the traditional approaches if user input is below this threshold),
+    We initialize the matchers of these traditional approaches: keyword and semantic
+    """
+    # One Aho-Corasick automaton for all the intentions and knowledge of the agent, nodes match through views of it.
+    # The caller may pass it already compiled, e.g. loaded from a snapshot (see keyword_matcher_sources)
+    if keyword_matcher is None:
+        keyword_matcher = KeywordMatcher(keyword_matcher_sources(chatflow_config))
+    knowledge_ids = [item.get("intention_id") for item in knowledge_context.knowledge]
+    knowledge_keyword_matcher = None
+    knowledge_semantic_matcher = None
+    milvus_client: AsyncMilvusClient | None = None # acquired from milvus_client_pool only when the agent searches Milvus
+    vector_index = None # in-process vector index, used instead of Milvus when semantic_backend is "memory"
+
+    try:
+        if agent_config.enable_nlp == 1: # Use semantic matching globally
+            if agent_config.use_llm !=1 or agent_config.llm_threshold > 0:
+                # for intentions from knowledge
+                knowledge_keyword_matcher = keyword_matcher.view(knowledge_ids)
+
+                if agent_config.semantic_backend == "memory":
+                    # Small agents keep all their phrase vectors in process, no Milvus round trip per turn
+                    vector_index = await InProcessVectorIndex.from_data(
+                        agent_config.collection_name,
+                        intentions,
+                        knowledge_context.knowledge,
+                        agent_config.embedding_dim
+                    )
+                else:
+                    # Initialize Milvus client - Async
+                    milvus_client: AsyncMilvusClient = await initialize_milvus_async(
+                        agent_config.vector_db_url,
+                        agent_config.collection_name,
+                        intentions,
+                        knowledge_context.knowledge,
+                        agent_config.milvus_layout,
+                        {"M": agent_config.hnsw_m, "efConstruction": agent_config.hnsw_ef_construction},
+                        agent_config.embedding_dim,
+                        agent_config.milvus_index_type
+                    )
+
+                # Initialize knowledge_semantic_matcher
+                knowledge_semantic_matcher = SemanticMatcher(
+                    agent_config.collection_name,
+                    knowledge_ids,
+                    milvus_client,
+                    vector_index,
+                    agent_config.semantic_top_k,
+                    agent_config.semantic_aggregation,
+                    agent_config.nlp_threshold,
+                    agent_config.hnsw_ef,
+                    agent_config.embedding_dim
+                )
+
+                # Pre-seed the shared embedding cache with what users often say word for word
+                seed_texts = []
+                for item in intentions + knowledge_context.knowledge:
+                    seed_texts += item.get("semantic") or []
+                    seed_texts += [k for k in item.get("keywords") or [] if not KeywordMatcher._is_probably_regex(k)]
+                seeded_count = await warm_up_embedding_cache(seed_texts)
+                logger_chatflow.info(f"向量缓存预热完成，新增{seeded_count}条文本")
+        else:
+            if agent_config.use_llm != 1 or agent_config.llm_threshold > 0:
+                # for intentions from knowledge
+                knowledge_keyword_matcher = keyword_matcher.view(knowledge_ids)
+
+        knowledge_context.keyword_matcher=knowledge_keyword_matcher
+        knowledge_context.semantic_matcher=knowledge_semantic_matcher
+
+        # TODO: Router function to directly the conversation back to the last node in the state stack before assistant's response
+        def route_to_workflow(state: ChatState) -> str:
+            dialog_state = state.get("dialog_state", [])
+            if not dialog_state:  # At the beginning, send to the first node
+                return f"{chatflow_design_context.starting_node_id}_reply"
+            elif dialog_state[-1] == "hang_up":
+                return END
+            else:
+                return dialog_state[-1]
+
+        # TODO: Start to build the Graph officially
+        graph = StateGraph(ChatState)
+        # Create hang_up node. It's better to be created first, other the factory functions later will
+        # automatically build edges connected to this node.
+        graph.add_node("hang_up", hang_up)
+
+        # TODO: Iterate and build the main flows:
+        for main_flow in chatflow_design_context.chatflow_design:
+            if not main_flow:
+                e_m = "主流程不应为空"
+                logger_chatflow.error(e_m)
+                raise TypeError(e_m)
+
+            main_flow_content = main_flow.get("main_flow_content")
+            if not main_flow_content:
+                e_m = (f"{main_flow.get('main_flow_id')}-{main_flow.get('main_flow_name')}"
+                       f"主流程不包含任何节点")
+                logger_chatflow.error(e_m)
+                raise TypeError(e_m)
+
+            # Create base nodes:
+            base_nodes = main_flow_content.get("base_nodes", [])
+            for base_node in base_nodes:
+                create_base_node(
+                    graph,
+                    main_flow,
+                    "regular",
+                    base_node,
+                    agent_config,
+                    knowledge_context,
+                    global_config_context,
+                    chatflow_design_context,
+                    intentions,
+                    milvus_client,
+                    vector_index,
+                    keyword_matcher
+                )
+
+            # Create transfer nodes
+            transfer_nodes = main_flow_content.get("transfer_nodes", [])
+            for transfer_node in transfer_nodes:
+                create_transfer_node(
+                    graph,
+                    main_flow,
+                    "regular",
+                    transfer_node,
+                    agent_config,
+                    chatflow_design_context,
+                    knowledge_context
+                )
+
+            # Create the conditional edges from the base nodes
+            edge_setups = main_flow_content.get("edge_setups", [])
+            for edge_setup in edge_setups:
+                create_edges(
+                    graph,
+                    main_flow,
+                    edge_setup,
+                    chatflow_design_context,
+                    knowledge_context
+                )
+
+        # TODO: Create nodes and edges of knowledge
+        # Create knowledge reply nodes
+        for knowledge_info in knowledge_context.knowledge:
+            if knowledge_info.get("answer_type") == 1: #  1-单轮回答 2-多轮回答
+                # Only when single round reply is checked, we create knowledge reply node
+                create_knowledge_reply_node(
+                    graph,
+                    knowledge_info,
+                    agent_config,
+                    chatflow_design_context
+                )
+                create_knowledge_edges(
+                    graph,
+                    knowledge_info,
+                    chatflow_design_context
+                )
+
+        # Create knowledge main flows if any
+        knowledge_main_flow = knowledge_context.main_flow
+        if knowledge_main_flow: # Only
+            for main_flow in knowledge_main_flow:
+                if not main_flow:
+                    e_m = "知识库流程不应为空"
+                    logger_chatflow.error(e_m)
+                    raise TypeError(e_m)
+
+                main_flow_content = main_flow.get("main_flow_content", {})
+                if not main_flow_content:
+                    e_m = (f"{main_flow.get('main_flow_id')}-{main_flow.get('main_flow_name')}"
+                           f"知识库流程不包含任何节点")
+                    logger_chatflow.error(e_m)
+                    raise TypeError(e_m)
+
+                # Create knowledge base nodes:
+                base_nodes = main_flow_content.get("base_nodes", [])
+                for base_node in base_nodes:
+                    create_base_node(
+                        graph,
+                        main_flow,
+                        "knowledge",
+                        base_node,
+                        agent_config,
+                        knowledge_context,
+                        global_config_context,
+                        chatflow_design_context,
+                        intentions,
+                        milvus_client,
+                        vector_index,
+                        keyword_matcher
+                    )
+
+                # Create knowledge transfer nodes
+                transfer_nodes = main_flow_content.get("transfer_nodes", [])
+                for transfer_node in transfer_nodes:
+                    create_knowledge_transfer_node(
+                        graph,
+                        main_flow,
+                        "knowledge",
+                        transfer_node,
+                        agent_config,
+                        chatflow_design_context
+                    )
+
+                # Create conditional edges from these transfer nodes
+                for transfer_node in transfer_nodes:
+                    create_knowledge_transfer_edges(
+                        graph,
+                        main_flow,
+                        transfer_node,
+                        chatflow_design_context
+                    )
+
+                # Create the conditional edges from the knowledge base nodes
+                edge_setups = main_flow_content.get("edge_setups", [])
+                for edge_setup in edge_setups:
+                    create_edges(
+                        graph,
+                        main_flow,
+                        edge_setup,
+                        chatflow_design_context,
+                        knowledge_context
+                    )
+
+        # TODO: Create nodes and edges of globals
+        # Create knowledge reply nodes
+        for global_config in global_config_context.global_configs:
+            create_global_reply_node(
+                graph,
+                global_config,
+                agent_config,
+                chatflow_design_context
+            )
+            # Create the conditional edges from knowledge reply nodes
+            create_global_edges(
+                graph,
+                global_config,
+                chatflow_design_context
+            )
+
+        # TODO: Create the conditional edges from the START node
+        graph.add_conditional_edges(START, route_to_workflow)
+
+        if redis_checkpointer: # In production environment, use Redis as the checkpointer
+            return graph.compile(checkpointer=redis_checkpointer), milvus_client
+
+        return graph.compile(checkpointer=MemorySaver()), milvus_client
+    except Exception:
+        # Nodes, warm-up or the graph failed after the Milvus client was acquired, give its reference back
+        await milvus_client_pool.release(milvus_client)
+        raise
\ No newline at end of file
@@ -20,6 +20,15 @@ class AgentConfig(BaseModel):
     # Vector database
     vector_db_url: str = Field(..., description="Local path for the vector DB")
     collection_name: str = Field(..., description="Vector DB collection data for the whole agent")
+    semantic_backend: Literal["milvus", "memory"] = Field("milvus", description="Where semantic matching searches: Milvus collection or in-process vector index")
+    milvus_layout: Literal["collection", "shared"] = Field("collection", description="Own Milvus collection, or a partition of the shared collection keyed by collection_name")
+    hnsw_m: int = Field(16, ge=2, le=2048, description="HNSW graph degree of the agent's collection, more is more accurate and bigger")
+    hnsw_ef_construction: int = Field(200, ge=1, description="HNSW candidate list size while building the index")
+    hnsw_ef: int | None = Field(None, ge=1, description="HNSW candidate list size of a search, None keeps the Milvus default")
+    embedding_dim: int = Field(1024, ge=32, le=1024, description="Leading dimensions of the Qwen3 embeddings kept in the semantic index (Matryoshka truncation)")
+    milvus_index_type: Literal["HNSW", "HNSW_SQ"] = Field("HNSW", description="Vector index type, HNSW_SQ keeps int8 scalar-quantized vectors")
+    semantic_top_k: int = Field(1, ge=1, description="Phrases fetched per semantic search, aggregated per intention")
+    semantic_aggregation: Literal["max", "mean", "count"] = Field("max", description="How the top-k phrase scores of one intention are aggregated")
 
 # class that holds information related to knowledge base, e.g. data, mapping, matchers.
 class KnowledgeContext(BaseModel):
@@ -100,7 +109,16 @@ class ChatFlowConfig(BaseModel):
             llm_background_info=str(agent_data.get("llm_background_info")),
             # 向量数据库
             vector_db_url=str(agent_data.get("vector_db_url")),
-            collection_name=str(agent_data.get("collection_name"))
+            collection_name=str(agent_data.get("collection_name")),
+            semantic_backend=str(agent_data.get("semantic_backend") or "milvus"),
+            milvus_layout=str(agent_data.get("milvus_layout") or "collection"),
+            hnsw_m=int(agent_data.get("hnsw_m") or 16),
+            hnsw_ef_construction=int(agent_data.get("hnsw_ef_construction") or 200),
+            hnsw_ef=int(agent_data["hnsw_ef"]) if agent_data.get("hnsw_ef") else None,
+            embedding_dim=int(agent_data.get("embedding_dim") or 1024),
+            milvus_index_type=str(agent_data.get("milvus_index_type") or "HNSW"),
+            semantic_top_k=int(agent_data.get("semantic_top_k") or 1),
+            semantic_aggregation=str(agent_data.get("semantic_aggregation") or "max")
         )
 
         # TODO: 2. Use knowledge and knowledge main flows to prepare knowledge context
@@ -1,12 +1,69 @@
-from pathlib import Path
-
-# Get project folder dir
-current_file = Path(__file__).resolve()
-project_dir = current_file.parent.parent
-
-ENV_PATH = project_dir / ".env"
-LOG_PATH = project_dir / "logs"
-
-# Embedding service
-# EMBED_SERVICE_URL = "http://192.168.0.143:8081" # Tuo local deployment, port 8081
-EMBED_SERVICE_URL = "http://192.168.0.143:8081" # also deployed on the server, port 8083
\ No newline at end of file
+import os
+from pathlib import Path
+
+# Get project folder dir
+current_file = Path(__file__).resolve()
+project_dir = current_file.parent.parent
+
+ENV_PATH = project_dir / ".env"
+LOG_PATH = project_dir / "logs"
+
+# Embedding service
+# EMBED_SERVICE_URL = "http://192.168.0.143:8081" # Tuo local deployment, port 8081
+EMBED_SERVICE_URL = "http://192.168.0.143:8081" # also deployed on the server, port 8083
+EMBED_TIMEOUT = 3.0 # seconds to wait for one embedding response
+EMBED_CONNECT_TIMEOUT = 1.0 # seconds to wait for a connection to the embedding service
+EMBED_MAX_CONNECTIONS = 32 # connections kept in the pool of the embedding client
+EMBED_MAX_KEEPALIVE_CONNECTIONS = 16 # idle keep-alive connections kept open
+EMBED_MAX_CONCURRENCY = 16 # embedding requests in flight at the same time
+EMBED_DOCUMENTS_TIMEOUT = 30.0 # seconds to wait for a bulk embedding response of the sync client
+EMBED_RESPONSE_FORMAT = os.getenv("EMBED_RESPONSE_FORMAT", "json") # json, float32 or npy, binary formats skip the JSON float parsing
+
+EMBED_MODEL_NAME = "Qwen3-Embedding-0.6B" # part of the embedding cache key, change it when the model changes
+EMBED_CACHE_MAX_SIZE = 20000 # embeddings kept in the shared query cache
+EMBED_CACHE_TTL = 24 * 3600 # seconds an embedding stays in the shared query cache
+EMBED_WARMUP_BATCH_SIZE = 64 # texts per request when pre-seeding the cache
+
+EMBED_BATCHING_ENABLED = True # merge concurrent query embeddings into batched requests
+EMBED_BATCH_WINDOW_MS = 3.0 # longest time a query embedding waits for others to join its batch
+EMBED_BATCH_MAX_SIZE = 32 # a batch is sent at once when it reaches this size
+
+# Embedding backend of this deployment: "http" calls EMBED_SERVICE_URL, "onnx" runs the exported model in process
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "http")
+EMBED_ONNX_MODEL_PATH = os.getenv("EMBED_ONNX_MODEL_PATH", str(project_dir / "onnx_models" / "qwen3_embedding" / "model.onnx"))
+EMBED_ONNX_TOKENIZER_PATH = os.getenv("EMBED_ONNX_TOKENIZER_PATH", str(project_dir / "onnx_models" / "qwen3_embedding" / "tokenizer.json"))
+EMBED_ONNX_MAX_LENGTH = 512 # tokens kept per text, longer texts are truncated
+EMBED_ONNX_BATCH_SIZE = 32 # texts per inference run
+EMBED_ONNX_INTRA_OP_THREADS = 4 # CPU threads used by one inference run
+EMBED_ONNX_WORKERS = 2 # inference runs at the same time
+
+# On-disk phrase embedding store, kept under data/ so that it survives container restarts
+EMBED_STORE_DIR = os.getenv("EMBED_STORE_DIR", str(project_dir / "data" / "embedding_store"))
+EMBED_STORE_DIMENSION = 1024 # dimension of the stored vectors, Qwen3-Embedding-0.6B
+
+# Bulk embedding of the Milvus launchers
+EMBED_SYNC_CHUNK_SIZE = 64 # phrases per embedding request, each chunk is written to Milvus as soon as it is embedded
+EMBED_SYNC_WORKERS = 4 # embedding requests in flight at the same time
+MILVUS_SYNC_QUEUE_SIZE = 4 # embedded chunks waiting for insertion, bounds the memory of an async sync
+MILVUS_WARM_LOAD_CONCURRENCY = 4 # collections loaded at the same time when the recovered models are warmed up
+MILVUS_SHARED_COLLECTION_NAME = os.getenv("MILVUS_SHARED_COLLECTION_NAME", "shared_semantic_phrases") # collection of the agents in the shared layout
+MILVUS_SHARED_NUM_PARTITIONS = 64 # partitions the agents of the shared collection are hashed into by their collection_name
+MILVUS_MANIFEST_DIR = os.getenv("MILVUS_MANIFEST_DIR", str(project_dir / "data" / "milvus_manifests")) # what the last sync of each collection wrote
+
+# Semantic matching
+SEMANTIC_UNION_TOP_K = 8 # hits of the single search over intentions and knowledge, split by source afterwards
+MILVUS_SEARCH_TIMEOUT = 3.0 # seconds to wait for one Milvus search
+MILVUS_SEARCH_BATCHING_ENABLED = True # merge concurrent searches on the same collection into one request
+MILVUS_SEARCH_BATCH_WINDOW_MS = 2.0 # longest time a search waits for others to join its request
+MILVUS_SEARCH_BATCH_MAX_SIZE = 16 # query vectors per merged search request
+
+# Keyword matching
+KEYWORD_REGEX_TIMEOUT = 0.05 # seconds the regex keywords together may spend on one sentence, the patterns left after it are skipped
+KEYWORD_MATCHER_CACHE_SIZE = 1024 # compiled matchers of the /keyword_match endpoint kept by their keyword list
+KEYWORD_MATCH_BATCH_MAX_SIZE = 1000 # (keywords, sentence) pairs accepted by one /keyword_match/batch request
+
+# LLM intention decisions
+LLM_DECISION_CACHE_ENABLED = True # reuse the decision of an identical turn (node, normalized input, recent history) instead of calling the LLM
+LLM_DECISION_CACHE_MAX_SIZE = 10000 # decisions kept in process
+LLM_DECISION_CACHE_TTL = 6 * 3600 # seconds a decision stays cached, locally and in Redis
+LLM_DECISION_CACHE_REDIS = os.getenv("LLM_DECISION_CACHE_REDIS", "0") == "1" # share the decisions of all workers through Redis
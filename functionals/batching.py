@@ -0,0 +1,112 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+#TODO: Generic async micro-batcher
+class AsyncMicroBatcher:
+    """
+    Coalesce requests that arrive within a short window into one batch call.
+    A batch is flushed when max_batch_size items are waiting or max_wait_ms has passed since the first one,
+    then every caller receives its own result.
+    batch_fn takes the list of submitted items and must return one result per item, in the same order.
+    """
+    # Upper bounds of the batch size histogram buckets
+    BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+    def __init__(self,
+                 batch_fn: Callable[[list], Awaitable[list]],
+                 max_wait_ms: float = 3.0,
+                 max_batch_size: int = 32,
+                 name: str = "batcher"):
+        self.batch_fn = batch_fn
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.name = name
+        self._pending: list[tuple[Any, asyncio.Future, float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+        # metrics
+        self._batches = 0
+        self._items = 0
+        self._failed_batches = 0
+        self._max_batch_seen = 0
+        self._size_histogram = {str(b): 0 for b in self.BATCH_SIZE_BUCKETS} | {f">{self.BATCH_SIZE_BUCKETS[-1]}": 0}
+        self._recent_waits_ms = deque(maxlen=2000)
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop: # state of a previous event loop can't be reused
+            self._pending, self._timer, self._loop = [], None, loop
+
+        future = loop.create_future()
+        self._pending.append((item, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = self._loop.create_task(self._run_batch(batch))
+        self._tasks.add(task) # keep a reference until the batch is done
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[Any, asyncio.Future, float]]):
+        started = time.perf_counter()
+        self._record_batch(len(batch), [(started - enqueued) * 1000 for _, _, enqueued in batch])
+        items = [item for item, _, _ in batch]
+        try:
+            results = await self.batch_fn(items)
+            if len(results) != len(items):
+                raise ValueError(f"{self.name}批处理返回{len(results)}条结果，应为{len(items)}条")
+        except Exception as e:
+            self._failed_batches += 1
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future, _), result in zip(batch, results):
+            if not future.done(): # the caller may have been cancelled meanwhile
+                future.set_result(result)
+
+    def _record_batch(self, size: int, waits_ms: list[float]):
+        self._batches += 1
+        self._items += size
+        self._max_batch_seen = max(self._max_batch_seen, size)
+        bucket = next((str(b) for b in self.BATCH_SIZE_BUCKETS if size <= b), f">{self.BATCH_SIZE_BUCKETS[-1]}")
+        self._size_histogram[bucket] += 1
+        self._recent_waits_ms.extend(waits_ms)
+
+    def stats(self) -> dict:
+        waits = sorted(self._recent_waits_ms)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(p * len(waits)))], 3)
+
+        return {
+            "name": self.name,
+            "max_wait_ms": self.max_wait * 1000,
+            "max_batch_size": self.max_batch_size,
+            "batches": self._batches,
+            "items": self._items,
+            "failed_batches": self._failed_batches,
+            "avg_batch_size": round(self._items / self._batches, 3) if self._batches else 0.0,
+            "max_batch_size_seen": self._max_batch_seen,
+            "batch_size_histogram": dict(self._size_histogram),
+            "queue_wait_ms": {
+                "avg": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "p50": percentile(0.5),
+                "p99": percentile(0.99),
+                "max": round(waits[-1], 3) if waits else 0.0
+            }
+        }
@@ -0,0 +1,353 @@
+import asyncio
+import io
+import json
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from data.paths import EMBED_SERVICE_URL, EMBED_TIMEOUT, EMBED_CONNECT_TIMEOUT, EMBED_MAX_CONNECTIONS, \
+    EMBED_DOCUMENTS_TIMEOUT, EMBED_MAX_KEEPALIVE_CONNECTIONS, EMBED_MAX_CONCURRENCY, EMBED_MODEL_NAME, EMBED_ONNX_MODEL_PATH, \
+    EMBED_ONNX_TOKENIZER_PATH, EMBED_ONNX_MAX_LENGTH, EMBED_ONNX_BATCH_SIZE, EMBED_ONNX_INTRA_OP_THREADS, \
+    EMBED_ONNX_WORKERS, EMBED_RESPONSE_FORMAT
+from functionals.log_utils import logger_chatflow
+
+"""
+Embedding backends, selected per deployment with EMBED_BACKEND in data/paths.py:
+- http: the remote embedding service at EMBED_SERVICE_URL
+- onnx: an exported Qwen3-Embedding ONNX model running in this process on CPU
+
+Every backend exposes the same sync and async methods, the async ones never block the event loop.
+"""
+
+#TODO: Response formats of the /embed endpoint
+# json: {"embeddings": [[...], ...]}, float32: raw little-endian float32 rows, npy: a .npy file of shape (n, dim)
+EMBED_CONTENT_TYPES = {
+    "json": "application/json",
+    "float32": "application/octet-stream",
+    "npy": "application/x-npy"
+}
+EMBED_SHAPE_HEADER = "X-Embedding-Shape"
+NPY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0
+}
+
+def encode_embeddings(embeddings, response_format: str = "json") -> tuple[bytes, dict]:
+    """Serialize embeddings for the /embed response, returns the body and the headers."""
+    if response_format == "json":
+        if hasattr(embeddings, "tolist"):
+            embeddings = embeddings.tolist()
+        return json.dumps({"embeddings": embeddings}).encode(), {"Content-Type": EMBED_CONTENT_TYPES["json"]}
+    array = np.ascontiguousarray(embeddings, dtype="<f4")
+    if response_format == "float32":
+        headers = {"Content-Type": EMBED_CONTENT_TYPES["float32"], EMBED_SHAPE_HEADER: f"{array.shape[0]},{array.shape[1]}"}
+        return array.tobytes(), headers
+    if response_format == "npy":
+        buffer = io.BytesIO()
+        np.lib.format.write_array(buffer, array, allow_pickle=False)
+        return buffer.getvalue(), {"Content-Type": EMBED_CONTENT_TYPES["npy"]}
+    e_m = f"向量返回格式仅能为{list(EMBED_CONTENT_TYPES)}，当前为{response_format}"
+    logger_chatflow.error(e_m)
+    raise ValueError(e_m)
+
+def decode_embeddings(headers, content: bytes) -> np.ndarray | list:
+    """
+    Decode a /embed response of requests or httpx by its Content-Type.
+    Binary formats are read zero-copy with np.frombuffer into a read-only float32 array of shape (n, dim),
+    JSON is returned as lists. A service that ignores the Accept header always answers JSON.
+    """
+    content_type = headers.get("Content-Type", "").split(";")[0].strip()
+    if content_type == EMBED_CONTENT_TYPES["float32"]:
+        rows, dim = (int(x) for x in headers[EMBED_SHAPE_HEADER].split(","))
+        return np.frombuffer(content, dtype="<f4").reshape(rows, dim)
+    if content_type == EMBED_CONTENT_TYPES["npy"]:
+        header = io.BytesIO(content)
+        version = np.lib.format.read_magic(header)
+        # A float32 matrix is written with a 1.0 header, or 2.0 when the header is large; 3.0 is only for utf-8 field names
+        read_header = NPY_HEADER_READERS.get(version)
+        if read_header is None:
+            e_m = f"向量返回的npy格式版本仅能为{sorted(NPY_HEADER_READERS)}，当前为{version}"
+            logger_chatflow.error(e_m)
+            raise ValueError(e_m)
+        shape, fortran_order, dtype = read_header(header)
+        return np.frombuffer(content, dtype=dtype, offset=header.tell()).reshape(shape, order="F" if fortran_order else "C")
+    return json.loads(content)["embeddings"]
+
+def as_lists(embeddings) -> list[list[float]]:
+    return embeddings.tolist() if hasattr(embeddings, "tolist") else embeddings
+
+class EmbeddingBackend(ABC):
+    name = "base"
+
+    def __init__(self, model_name: str = EMBED_MODEL_NAME):
+        self.model_name = model_name
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+    @abstractmethod
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        ...
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return (await self.aembed_documents([text]))[0]
+
+    @abstractmethod
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        ...
+
+    def embed_documents_array(self, texts: list[str]) -> np.ndarray:
+        """Same as embed_documents, as a float32 array of shape (n, dim) without going through Python lists."""
+        return np.asarray(self.embed_documents(texts), dtype=np.float32)
+
+    async def aembed_documents_array(self, texts: list[str]) -> np.ndarray:
+        return np.asarray(await self.aembed_documents(texts), dtype=np.float32)
+
+    async def aembed_queries_array(self, texts: list[str]) -> np.ndarray:
+        """Embed the user queries of one turn batch, under the per-turn budget where the backend has one."""
+        return await self.aembed_documents_array(texts)
+
+    async def aclose(self):
+        pass
+
+#TODO: HTTP embedding service
+class AsyncEmbeddingClient:
+    """
+    Non-blocking client of the embedding service.
+    Keeps a pool of keep-alive connections, applies a timeout on every request
+    and bounds the number of requests in flight, so a slow embedding only delays its own caller.
+    """
+    def __init__(self,
+                 base_url: str = EMBED_SERVICE_URL,
+                 timeout: float = EMBED_TIMEOUT,
+                 connect_timeout: float = EMBED_CONNECT_TIMEOUT,
+                 max_connections: int = EMBED_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = EMBED_MAX_KEEPALIVE_CONNECTIONS,
+                 max_concurrency: int = EMBED_MAX_CONCURRENCY,
+                 response_format: str = EMBED_RESPONSE_FORMAT):
+        self.base_url = base_url
+        self.response_format = response_format
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.max_concurrency = max_concurrency
+        # Both the httpx client and the semaphore belong to one event loop, they are (re)created lazily in that loop
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=30.0
+                )
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client
+
+    async def _post_embed(self, payload: dict, timeout: float | None = None) -> np.ndarray | list:
+        client = self._get_client()
+        async with self._semaphore:
+            resp = await client.post(
+                "/embed",
+                json=payload,
+                headers={"Accept": EMBED_CONTENT_TYPES[self.response_format]},
+                timeout=httpx.Timeout(timeout or self.timeout, connect=self.connect_timeout)
+            )
+        resp.raise_for_status()
+        return decode_embeddings(resp.headers, resp.content)
+
+    async def embed_query(self, text: str, timeout: float | None = None) -> list[float]:
+        embeddings = await self._post_embed({"input": text}, timeout)
+        return as_lists(embeddings)[0]
+
+    async def embed_documents(self, texts: list[str], timeout: float | None = None) -> list[list[float]]:
+        if not texts:
+            return []
+        return as_lists(await self._post_embed({"input": texts}, timeout))
+
+    async def embed_documents_array(self, texts: list[str], timeout: float | None = None) -> np.ndarray:
+        return np.asarray(await self._post_embed({"input": texts}, timeout), dtype=np.float32)
+
+    async def aclose(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+class HttpEmbeddingBackend(EmbeddingBackend):
+    name = "http"
+
+    def __init__(self, base_url: str = EMBED_SERVICE_URL, model_name: str = EMBED_MODEL_NAME,
+                 response_format: str = EMBED_RESPONSE_FORMAT):
+        super().__init__(model_name)
+        self.base_url = base_url
+        self.response_format = response_format
+        # sync callers share one keep-alive session instead of opening a new connection per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=EMBED_MAX_KEEPALIVE_CONNECTIONS, pool_maxsize=EMBED_MAX_CONNECTIONS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.async_client = AsyncEmbeddingClient(base_url, response_format=response_format)
+
+    def _post_embed(self, payload: dict, timeout: float = EMBED_TIMEOUT) -> np.ndarray | list:
+        resp = self.session.post(
+            f"{self.base_url}/embed",
+            json=payload,
+            headers={"Accept": EMBED_CONTENT_TYPES[self.response_format]},
+            timeout=(EMBED_CONNECT_TIMEOUT, timeout)
+        )
+        resp.raise_for_status() #cecks the HTTP status code and raises an exception if the request failed
+        return decode_embeddings(resp.headers, resp.content)
+
+    def embed_query(self, text: str) -> list[float]:
+        return as_lists(self._post_embed({"input": text}))[0]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        return as_lists(self._post_embed({"input": texts}, EMBED_DOCUMENTS_TIMEOUT))
+
+    def embed_documents_array(self, texts: list[str]) -> np.ndarray:
+        return np.asarray(self._post_embed({"input": texts}, EMBED_DOCUMENTS_TIMEOUT), dtype=np.float32)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return await self.async_client.embed_query(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.async_client.embed_documents(texts, EMBED_DOCUMENTS_TIMEOUT)
+
+    async def aembed_documents_array(self, texts: list[str]) -> np.ndarray:
+        return await self.async_client.embed_documents_array(texts, EMBED_DOCUMENTS_TIMEOUT)
+
+    async def aembed_queries_array(self, texts: list[str]) -> np.ndarray:
+        return await self.async_client.embed_documents_array(texts)
+
+    async def aclose(self):
+        await self.async_client.aclose()
+
+#TODO: In-process ONNX embedding model
+class OnnxEmbeddingBackend(EmbeddingBackend):
+    """
+    Run an exported Qwen3-Embedding ONNX model on CPU.
+    The model takes input_ids and attention_mask (position_ids when declared) and returns either the
+    last hidden states, pooled here on the last real token like Qwen3-Embedding, or pooled sentence embeddings.
+    Vectors are L2-normalized. Batches run in a thread pool so the event loop keeps serving other calls.
+    """
+    name = "onnx"
+
+    def __init__(self,
+                 model_path: str = EMBED_ONNX_MODEL_PATH,
+                 tokenizer_path: str = EMBED_ONNX_TOKENIZER_PATH,
+                 model_name: str = EMBED_MODEL_NAME,
+                 max_length: int = EMBED_ONNX_MAX_LENGTH,
+                 batch_size: int = EMBED_ONNX_BATCH_SIZE,
+                 intra_op_threads: int = EMBED_ONNX_INTRA_OP_THREADS,
+                 workers: int = EMBED_ONNX_WORKERS):
+        super().__init__(model_name)
+        # onnxruntime and tokenizers are only needed by the deployments that select this backend
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        if not os.path.exists(model_path):
+            e_m = f"ONNX向量模型文件不存在：{model_path}"
+            logger_chatflow.error(e_m)
+            raise FileNotFoundError(e_m)
+        if not os.path.exists(tokenizer_path):
+            e_m = f"ONNX向量模型分词器文件不存在：{tokenizer_path}"
+            logger_chatflow.error(e_m)
+            raise FileNotFoundError(e_m)
+
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = intra_op_threads
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_path, sess_options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.no_padding() # padding is done per batch below
+        pad_id = self.tokenizer.token_to_id("<|endoftext|>")
+        self.pad_id = pad_id if pad_id is not None else 0
+
+        self.batch_size = max(1, batch_size)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="onnx-embed")
+        logger_chatflow.info(f"已加载ONNX向量模型：{model_path}，输入：{sorted(self.input_names)}")
+
+    def _run_batch(self, texts: list[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        max_len = max(len(e.ids) for e in encodings) or 1
+        input_ids = np.full((len(texts), max_len), self.pad_id, dtype=np.int64)
+        attention_mask = np.zeros((len(texts), max_len), dtype=np.int64)
+        for row, encoding in enumerate(encodings): # right padding
+            input_ids[row, :len(encoding.ids)] = encoding.ids
+            attention_mask[row, :len(encoding.ids)] = 1
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "position_ids" in self.input_names:
+            feeds["position_ids"] = np.maximum(np.cumsum(attention_mask, axis=1) - 1, 0)
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        feeds = {k: v for k, v in feeds.items() if k in self.input_names}
+
+        output = self.session.run(None, feeds)[0]
+        if output.ndim == 3: # last hidden states, take the last real token of each row
+            last_index = np.maximum(attention_mask.sum(axis=1) - 1, 0)
+            output = output[np.arange(len(texts)), last_index]
+        output = output.astype(np.float32)
+        norms = np.linalg.norm(output, axis=1, keepdims=True)
+        return output / np.maximum(norms, 1e-12)
+
+    def _embed_array(self, texts: list[str]) -> np.ndarray:
+        # Sort by length so that each batch pads as little as possible, then restore the input order
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        result = None
+        for i in range(0, len(order), self.batch_size):
+            batch_index = order[i:i + self.batch_size]
+            vectors = self._run_batch([texts[j] for j in batch_index])
+            if result is None:
+                result = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            result[batch_index] = vectors
+        return result if result is not None else np.empty((0, 0), dtype=np.float32)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        return self._embed_array(texts).tolist()
+
+    def embed_documents_array(self, texts: list[str]) -> np.ndarray:
+        return self._embed_array(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.embed_documents, texts)
+
+    async def aembed_documents_array(self, texts: list[str]) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._embed_array, texts)
+
+    async def aclose(self):
+        self.executor.shutdown(wait=False)
+
+def create_embedding_backend(name: str) -> EmbeddingBackend:
+    if name == "http":
+        return HttpEmbeddingBackend()
+    elif name == "onnx":
+        return OnnxEmbeddingBackend()
+    e_m = f"向量模型后端仅能为'http'或'onnx'，当前为{name}"
+    logger_chatflow.error(e_m)
+    raise ValueError(e_m)
@@ -0,0 +1,97 @@
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+import numpy as np
+from data.paths import EMBED_MODEL_NAME, EMBED_CACHE_MAX_SIZE, EMBED_CACHE_TTL
+
+# Punctuation and spaces around a short utterance don't change what the caller said
+_EDGE_NOISE = re.compile(r"^[\s\W_]+|[\s\W_]+$")
+_SPACES = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a sentence to the key form of the embedding cache:
+    full-width/half-width folding (NFKC), lower case, collapsed spaces, no punctuation at both ends.
+    """
+    normalized = unicodedata.normalize("NFKC", text or "").lower()
+    normalized = _SPACES.sub(" ", normalized).strip()
+    stripped = _EDGE_NOISE.sub("", normalized)
+    return stripped or normalized
+
+#TODO: Process-wide embedding cache
+class EmbeddingCache:
+    """
+    LRU cache of embeddings with TTL, keyed by (embedding model, normalized text).
+    Vectors are stored as float32 arrays to keep the memory footprint small, and returned as lists.
+    """
+    def __init__(self, max_size: int = EMBED_CACHE_MAX_SIZE, ttl: float = EMBED_CACHE_TTL, model_name: str = EMBED_MODEL_NAME):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.model_name = model_name
+        self._data: OrderedDict[tuple[str, str], tuple[float, np.ndarray]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0
+        }
+
+    def _key(self, text: str, model_name: str | None = None) -> tuple[str, str]:
+        return model_name or self.model_name, normalize_text(text)
+
+    def get(self, text: str, model_name: str | None = None) -> list[float] | None:
+        key = self._key(text, model_name)
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._stats["misses"] += 1
+                return None
+            expire_at, vector = item
+            if expire_at < time.monotonic():
+                del self._data[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._data.move_to_end(key) # mark as most recently used
+            self._stats["hits"] += 1
+        return vector.tolist()
+
+    def set(self, text: str, embedding, model_name: str | None = None):
+        key = self._key(text, model_name)
+        # A copy: rows decoded from a binary response are views that would keep the whole response alive
+        vector = np.array(embedding, dtype=np.float32, copy=True)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, vector)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False) # drop the least recently used
+                self._stats["evictions"] += 1
+
+    def contains(self, text: str, model_name: str | None = None) -> bool:
+        """Check a key without touching the hit/miss counters or the LRU order."""
+        key = self._key(text, model_name)
+        with self._lock:
+            item = self._data.get(key)
+            return item is not None and item[0] >= time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "model_name": self.model_name,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0
+            }
+
+# Shared by every SemanticMatcher of every loaded model in this process
+embedding_cache = EmbeddingCache()
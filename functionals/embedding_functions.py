@@ -1,23 +1,125 @@
-import requests
-from data.paths import EMBED_SERVICE_URL
-
-# TODO: call the embedding service with API
-def embed_query(text: str) -> list[float]:
-    resp = requests.post(f"{EMBED_SERVICE_URL}/embed", json={"input": text})
-    resp.raise_for_status() #cecks the HTTP status code and raises an exception if the request failed
-    return resp.json()["embeddings"][0]
-
-def embed_documents(texts: list[str]) -> list[float]:
-    resp = requests.post(f"{EMBED_SERVICE_URL}/embed", json={"input": texts})
-    resp.raise_for_status()
-    return resp.json()["embeddings"]
-
-# Example usage
-if __name__ == "__main__":
-    emb = embed_query("你哪位")
-    print(f"{len(emb)}")  # Should be 1024
-    print(f"{emb}")
-
-    emb_doc = embed_documents(["这是谁", "这是你"])
-    print(f"{len(emb_doc)}") # Should be 2
-    print(f"{emb_doc}")
\ No newline at end of file
+import asyncio
+import numpy as np
+from data.paths import EMBED_BACKEND, EMBED_WARMUP_BATCH_SIZE, EMBED_BATCHING_ENABLED, EMBED_BATCH_WINDOW_MS, \
+    EMBED_BATCH_MAX_SIZE, EMBED_STORE_DIMENSION
+from functionals.batching import AsyncMicroBatcher
+from functionals.embedding_backends import create_embedding_backend
+from functionals.embedding_cache import embedding_cache, normalize_text
+from functionals.embedding_store import phrase_embedding_store
+from functionals.log_utils import logger_chatflow
+
+# Process-wide backend (remote service or in-process ONNX model), shared by all the matchers and Milvus launchers
+embedding_backend = create_embedding_backend(EMBED_BACKEND)
+
+# TODO: sync embedding functions
+def embed_query(text: str) -> list[float]:
+    cached = embedding_cache.get(text)
+    if cached is not None:
+        return cached
+    embedding = embedding_backend.embed_query(text)
+    embedding_cache.set(text, embedding)
+    return embedding
+
+def embed_documents(texts: list[str]) -> list[list[float]]:
+    return embedding_backend.embed_documents(texts)
+
+# TODO: async embedding functions, used inside the event loop
+async def _embed_batch(texts: list[str]) -> list[list[float]]:
+    """Embed the texts coalesced by the batcher with one backend call, identical texts are embedded only once."""
+    unique_texts = list(dict.fromkeys(texts))
+    embeddings = await embedding_backend.aembed_queries_array(unique_texts)
+    lookup = dict(zip(unique_texts, embeddings))
+    return [lookup[text] for text in texts]
+
+# Concurrent single-text requests from different calls are merged into one batched backend call
+embedding_batcher = AsyncMicroBatcher(
+    _embed_batch,
+    max_wait_ms=EMBED_BATCH_WINDOW_MS,
+    max_batch_size=EMBED_BATCH_MAX_SIZE,
+    name="embedding"
+)
+
+async def aembed_query(text: str) -> list[float]:
+    cached = embedding_cache.get(text)
+    if cached is not None:
+        return cached
+    if EMBED_BATCHING_ENABLED:
+        embedding = await embedding_batcher.submit(text)
+    else:
+        embedding = await embedding_backend.aembed_query(text)
+    embedding_cache.set(text, embedding)
+    return embedding.tolist() if hasattr(embedding, 'tolist') else embedding
+
+async def aembed_documents(texts: list[str]) -> list[list[float]]:
+    return await embedding_backend.aembed_documents(texts)
+
+async def aembed_documents_array(texts: list[str]) -> np.ndarray:
+    return await embedding_backend.aembed_documents_array(texts)
+
+async def warm_up_embedding_cache(texts: list[str], batch_size: int = EMBED_WARMUP_BATCH_SIZE) -> int:
+    """
+    Pre-seed the shared embedding cache with the given texts, e.g. the semantic phrases and keywords of an agent.
+    Texts that are not cached yet are taken from phrase_embedding_store, only the ones it does not have are embedded,
+    in batches, and written back to it. Returns the number of newly cached texts.
+    """
+    pending = {}
+    for text in texts:
+        if not isinstance(text, str) or not text.strip():
+            continue
+        key = normalize_text(text)
+        if key not in pending and not embedding_cache.contains(text):
+            pending[key] = text
+    uncached = list(pending.values())
+    if not uncached:
+        return 0
+
+    seeded = 0
+    stored = await phrase_embedding_store.aget_many(uncached)
+    found = [(text, vector) for text, vector in zip(uncached, stored) if vector is not None]
+    if found:
+        # Same form as the backend returns for a query: full dimension, L2-normalized
+        vectors = truncate_embeddings([vector for _, vector in found], EMBED_STORE_DIMENSION)
+        for (text, _), vector in zip(found, vectors):
+            embedding_cache.set(text, vector)
+        seeded += len(found)
+
+    missing = [text for text, vector in zip(uncached, stored) if vector is None]
+    for i in range(0, len(missing), batch_size):
+        batch = missing[i:i + batch_size]
+        try:
+            embeddings = await embedding_backend.aembed_documents_array(batch)
+            await phrase_embedding_store.aput_many(batch, embeddings)
+        except Exception as e:
+            logger_chatflow.warning(f"预热向量缓存失败，跳过{len(batch)}条文本：{str(e)}")
+            continue
+        for text, embedding in zip(batch, embeddings):
+            embedding_cache.set(text, embedding)
+            seeded += 1
+    return seeded
+
+# TODO: Matryoshka truncation
+def truncate_embeddings(embeddings, dimension: int) -> np.ndarray:
+    """
+    Keep the first `dimension` components of Qwen3-Embedding vectors and L2-normalize them again (Matryoshka truncation).
+    Works on one vector or on a matrix of row vectors, vectors that are already short enough are only normalized.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)[..., :dimension]
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12)
+
+# Example usage
+if __name__ == "__main__":
+    emb = embed_query("你哪位")
+    print(f"{len(emb)}")  # Should be 1024
+    print(f"{emb}")
+
+    emb_doc = embed_documents(["这是谁", "这是你"])
+    print(f"{len(emb_doc)}") # Should be 2
+    print(f"{emb_doc}")
+
+    async def test_async():
+        emb_async = await aembed_query("你哪位")
+        print(f"{len(emb_async)}")  # Should be 1024
+        await embedding_backend.aclose()
+
+    asyncio.run(test_async())
+
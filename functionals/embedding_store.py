@@ -0,0 +1,161 @@
+import asyncio
+import hashlib
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+import numpy as np
+from data.paths import EMBED_MODEL_NAME, EMBED_STORE_DIR, EMBED_STORE_DIMENSION
+from functionals.log_utils import logger_chatflow
+
+try:
+    import fcntl # serializes writers of different processes, not available on Windows
+except ImportError:
+    fcntl = None
+
+_UNSAFE_FILE_CHARS = re.compile(r"[^\w.-]")
+
+#TODO: On-disk phrase embedding store
+class PhraseEmbeddingStore:
+    """
+    Append-only on-disk store of phrase embeddings, keyed by hash(embedding model, phrase).
+    - <model>.<dim>.f32: float32 vectors, one row per phrase, read through a memory map
+    - <model>.<dim>.idx: 16-byte keys, row i of the index belongs to row i of the vectors
+    Vectors are written before their keys, so a crash can only leave rows that are ignored and overwritten later.
+    The files survive restarts and are shared by every model and process of the deployment,
+    so a phrase is embedded only once no matter how many agents or rebuilds use it.
+    """
+    KEY_BYTES = 16
+
+    def __init__(self, store_dir: str = EMBED_STORE_DIR, model_name: str = EMBED_MODEL_NAME, dimension: int = EMBED_STORE_DIMENSION):
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.dimension = dimension
+        self.row_bytes = dimension * 4
+        file_stem = f"{_UNSAFE_FILE_CHARS.sub('_', model_name)}.{dimension}"
+        self.data_path = self.store_dir / f"{file_stem}.f32"
+        self.index_path = self.store_dir / f"{file_stem}.idx"
+        self.lock_path = self.store_dir / f"{file_stem}.lock"
+        self.data_path.touch(exist_ok=True)
+        self.index_path.touch(exist_ok=True)
+
+        self._rows: dict[bytes, int] = {}
+        self._count = 0
+        self._vectors: np.memmap | None = None
+        self._lock = threading.RLock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0
+        }
+        self._refresh()
+        logger_chatflow.info(f"短语向量存储：{self.data_path}，已有{self._count}条向量")
+
+    def _key(self, phrase: str) -> bytes:
+        return hashlib.sha256(f"{self.model_name}\x00{phrase}".encode()).digest()[:self.KEY_BYTES]
+
+    def _complete_rows(self) -> int:
+        """Rows whose vector and key are both fully written."""
+        return min(os.path.getsize(self.index_path) // self.KEY_BYTES, os.path.getsize(self.data_path) // self.row_bytes)
+
+    def _refresh(self):
+        """Pick up the rows appended since the last refresh, by this or another process."""
+        count = self._complete_rows()
+        if count <= self._count:
+            return
+        with open(self.index_path, "rb") as f:
+            f.seek(self._count * self.KEY_BYTES)
+            keys = f.read((count - self._count) * self.KEY_BYTES)
+        for i in range(count - self._count):
+            key = keys[i * self.KEY_BYTES:(i + 1) * self.KEY_BYTES]
+            self._rows.setdefault(key, self._count + i)
+        self._count = count
+        self._vectors = np.memmap(self.data_path, dtype=np.float32, mode="r", shape=(count, self.dimension))
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get_many(self, phrases: list[str]) -> list[list[float] | None]:
+        keys = [self._key(phrase) for phrase in phrases]
+        with self._lock:
+            if any(key not in self._rows for key in keys):
+                self._refresh()
+            result = []
+            for key in keys:
+                row = self._rows.get(key)
+                if row is None:
+                    self._stats["misses"] += 1
+                    result.append(None)
+                else:
+                    self._stats["hits"] += 1
+                    result.append(self._vectors[row].tolist())
+            return result
+
+    def get(self, phrase: str) -> list[float] | None:
+        return self.get_many([phrase])[0]
+
+    async def aget_many(self, phrases: list[str]) -> list[list[float] | None]:
+        """get_many in a worker thread, picking up new rows reads the files."""
+        return await asyncio.to_thread(self.get_many, phrases)
+
+    def put_many(self, phrases: list[str], embeddings: list) -> int:
+        """Append the phrases that are not stored yet, returns the number of rows written."""
+        new_rows = {}
+        for phrase, embedding in zip(phrases, embeddings):
+            vector = np.asarray(embedding, dtype=np.float32)
+            if vector.shape != (self.dimension,):
+                logger_chatflow.warning(f"短语向量维度应为{self.dimension}，目前为{vector.shape}，不写入存储：{phrase[:50]}")
+                continue
+            new_rows[self._key(phrase)] = vector
+        if not new_rows:
+            return 0
+
+        with self._lock, self._file_lock():
+            self._refresh()
+            new_rows = {key: vector for key, vector in new_rows.items() if key not in self._rows}
+            if not new_rows:
+                return 0
+            # Cut the rows left half-written by a crash, so that vectors and keys stay aligned
+            for path, size in ((self.data_path, self._count * self.row_bytes), (self.index_path, self._count * self.KEY_BYTES)):
+                if os.path.getsize(path) > size:
+                    os.truncate(path, size)
+            with open(self.data_path, "ab") as f:
+                f.write(np.stack(list(new_rows.values())).tobytes())
+            with open(self.index_path, "ab") as f:
+                f.write(b"".join(new_rows.keys()))
+            self._refresh()
+            self._stats["writes"] += len(new_rows)
+            return len(new_rows)
+
+    def put(self, phrase: str, embedding) -> int:
+        return self.put_many([phrase], [embedding])
+
+    async def aput_many(self, phrases: list[str], embeddings: list) -> int:
+        """put_many in a worker thread, so that the file lock and the writes never block the event loop."""
+        return await asyncio.to_thread(self.put_many, phrases, embeddings)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": self._count,
+                "model_name": self.model_name,
+                "dimension": self.dimension,
+                "path": str(self.data_path),
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0
+            }
+
+# Shared by both Milvus launchers of every loaded model in this process
+phrase_embedding_store = PhraseEmbeddingStore()
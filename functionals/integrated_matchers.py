@@ -1,14 +1,16 @@
 import asyncio
 
+from data.paths import SEMANTIC_UNION_TOP_K
 from functionals.log_utils import logger_chatflow
-from functionals.matchers import KeywordMatcher, SemanticMatcher
+from functionals.matchers import KeywordMatcher, KeywordMatcherView, SemanticMatcher, aggregate_hits
+from functionals.turn_analysis import TurnAnalysis
 
 # Combine the intention keyword matcher and the knowledge keyword matcher based on user's preference of intention_priority
 class IntegratedKeywordsMatcher:
     def __init__(self,
                  intention_priority:int,
-                 keyword_matcher:KeywordMatcher,
-                 knowledge_keyword_matcher:KeywordMatcher):
+                 keyword_matcher:KeywordMatcher | KeywordMatcherView,
+                 knowledge_keyword_matcher:KeywordMatcher | KeywordMatcherView):
         self.keyword_matcher = keyword_matcher
         self.knowledge_keyword_matcher = knowledge_keyword_matcher
         if intention_priority == 2:
@@ -22,38 +24,38 @@ class IntegratedKeywordsMatcher:
             logger_chatflow.error(e_m)
             raise ValueError(e_m)
 
-    def match(self, user_input:str):
+    def match(self, user_input: TurnAnalysis | str):
         """
             Infer user intention based on integrated keyword matching.
             Returns: (type_id, type_name, keywords, count, inference_type)
             """
-        return self._match_strategy(user_input)
+        return self._match_strategy(TurnAnalysis.of(user_input))
 
     # Define a function to match the user input with inference type output
-    def _try_match(self, matcher: KeywordMatcher, inference_label: str, user_input: str):
-        result = matcher.analyze_sentence(user_input)
+    def _try_match(self, matcher: KeywordMatcher | KeywordMatcherView, inference_label: str, analysis: TurnAnalysis):
+        result = analysis.keyword_hits(matcher)
         if result:
             type_id, type_name, keywords, count = matcher.get_primary_type(result)
             return type_id, type_name, keywords, count, inference_label
         return None
 
-    def _match_intention_first(self, user_input: str):
-        match = self._try_match(self.keyword_matcher, "意图库", user_input)
+    def _match_intention_first(self, analysis: TurnAnalysis):
+        match = self._try_match(self.keyword_matcher, "意图库", analysis)
         if match:
             return match
-        return (self._try_match(self.knowledge_keyword_matcher, "知识库", user_input)
+        return (self._try_match(self.knowledge_keyword_matcher, "知识库", analysis)
                 or ("", "", [], 0, "无"))
 
-    def _match_knowledge_first(self, user_input: str):
-        match = self._try_match(self.knowledge_keyword_matcher, "知识库", user_input)
+    def _match_knowledge_first(self, analysis: TurnAnalysis):
+        match = self._try_match(self.knowledge_keyword_matcher, "知识库", analysis)
         if match:
             return match
-        return (self._try_match(self.keyword_matcher, "意图库", user_input) or
+        return (self._try_match(self.keyword_matcher, "意图库", analysis) or
                 ("", "", [], 0, "无"))
 
-    def _match_integrated(self, user_input: str):
-        intention_result = self.keyword_matcher.analyze_sentence(user_input)
-        knowledge_result = self.knowledge_keyword_matcher.analyze_sentence(user_input)
+    def _match_integrated(self, analysis: TurnAnalysis):
+        intention_result = analysis.keyword_hits(self.keyword_matcher)
+        knowledge_result = analysis.keyword_hits(self.knowledge_keyword_matcher)
 
         if not intention_result and not knowledge_result:
             return "", "", [], 0, "无"
@@ -65,14 +67,40 @@ class IntegratedKeywordsMatcher:
         return type_id, type_name, keywords, count, inference_type
 
 class IntegratedSemanticMatcher:
+    """
+    The user input is embedded once and searched once, over the union of the intention and knowledge ids,
+    then the hits are split by source in process. All three priority strategies use the same two best hits.
+    Each source is aggregated over its first semantic_top_k hits only, as its own SemanticMatcher would.
+    A Milvus search can not limit the hits per source, so a source that got fewer than semantic_top_k
+    of the union's places may be incomplete: it is then searched on its own, a second round trip,
+    unless its result can not change the outcome (see _best_per_source).
+    """
     def __init__(self,
                  nlp_threshold:float,
                  intention_priority: int,
                  semantic_matcher:SemanticMatcher,
-                 knowledge_semantic_matcher:SemanticMatcher):
+                 knowledge_semantic_matcher:SemanticMatcher,
+                 top_k: int = SEMANTIC_UNION_TOP_K):
         self.nlp_threshold = nlp_threshold
         self.semantic_matcher = semantic_matcher
         self.knowledge_semantic_matcher = knowledge_semantic_matcher
+        # the union search must bring enough phrases of each source for the per-intention aggregation
+        self.top_k = max(top_k, 2 * semantic_matcher.top_k)
+
+        # Both sources live in the same collection (or in-process index), one matcher searches them together
+        self.intention_ids = set(semantic_matcher.intention_ids or [])
+        self.knowledge_ids = set(knowledge_semantic_matcher.intention_ids or []) if knowledge_semantic_matcher else set()
+        self.union_matcher = SemanticMatcher(
+            semantic_matcher.collection_name,
+            self.intention_ids | self.knowledge_ids,
+            semantic_matcher.milvus_client,
+            semantic_matcher.vector_index,
+            self.top_k,
+            semantic_matcher.aggregation,
+            semantic_matcher.threshold,
+            semantic_matcher.search_ef,
+            semantic_matcher.embedding_dim
+        )
 
         if intention_priority == 2:
             self._match_strategy = self._match_intention_first
@@ -85,77 +113,88 @@ class IntegratedSemanticMatcher:
             logger_chatflow.error(e_m)
             raise ValueError(e_m)
 
-    async def match(self, user_input: str):
+    async def match(self, user_input: TurnAnalysis | str):
         """
         Infer user intention using semantic similarity.
         Returns: (type_id, type_name, content, cos_score, inference_type)
         """
-        return await self._match_strategy(user_input)
-
-    async def _try_match(self, matcher: SemanticMatcher, label: str, user_input:str):
-        result = await matcher.find_most_similar(user_input)
-        if result:
-            tid, tname, cont, score = result
-            if score > self.nlp_threshold:
-                return tid, tname, cont, score, label
-        return None
-
-    async def _match_intention_first(self, user_input: str):
-        match = await self._try_match(self.semantic_matcher, "意图库", user_input)
-        if match:
-            return match
-        return (await self._try_match(self.knowledge_semantic_matcher, "知识库", user_input) or
-                ("", "", "", 0.0, "无"))
-
-    async def _match_knowledge_first(self, user_input: str):
-        match = await self._try_match(self.knowledge_semantic_matcher, "知识库", user_input)
-        if match:
-            return match
-        return (await self._try_match(self.semantic_matcher, "意图库", user_input) or
-                ("", "", "", 0.0, "无"))
-
-    async def _match_integrated(self, user_input: str):
         DEFAULT_RESULT = ("", "", "", 0.0)
-        # Run both matches concurrently
-        tasks = [
-            self.semantic_matcher.find_most_similar(user_input),
-            self.knowledge_semantic_matcher.find_most_similar(user_input)
-        ]
+        analysis = TurnAnalysis.of(user_input)
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=3.0
-            )
-            intention_result, knowledge_result = results
-
-            # Normalize exceptions to default result
-            if isinstance(intention_result, Exception):
-                logger_chatflow.error(f"意图库语义匹配异常: {intention_result}")
-                intention_result = DEFAULT_RESULT
-            if isinstance(knowledge_result, Exception):
-                logger_chatflow.error(f"知识库语义匹配异常: {knowledge_result}")
-                knowledge_result = DEFAULT_RESULT
-
+            with analysis.timed("semantic_ms"):
+                intention_result, knowledge_result = await asyncio.wait_for(self._best_per_source(analysis), timeout=3.0)
         except asyncio.TimeoutError:
             logger_chatflow.warning("语义匹配超时（3秒）")
             intention_result = knowledge_result = DEFAULT_RESULT
+        except Exception as e:
+            logger_chatflow.error(f"'{analysis.text}'语义匹配异常: {str(e)}", exc_info=True)
+            intention_result = knowledge_result = DEFAULT_RESULT
+        return self._match_strategy(intention_result, knowledge_result)
+
+    async def _best_per_source(self, analysis: TurnAnalysis) -> tuple[tuple, tuple]:
+        """Best (type_id, type_name, content, cos_score) of the intentions and of the knowledge, with the turn's embedding."""
+        DEFAULT_RESULT = ("", "", "", 0.0)
+        query_emb = await analysis.embedding()
+
+        def best(hits: list) -> tuple | None:
+            ranked = aggregate_hits(hits, self.union_matcher.aggregation, self.union_matcher.threshold)
+            return ranked[0] if ranked else None
+
+        # In process, both sources come exactly from one matrix-vector product
+        vector_index = self.union_matcher.vector_index
+        if vector_index is not None:
+            knowledge_mask = self.knowledge_semantic_matcher.mask if self.knowledge_semantic_matcher else None
+            intention_hits, knowledge_hits = vector_index.search_many(
+                query_emb,
+                [self.semantic_matcher.mask, knowledge_mask if knowledge_mask is not None else vector_index.build_mask([])],
+                self.semantic_matcher.top_k
+            )
+            return best(intention_hits) or DEFAULT_RESULT, best(knowledge_hits) or DEFAULT_RESULT
+
+        hits = await self.union_matcher.search(query_emb, self.top_k)
+        k = self.semantic_matcher.top_k
+        union_full = len(hits) == self.top_k
+        # The phrases a source did not get in the union score at most as the last hit
+        could_pass = union_full and hits[-1][3] > self.nlp_threshold
+
+        async def source_result(matcher: SemanticMatcher | None, ids: set) -> tuple | None:
+            source_hits = [hit for hit in hits if hit[0] in ids][:k]
+            # The union holds the source's own top k when it got k places or when nothing was left out;
+            # with "max", its first hit is its best whatever the count
+            if not union_full or len(source_hits) == k or (self.union_matcher.aggregation == "max" and source_hits):
+                return best(source_hits)
+            # Otherwise its missing phrases can still pass the threshold (could_pass) or would lower the mean
+            # of its partial hits: search it on its own, which is rare
+            if matcher is not None and (could_pass or (self.union_matcher.aggregation == "mean" and source_hits)):
+                return await matcher.find_most_similar(analysis.text, query_emb)
+            return best(source_hits)
+
+        intention_result = await source_result(self.semantic_matcher, self.intention_ids)
+        knowledge_result = await source_result(self.knowledge_semantic_matcher, self.knowledge_ids)
+        return intention_result or DEFAULT_RESULT, knowledge_result or DEFAULT_RESULT
+
+    def _valid(self, result: tuple, label: str):
+        tid, tname, cont, score = result
+        if tid and score > self.nlp_threshold:
+            return tid, tname, cont, score, label
+        return None
+
+    def _match_intention_first(self, intention_result: tuple, knowledge_result: tuple):
+        return (self._valid(intention_result, "意图库") or self._valid(knowledge_result, "知识库") or
+                ("", "", "", 0.0, "无"))
 
-        score_i = intention_result[3] if intention_result else -1.0
-        score_k = knowledge_result[3] if knowledge_result else -1.0
+    def _match_knowledge_first(self, intention_result: tuple, knowledge_result: tuple):
+        return (self._valid(knowledge_result, "知识库") or self._valid(intention_result, "意图库") or
+                ("", "", "", 0.0, "无"))
 
-        # Only consider results above threshold
-        valid_i = intention_result and score_i > self.nlp_threshold
-        valid_k = knowledge_result and score_k > self.nlp_threshold
+    def _match_integrated(self, intention_result: tuple, knowledge_result: tuple):
+        valid_i = self._valid(intention_result, "意图库")
+        valid_k = self._valid(knowledge_result, "知识库")
 
         if not valid_i and not valid_k:
             return "", "", "", 0.0, "无"
 
         # Prefer higher score; in case of tie, intention wins (or adjust as needed)
-        if valid_i and (not valid_k or score_i >= score_k):
-            tid, tname, cont, score = intention_result
-            return tid, tname, cont, score, "意图库"
-        elif valid_k:
-            tid, tname, cont, score = knowledge_result
-            return tid, tname, cont, score, "知识库"
-        else:
-            return "", "", "", 0.0, "无"
\ No newline at end of file
+        if valid_i and (not valid_k or valid_i[3] >= valid_k[3]):
+            return valid_i
+        return valid_k
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+from data.paths import LLM_DECISION_CACHE_MAX_SIZE, LLM_DECISION_CACHE_TTL, LLM_DECISION_CACHE_REDIS
+from functionals.log_utils import logger_chatflow
+
+#TODO: Process-wide cache of the LLM intention decisions
+class LLMDecisionCache:
+    """
+    LRU cache with TTL of the decisions of LLMInferenceMatcher, keyed by a hash of the node's prompt,
+    the normalized user input and the recent chat history (see LLMInferenceMatcher._decision_key).
+    - Optionally backed by Redis, so that the workers of all the services share their decisions.
+    - Single flight: identical turns arriving while the first one is still waiting for the LLM
+      wait for its decision instead of sending their own request.
+    Decisions are JSON-serializable dicts.
+    """
+    REDIS_KEY_PREFIX = "llm_decision:"
+
+    def __init__(self, max_size: int = LLM_DECISION_CACHE_MAX_SIZE, ttl: float = LLM_DECISION_CACHE_TTL,
+                 use_redis: bool = LLM_DECISION_CACHE_REDIS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._redis = None
+        self._stats = {
+            "hits": 0,
+            "redis_hits": 0,
+            "coalesced": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "redis_errors": 0
+        }
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expire_at, decision = item
+            if expire_at < time.monotonic():
+                del self._data[key]
+                self._stats["expirations"] += 1
+                return None
+            self._data.move_to_end(key) # mark as most recently used
+            return decision
+
+    def set(self, key: str, decision: dict, ttl: float | None = None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), decision)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False) # drop the least recently used
+                self._stats["evictions"] += 1
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _redis_client(self):
+        if self._redis is None:
+            import redis.asyncio as redis_async
+            from config.setting import settings
+            self._redis = redis_async.Redis(
+                host=settings.REDIS_SERVER,
+                password=settings.REDIS_PASSWORD,
+                port=int(settings.REDIS_PORT),
+                db=settings.REDIS_DB,
+                decode_responses=True,
+                max_connections=20
+            )
+        return self._redis
+
+    async def _redis_get(self, key: str) -> tuple[dict | None, float]:
+        """The decision stored in Redis and its remaining TTL, a Redis failure only costs the lookup."""
+        try:
+            client = self._redis_client()
+            async with client.pipeline(transaction=False) as pipe:
+                value, ttl = await pipe.get(self.REDIS_KEY_PREFIX + key).ttl(self.REDIS_KEY_PREFIX + key).execute()
+            if value is None:
+                return None, 0.0
+            return json.loads(value), float(ttl) if ttl and ttl > 0 else self.ttl
+        except Exception as e:
+            self._count("redis_errors")
+            logger_chatflow.warning(f"大模型意图缓存读取Redis失败：{e}")
+            return None, 0.0
+
+    async def _redis_set(self, key: str, decision: dict):
+        try:
+            await self._redis_client().set(self.REDIS_KEY_PREFIX + key, json.dumps(decision, ensure_ascii=False), ex=int(self.ttl))
+        except Exception as e:
+            self._count("redis_errors")
+            logger_chatflow.warning(f"大模型意图缓存写入Redis失败：{e}")
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[tuple[dict, bool]]]) -> tuple[dict, str]:
+        """
+        The decision of key, and where it comes from: "local", "redis", "coalesced" or "computed".
+        compute returns (decision, cacheable), only cacheable decisions are stored, e.g. not the fallback of a failed call.
+        """
+        decision = self.get(key)
+        if decision is not None:
+            self._count("hits")
+            return decision, "local"
+
+        future = self._inflight.get(key)
+        if future is not None:
+            # The same turn is already being decided, its decision is ours too
+            decision = await asyncio.shield(future)
+            if decision is not None:
+                self._count("coalesced")
+                return decision, "coalesced"
+            # It could not be decided, ask on our own below
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        shared = None # what the coalesced turns get, None lets them ask on their own
+        try:
+            if self.use_redis:
+                decision, ttl = await self._redis_get(key)
+                if decision is not None:
+                    self._count("redis_hits")
+                    self.set(key, decision, ttl)
+                    shared = decision
+                    return decision, "redis"
+            self._count("misses")
+            decision, cacheable = await compute()
+            if cacheable:
+                self.set(key, decision)
+                shared = decision
+                future.set_result(shared) # the coalesced turns don't wait for the Redis write
+                if self.use_redis:
+                    await self._redis_set(key, decision)
+            return decision, "computed"
+        finally:
+            if not future.done():
+                future.set_result(shared)
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["redis_hits"] + self._stats["coalesced"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "redis": self.use_redis,
+                "in_flight": len(self._inflight),
+                "hit_rate": round((lookups - self._stats["misses"]) / lookups, 4) if lookups else 0.0
+            }
+
+# Shared by every LLMInferenceMatcher of every loaded model in this process
+llm_decision_cache = LLMDecisionCache()
@@ -1,368 +1,701 @@
-from typing import Any
-import re
-from functionals.log_utils import logger_chatflow
-from config.config_setup import NodeConfig
-
-# Keyword approach
-import ahocorasick
-
-# Semantic approach
-from pymilvus import MilvusClient, AsyncMilvusClient
-from functionals.embedding_functions import embed_query
-
-# LLM approach
-from models.llm_models import qwen_llm, deepseek_llm, glm_llm, local_llm
-from data.string_asset import docstring_base_raw, priority_map, docstring_tail
-from langchain_core.messages import HumanMessage
-import ast
-
-"""
-3 type of matchers:
-KeywordMatcher, based on keyword detection to have user's intention
-SemanticMatcher, based on vector semantic matching to have user's intention
-LLMInferenceMatcher, based on LLM's inference to have user's intention
-
-KeywordMatcher.get_primary_type(), SemanticMatcher.find_most_similar(), LLMInferenceMatcher.llm_infer()
-will all return 5 values:
-- user's intention id
-- user's intention type
-- inference type: 意图库, 知识库, 无
-- extra info 1
-- extra info 2 (Optional)
-
-"""
-
-# TODO: Create a keyword matching class, supporting regular expression
-# Below method is using ahocorasick, which provide perfect isolation and faster speed.
-class KeywordMatcher:
-    def __init__(self, intentions: list):
-        self.intentions = intentions
-        self.keyword_to_id_and_type = {}
-        self.all_keywords = set()
-        self.regex_patterns = []  # List of tuples: (compiled_regex, original_pattern, intention_id, intention_name)
-        self.automaton = None
-        if intentions:
-            self.load_keywords_from_dict(intentions)
-
-    def _is_probably_regex(self, pattern: str) -> bool:
-        """
-        Heuristic to detect if a string is intended as a regex.
-        You can adjust this logic if needed (e.g., require explicit flag).
-        """
-        regex_meta = {'^', '$', '|', '(', ')', '*', '+', '?', '[', '{', '\\'}
-        return any(char in regex_meta for char in pattern)
-
-    def load_keywords_from_dict(self, intentions: list):
-        self.keyword_to_id_and_type.clear()
-        self.all_keywords.clear()
-        self.regex_patterns.clear()
-
-        for intention in intentions:
-            self.add_keyword_list(
-                intention["intention_id"],
-                intention["intention_name"],
-                intention["keywords"]
-            )
-        self._build_automaton()
-
-    def add_keyword_list(self, intention_id: str, intention_name: str, keywords: list[str] | None):
-        if not keywords:
-            return
-        for keyword in keywords:
-            keyword = keyword.strip()
-            if not keyword:
-                continue
-            if self._is_probably_regex(keyword):
-                # Store compiled regex + metadata
-                try:
-                    compiled = re.compile(keyword)
-                    self.regex_patterns.append((compiled, keyword, intention_id, intention_name))
-                except re.error:
-                    # Optionally log or skip invalid regex
-                    continue
-            else:
-                if keyword not in self.all_keywords:
-                    self.keyword_to_id_and_type[keyword] = (intention_id, intention_name)
-                    self.all_keywords.add(keyword)
-
-    def _build_automaton(self):
-        if not self.all_keywords:
-            self.automaton = None
-            return
-        A = ahocorasick.Automaton()
-        for keyword in self.all_keywords:
-            A.add_word(keyword, keyword)
-        A.make_automaton()
-        self.automaton = A
-
-    def analyze_sentence(self, sentence: str) -> dict[str, dict[str, Any]]:
-        result = {}
-
-        # 1. Match literal keywords using Aho-Corasick
-        if self.automaton:
-            for end_index, keyword in self.automaton.iter(sentence):
-                intention_id, keyword_type = self.keyword_to_id_and_type[keyword]
-                if intention_id not in result:
-                    result[intention_id] = {
-                        "keyword_type": keyword_type,
-                        "count": 0,
-                        "keywords": []
-                    }
-                result[intention_id]["count"] += 1
-                result[intention_id]["keywords"].append(keyword)
-
-        # 2. Match regex patterns
-        for compiled_regex, original_pattern, intention_id, keyword_type in self.regex_patterns:
-            # Use finditer to find all non-overlapping matches
-            matches = list(compiled_regex.finditer(sentence))
-            if matches:
-                if intention_id not in result:
-                    result[intention_id] = {
-                        "keyword_type": keyword_type,
-                        "count": 0,
-                        "keywords": []
-                    }
-                count = len(matches)
-                result[intention_id]["count"] += count
-                # Append the original regex pattern once per match (as requested)
-                result[intention_id]["keywords"].extend([original_pattern] * count)
-        return result
-
-    @staticmethod
-    def get_primary_type(result: dict[str | None, dict[str, Any] | None]) -> tuple[str, str, list[str], int]:
-        if not result:
-            e_m = "输入的关键词查询结果为空"
-            logger_chatflow.error(e_m)
-            return "others", "", [], 0
-
-        primary_id = max(result.keys(), key=lambda k: result[k]['count'])
-        info = result[primary_id]
-        return primary_id, info["keyword_type"], info["keywords"], info["count"]
-
-# TODO: Create a semantic matching class
-class SemanticMatcher:
-    def __init__(self,
-                 collection_name: str,
-                 intention_ids: set|list,
-                 milvus_client: MilvusClient | AsyncMilvusClient | None = None):
-        self.collection_name = collection_name
-        self.milvus_client = milvus_client
-        self.intention_ids = intention_ids
-
-    async def find_most_similar(self, sentence: str) -> tuple[str, str, str, float]:
-        """
-        Find the most similar intention to the given sentence.
-
-        Returns:
-            tuple: (intention_id, intention_name, phrase, similarity_score)
-            Always returns a valid tuple even when no match is found
-        """
-        DEFAULT_RESULT = ("", "", "", 0.0)
-        if not self.intention_ids:
-            return DEFAULT_RESULT
-
-        try:
-            # Generate query embedding
-            query_emb = embed_query(sentence)
-            if hasattr(query_emb, 'tolist'):
-                query_emb = query_emb.tolist()
-
-            # Build filter expression: intention_id in ["K003", "I008", ...], Milvus uses string expressions
-            id_list_str = ",".join(f'"{id_}"' for id_ in self.intention_ids)
-            filter_expr = f"intention_id in [{id_list_str}]"
-
-            # Perform search
-            results = await self.milvus_client.search(
-                collection_name=self.collection_name,
-                data=[query_emb],
-                filter=filter_expr,
-                limit=1,
-                output_fields=["intention_id", "intention_name", "phrase"],
-                timeout = 3.0
-            )
-
-            # Check if we have results
-            if not results or not results[0]:
-                return DEFAULT_RESULT
-
-            # Extract result safely
-            hit = results[0][0] # hit is a Milvus hit object, similar to dict
-            entity = hit.get("entity", {})
-
-            return (entity.get("intention_id", ""), entity.get("intention_name", ""),
-                entity.get("phrase", ""), hit.get("distance", 0.0))
-
-        except Exception as e:
-            logger_chatflow.error(f"'{sentence}'查询失败: {str(e)}", exc_info=True)
-            # Final fallback
-            return DEFAULT_RESULT
-
-# TODO: Create a LLM inference matching class
-class LLMInferenceMatcher:
-    def __init__(self,
-                 config: NodeConfig,
-                 intentions: list,
-                 knowledge_infer_name: dict,
-                 knowledge_infer_description: dict,
-                 intention_priority: int):
-        self.config = config
-        self.intention_infer_name = {} # dict: intention_id -> intention_name
-        self.intention_infer_descriptions = {} # dict: intention_id -> intention_name - intention_description
-        if intentions:
-            for intention in intentions:
-                self.intention_infer_name[intention["intention_id"]] = intention["intention_name"]
-                intention_description = " ".join(intention["llm_description"]) if intention["llm_description"] else "无意图说明"
-                self.intention_infer_descriptions[intention["intention_id"]] = str(intention["intention_name"]) + " - " + intention_description
-
-        # remove the knowledge item that user specifically ask not to include via "nomatch_knowledge_ids"
-        nomatch_knowledge_ids = self.config.other_config.get("nomatch_knowledge_ids", [])
-        if not isinstance(nomatch_knowledge_ids, list):
-            e_m = f"{config.node_id}-{config.node_name}节点nomatch_knowledge_ids应为列表"
-            logger_chatflow.error(e_m)
-            raise TypeError(e_m)
-        self.knowledge_infer_name = {k:v for k, v in knowledge_infer_name.items() if k not in nomatch_knowledge_ids} # dict to store knowledge intention_id: intention_name
-        self.knowledge_infer_description = {k:v for k, v in knowledge_infer_description.items() if k in self.knowledge_infer_name} # dict to store knowledge intention_id : intention_name - intention_description
-
-        # background prompt
-        self.llm_role_description: str = getattr(config.agent_config, "llm_role_description", "")
-        self.llm_background_info: str = getattr(config.agent_config, "llm_background_info", "")
-
-        # prompts
-        self.base_docstring: list = self._create_base_docstring(intention_priority) or []
-
-        # select llm runnable
-        self.llm_runnable = self._select_llm(config.agent_config.llm_name)
-
-    def _select_llm(self, llm_name: str):
-        if llm_name == "qwen_llm":
-            return qwen_llm
-        elif llm_name == "local_llm":
-            return local_llm
-        elif llm_name == "deepseek_llm":
-            return deepseek_llm
-        elif llm_name == "glm_llm":
-            return glm_llm
-        return deepseek_llm
-
-    def _create_base_docstring(self, intention_priority: int) -> list:
-        """
-        Prepare the base docstring from the LLM
-        """
-        #Add intention priority
-        docstring_base = (
-                [
-                    "## === 你的角色描述和背景信息（仅供参考） ===",
-                    self.llm_role_description,
-                    self.llm_background_info,
-                    ""
-                ] +
-                docstring_base_raw +
-                [priority_map[intention_priority]] + priority_map[4:]
-        )
-
-        # Include the intention descriptions
-        docstring_base.append("**【意图库列表】**（- 意图id : 意图名称 - 意图说明）")
-        if self.intention_infer_descriptions:
-            for k, v in self.intention_infer_descriptions.items():
-                docstring_base.append(f"  - {k} : {v}")
-        else:
-            docstring_base.append("")
-
-        docstring_base.append("")
-        docstring_base.append("**【知识库列表】**（- 意图id : 意图名称 - 意图说明）")
-        if self.knowledge_infer_description: # if knowledge exists
-            for k, v in self.knowledge_infer_description.items():
-                docstring_base.append(f"  - {k} : {v}")
-        else: # if knowledge doesn't exist, append an empty string as a blank row later
-            docstring_base.append("")
-        docstring_base.append("")
-
-        return docstring_base
-
-    def _parse_llm_json_output(self, text: str) -> tuple[str, str]:
-        """
-        Parse LLM output robustly. Always returns (input_summary, intention_id).
-        """
-        text = text.strip()
-
-        if text.startswith("```"):
-            text = re.split(r"```(?:json)?", text, maxsplit=1)[-1]
-            text = text.rsplit("```", 1)[0] if "```" in text else text
-        text = text.strip()
-
-        # Try to parse
-        try:
-            data = ast.literal_eval(text)
-            if isinstance(data, dict):
-                summary = str(data.get("input_summary", "无"))[:10]
-                id_ = str(data.get("intention_id", "others"))
-            else:
-                summary, id_ = "无", "others"
-        except Exception as e:
-            logger_chatflow.error("大模型输出解析异常：%s", {e})
-            # Fallback: extract using regex
-            summary_match = re.search(r'[\'"`]input_summary[\'"`]\s*:\s*[\'"`](.*?)[\'"`]', text)
-            summary = summary_match.group(1)[:10] if summary_match else "无"
-
-            id_match = re.search(r'[\'"`]intention_id[\'"`]\s*:\s*[\'"`](.*?)[\'"`]', text)
-            id_ = id_match.group(1) if id_match else "others"
-
-        return summary, id_
-
-    async def llm_infer(self, chat_history: list, user_input: str) -> tuple[str, str, str, str, int]:
-        """
-        Infer the user intention from the user input.
-        """
-        if not self.llm_runnable:
-            e_m = "LLM推理工具未初始化"
-            logger_chatflow.error(e_m)
-
-        # Initialize default values
-        intention_id, user_intention, input_summary, inference_type, token_used = (
-            "others", "其他", "无", "无", 0
-        )
-        try:
-            # Create prompt of chat history
-            docstring_chat_history = []
-            for msg in chat_history:
-                if msg.__class__.__name__ == "HumanMessage":
-                    docstring_chat_history.append(f"- 【用户】{msg.content}")
-                elif msg.__class__.__name__ == "AIMessage":
-                    ai_message = msg.content
-                    if ai_message:
-                        docstring_chat_history.append(f"- 【智能客服】{ai_message}")
-            docstring_chat_history.append("")
-
-            # Create full prompt
-            full_docstring = (self.base_docstring +
-                              [
-                                  "### **最后一次用户输入**",
-                                  user_input,
-                                  "",
-                                  "### 智能助手和用户的全部对话历史（务必参考）"
-                              ] +
-                              docstring_chat_history +
-                              docstring_tail)
-            full_prompt = "\n".join(full_docstring)
-            print(f"{self.config.node_id}-{self.config.node_name}节点的大模型提示词 \n{full_prompt}")
-            print()
-            # Invoke the llm
-            resp = await self.llm_runnable.ainvoke([HumanMessage(content=full_prompt)])
-
-            # Get the tokens consumed per round of conversation including the preconfigured doc string, full chat history, AI reply, etc.
-            token_used = int(resp.response_metadata.get("token_usage", {}).get("total_tokens", 0))
-            print(f"大模型回复内容： {resp.content}")
-            input_summary, intention_id = self._parse_llm_json_output(resp.content)
-        except Exception as e:
-            logger_chatflow.error("LLM推理调用异常：%s", {e})
-
-        if intention_id in self.intention_infer_name:
-            user_intention = self.intention_infer_name[intention_id]
-            inference_type = "意图库"
-        elif intention_id in self.knowledge_infer_name:
-            user_intention = self.knowledge_infer_name[intention_id]
-            inference_type = "知识库"
-
-        print(f"大模型回复处理后内容：intention_id: {intention_id}, user_intention: {user_intention}, "
-              f"input_summary: {input_summary}, inference_type: {inference_type}")
-        return intention_id, user_intention, input_summary, inference_type, token_used
\ No newline at end of file
+from typing import Any
+from collections import OrderedDict
+import hashlib
+import importlib.metadata
+import json
+import re
+import threading
+import time
+from functionals.log_utils import logger_chatflow
+from config.config_setup import NodeConfig
+from data.paths import KEYWORD_REGEX_TIMEOUT, KEYWORD_MATCHER_CACHE_SIZE, LLM_DECISION_CACHE_ENABLED
+
+# Keyword approach
+import ahocorasick
+import regex
+
+# Semantic approach
+from pymilvus import MilvusClient, AsyncMilvusClient
+from functionals.embedding_functions import aembed_query, truncate_embeddings
+from functionals.milvus import intention_filter_planner, milvus_search_batcher
+from functionals.vector_index import InProcessVectorIndex
+
+# LLM approach
+from models.llm_models import qwen_llm, deepseek_llm, glm_llm, local_llm
+from data.string_asset import docstring_base_raw, priority_map, docstring_tail, docstring_final_instruction
+from langchain_core.messages import HumanMessage, SystemMessage
+from functionals.llm_cache import llm_decision_cache
+from functionals.turn_analysis import TurnAnalysis, normalize_turn_text
+import ast
+import numpy as np
+
+"""
+3 type of matchers:
+KeywordMatcher, based on keyword detection to have user's intention
+SemanticMatcher, based on vector semantic matching to have user's intention
+LLMInferenceMatcher, based on LLM's inference to have user's intention
+
+KeywordMatcher.get_primary_type(), SemanticMatcher.find_most_similar(), LLMInferenceMatcher.llm_infer()
+will all return 5 values:
+- user's intention id
+- user's intention type
+- inference type: 意图库, 知识库, 无
+- extra info 1
+- extra info 2 (Optional)
+
+"""
+
+# Regex keywords that can't be alternated with others: numbered or named backreferences, and global inline flags
+_UNCOMBINABLE_REGEX = re.compile(r"\\\d|\(\?P=|\(\?[aiLmsux]+\)")
+
+# TODO: Create a keyword matching class, supporting regular expression
+# Below method is using ahocorasick, which provide perfect isolation and faster speed.
+class KeywordMatcher:
+    SNAPSHOT_VERSION = 1  # bump when the attributes of a pickled matcher change, older snapshots are then rebuilt
+
+    def __init__(self, intentions: list):
+        self.intentions = intentions
+        self.keyword_to_id_and_type = {}
+        self.keyword_to_owners = {}  # keyword -> [(intention_id, intention_name)], every intention that lists it, in order
+        self.all_keywords = set()
+        self.regex_patterns = []  # List of tuples: (compiled_regex, original_pattern, intention_id, intention_name, combined)
+        self.regex_prefilter = None  # alternation of the combined patterns, a sentence it misses matches none of them
+        self.automaton = None
+        if intentions:
+            self.load_keywords_from_dict(intentions)
+
+    @classmethod
+    def snapshot_key(cls, intentions: list) -> str:
+        """
+        Hash of what a matcher is compiled from (ids, names and keywords, in order), with the snapshot version
+        and the pyahocorasick version, so that a pickled matcher is only reused where it would be rebuilt the same.
+        """
+        try:
+            ahocorasick_version = importlib.metadata.version("pyahocorasick")
+        except importlib.metadata.PackageNotFoundError:
+            ahocorasick_version = ""
+        content = [[item.get("intention_id"), item.get("intention_name"), item.get("keywords")] for item in intentions]
+        payload = json.dumps([cls.SNAPSHOT_VERSION, ahocorasick_version, content], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def __getstate__(self):
+        # The source intentions are not needed to match, a snapshot only keeps the compiled tables
+        state = self.__dict__.copy()
+        state["intentions"] = []
+        return state
+
+    @staticmethod
+    def _is_probably_regex(pattern: str) -> bool:
+        """
+        Heuristic to detect if a string is intended as a regex.
+        You can adjust this logic if needed (e.g., require explicit flag).
+        """
+        regex_meta = {'^', '$', '|', '(', ')', '*', '+', '?', '[', '{', '\\'}
+        return any(char in regex_meta for char in pattern)
+
+    def load_keywords_from_dict(self, intentions: list):
+        self.keyword_to_id_and_type.clear()
+        self.keyword_to_owners.clear()
+        self.all_keywords.clear()
+        self.regex_patterns.clear()
+
+        for intention in intentions:
+            self.add_keyword_list(
+                intention["intention_id"],
+                intention["intention_name"],
+                intention.get("keywords")
+            )
+        self._build_automaton()
+
+    def add_keyword_list(self, intention_id: str, intention_name: str, keywords: list[str] | None):
+        if not keywords:
+            return
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if not keyword:
+                continue
+            if self._is_probably_regex(keyword):
+                # Store compiled regex + metadata
+                try:
+                    compiled = regex.compile(keyword)
+                    combined = _UNCOMBINABLE_REGEX.search(keyword) is None
+                    self.regex_patterns.append((compiled, keyword, intention_id, intention_name, combined))
+                except regex.error:
+                    # Optionally log or skip invalid regex
+                    continue
+            else:
+                if keyword not in self.all_keywords:
+                    self.keyword_to_id_and_type[keyword] = (intention_id, intention_name)
+                    self.all_keywords.add(keyword)
+                owners = self.keyword_to_owners.setdefault(keyword, [])
+                if all(owner_id != intention_id for owner_id, _ in owners):
+                    owners.append((intention_id, intention_name))
+
+    def _build_regex_prefilter(self):
+        """
+        One alternation of the regex keywords, searched once per sentence before any pattern runs on its own.
+        Most sentences match no regex keyword, they then cost a single scan whatever the number of patterns.
+        """
+        combined = list(dict.fromkeys(pattern for _, pattern, _, _, is_combined in self.regex_patterns if is_combined))
+        self.regex_prefilter = None
+        if combined:
+            try:
+                self.regex_prefilter = regex.compile("|".join(f"(?:{pattern})" for pattern in combined))
+            except regex.error:
+                logger_chatflow.warning(f"正则关键词无法合并，逐条匹配：{combined}")
+
+    def _build_automaton(self):
+        self._build_regex_prefilter()
+        if not self.all_keywords:
+            self.automaton = None
+            return
+        A = ahocorasick.Automaton()
+        for keyword in self.all_keywords:
+            A.add_word(keyword, keyword)
+        A.make_automaton()
+        self.automaton = A
+
+    def view(self, intention_ids: list) -> "KeywordMatcherView":
+        """A matcher restricted to the given intentions that reuses this automaton, see KeywordMatcherView."""
+        return KeywordMatcherView(self, intention_ids)
+
+    def analyze_sentence(self, sentence: str) -> dict[str, dict[str, Any]]:
+        return self._analyze(sentence, None, self.regex_patterns)
+
+    def _analyze(self, sentence: str, order: dict[str, int] | None, regex_patterns: list) -> dict[str, dict[str, Any]]:
+        """
+        Keyword hits of the sentence. With order (intention_id -> position), only the hits of those intentions count,
+        and a keyword listed by several of them goes to the first one, as if the matcher was built from them alone.
+        """
+        result = {}
+
+        # 1. Match literal keywords using Aho-Corasick
+        if self.automaton:
+            for end_index, keyword in self.automaton.iter(sentence):
+                if order is None:
+                    intention_id, keyword_type = self.keyword_to_id_and_type[keyword]
+                else:
+                    owner = min((owner for owner in self.keyword_to_owners[keyword] if owner[0] in order),
+                                key=lambda owner: order[owner[0]], default=None)
+                    if owner is None:
+                        continue
+                    intention_id, keyword_type = owner
+                if intention_id not in result:
+                    result[intention_id] = {
+                        "keyword_type": keyword_type,
+                        "count": 0,
+                        "keywords": []
+                    }
+                result[intention_id]["count"] += 1
+                result[intention_id]["keywords"].append(keyword)
+
+        # 2. Match regex patterns
+        if not regex_patterns:
+            return result
+        # All the patterns of a sentence share one time budget, a pattern that backtracks too long is skipped
+        deadline = time.perf_counter() + KEYWORD_REGEX_TIMEOUT
+        prefilter_hit = True
+        if self.regex_prefilter is not None:
+            try:
+                # The prefilter spends from the same budget, it can not give the patterns more time than is left
+                prefilter_hit = self.regex_prefilter.search(sentence, timeout=max(deadline - time.perf_counter(), 0.0)) is not None
+            except TimeoutError:
+                logger_chatflow.warning(f"正则关键词合并匹配超过{KEYWORD_REGEX_TIMEOUT}秒，跳过正则关键词：{sentence}")
+                return result
+        for compiled_regex, original_pattern, intention_id, keyword_type, combined in regex_patterns:
+            if combined and not prefilter_hit:
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                logger_chatflow.warning(f"正则关键词匹配超过{KEYWORD_REGEX_TIMEOUT}秒，跳过剩余的正则关键词：{sentence}")
+                break
+            # Use finditer to find all non-overlapping matches
+            try:
+                matches = list(compiled_regex.finditer(sentence, timeout=remaining))
+            except TimeoutError:
+                logger_chatflow.warning(f"正则关键词匹配超时，跳过{original_pattern}：{sentence}")
+                continue
+            if matches:
+                if intention_id not in result:
+                    result[intention_id] = {
+                        "keyword_type": keyword_type,
+                        "count": 0,
+                        "keywords": []
+                    }
+                count = len(matches)
+                result[intention_id]["count"] += count
+                # Append the original regex pattern once per match (as requested)
+                result[intention_id]["keywords"].extend([original_pattern] * count)
+        return result
+
+    @staticmethod
+    def get_primary_type(result: dict[str | None, dict[str, Any] | None]) -> tuple[str, str, list[str], int]:
+        if not result:
+            e_m = "输入的关键词查询结果为空"
+            logger_chatflow.error(e_m)
+            return "others", "", [], 0
+
+        primary_id = max(result.keys(), key=lambda k: result[k]['count'])
+        info = result[primary_id]
+        return primary_id, info["keyword_type"], info["keywords"], info["count"]
+
+class KeywordMatcherView:
+    """
+    The keyword matcher of one node, as a view over the KeywordMatcher of the whole agent.
+    The agent compiles one Aho-Corasick automaton for all its intentions and knowledge, every node keeps only
+    the ids it may match, in its own order, and the regex patterns of those ids.
+    analyze_sentence gives the same result as a KeywordMatcher built from the node's intentions in that order.
+    """
+    def __init__(self, matcher: KeywordMatcher, intention_ids: list):
+        self.matcher = matcher
+        self.order = {}
+        for intention_id in intention_ids:
+            self.order.setdefault(intention_id, len(self.order))
+        self.regex_patterns = sorted((pattern for pattern in matcher.regex_patterns if pattern[2] in self.order),
+                                     key=lambda pattern: self.order[pattern[2]]) # stable, patterns keep their order within an intention
+
+    def analyze_sentence(self, sentence: str) -> dict[str, dict[str, Any]]:
+        if not self.order:
+            return {}
+        return self.matcher._analyze(sentence, self.order, self.regex_patterns)
+
+    get_primary_type = staticmethod(KeywordMatcher.get_primary_type)
+
+class KeywordMatcherCache:
+    """
+    LRU cache of compiled KeywordMatchers, keyed by a hash of the intention and its keyword list, for callers that send
+    the same keyword lists again and again (the /keyword_match endpoint).
+    """
+    def __init__(self, max_size: int = KEYWORD_MATCHER_CACHE_SIZE):
+        self.max_size = max_size
+        self._data: OrderedDict[str, KeywordMatcher] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def _key(keywords: list, intention_id: str, intention_name: str) -> str:
+        return hashlib.sha1(json.dumps([intention_id, intention_name, keywords], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def get(self, keywords: list, intention_id: str, intention_name: str) -> KeywordMatcher:
+        """The matcher of one intention holding the keywords, compiled on the first request of this list."""
+        key = self._key(keywords, intention_id, intention_name)
+        with self._lock:
+            matcher = self._data.get(key)
+            if matcher is not None:
+                self._data.move_to_end(key) # mark as most recently used
+                self._stats["hits"] += 1
+                return matcher
+            self._stats["misses"] += 1
+        # Built outside the lock, two requests of a new list may both build it, the last one is kept
+        matcher = KeywordMatcher([{"intention_id": intention_id, "intention_name": intention_name, "keywords": keywords}])
+        with self._lock:
+            self._data[key] = matcher
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False) # drop the least recently used
+                self._stats["evictions"] += 1
+        return matcher
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0
+            }
+
+# Shared by the keyword matching endpoints of this process
+keyword_matcher_cache = KeywordMatcherCache()
+
+# TODO: Aggregate the top-k phrase hits of a search per intention
+def aggregate_hits(hits: list[tuple[str, str, str, float]], aggregation: str = "max", threshold: float = 0.0) -> list[tuple[str, str, str, float]]:
+    """
+    Rank the intentions of best-first hits (intention_id, intention_name, phrase, score), one tuple per intention.
+    - max: the best phrase score of the intention
+    - mean: the mean score of its phrases among the hits
+    - count: the number of its phrases above the threshold, ties broken by the best score
+    Each intention keeps its best phrase. The score is the mean for "mean" and the best similarity otherwise,
+    so that it can still be compared with the similarity threshold.
+    """
+    if not hits:
+        return []
+    ids = np.array([hit[0] for hit in hits])
+    scores = np.array([hit[3] for hit in hits], dtype=np.float64)
+    # hits are sorted best first, so the first hit of each intention is its best phrase
+    unique_ids, first_index, inverse = np.unique(ids, return_index=True, return_inverse=True)
+    best = scores[first_index]
+    if aggregation == "mean":
+        ranked_score = np.bincount(inverse, weights=scores) / np.bincount(inverse)
+        order = np.lexsort((first_index, -ranked_score))
+    elif aggregation == "count":
+        ranked_score = best
+        counts = np.bincount(inverse, weights=scores > threshold)
+        order = np.lexsort((first_index, -best, -counts))
+    else:
+        ranked_score = best
+        order = np.argsort(first_index)
+    return [(*hits[first_index[i]][:3], float(ranked_score[i])) for i in order]
+
+# TODO: Create a semantic matching class
+class SemanticMatcher:
+    def __init__(self,
+                 collection_name: str,
+                 intention_ids: set|list,
+                 milvus_client: MilvusClient | AsyncMilvusClient | None = None,
+                 vector_index: InProcessVectorIndex | None = None,
+                 top_k: int = 1,
+                 aggregation: str = "max",
+                 threshold: float = 0.0,
+                 search_ef: int | None = None,
+                 embedding_dim: int | None = None):
+        self.collection_name = collection_name
+        # In the shared layout the phrases are in the shared collection, scoped by the filter below
+        self.search_collection = intention_filter_planner.search_collection(collection_name)
+        self.milvus_client = milvus_client
+        self.intention_ids = intention_ids
+        self.allowed_ids = frozenset(intention_ids or [])
+        # top_k phrases are fetched per search and aggregated per intention, threshold is used by "count"
+        self.top_k = top_k
+        self.aggregation = aggregation
+        self.threshold = threshold
+        # HNSW candidate list of a Milvus search, trades recall for latency, None keeps the Milvus default
+        self.search_ef = search_ef
+        # Leading dimensions of the query embedding kept for Milvus, the same truncation as the stored phrases
+        self.embedding_dim = embedding_dim
+        # With an in-process index, Milvus is not used, the rows of this matcher are masked once here
+        self.vector_index = vector_index
+        self.mask = vector_index.build_mask(intention_ids) if vector_index is not None else None
+
+    @property
+    def filter_expr(self) -> str | None:
+        """
+        Milvus filter expression, None when no allowed intention has phrases in the collection.
+        Taken from the planner's cache on every search, so a later sync that registers new content is followed.
+        """
+        return intention_filter_planner.plan(self.collection_name, self.intention_ids) if self.intention_ids else None
+
+    async def search(self, query_emb: list[float], limit: int = 1) -> list[tuple[str, str, str, float]]:
+        """
+        Search the phrases of this matcher's intentions closest to an embedding.
+
+        Returns:
+            list: up to limit tuples of (intention_id, intention_name, phrase, similarity_score), best first
+        """
+        if not self.intention_ids:
+            return []
+
+        if self.vector_index is not None:
+            return self.vector_index.search_top_k(query_emb, self.mask, limit)
+
+        filter_expr = self.filter_expr
+        if filter_expr is None:
+            return []
+
+        if self.embedding_dim and len(query_emb) > self.embedding_dim:
+            query_emb = truncate_embeddings(query_emb, self.embedding_dim).tolist()
+
+        results = await self._milvus_search(query_emb, filter_expr, limit)
+        hits = self._allowed_hits(results)
+        if len(hits) < len(results):
+            # The plan may skip the filter when the collection held only allowed intentions at the last sync,
+            # rows left behind by a failed delete or written after it took the places of the allowed ones:
+            # search again restricted to the allowed intentions, so that the best allowed hit is not lost
+            explicit_expr = intention_filter_planner.explicit_plan(self.collection_name, self.intention_ids)
+            if explicit_expr != filter_expr:
+                logger_chatflow.warning(f"向量数据库collection：{self.search_collection}检索结果含有不属于当前节点的意图，按意图列表重新检索")
+                hits = self._allowed_hits(await self._milvus_search(query_emb, explicit_expr, limit))
+        return hits
+
+    async def _milvus_search(self, query_emb: list[float], filter_expr: str, limit: int) -> list:
+        # Concurrent searches of other calls with the same filter go out in the same request
+        results = await milvus_search_batcher.search(
+            self.milvus_client,
+            self.search_collection,
+            query_emb,
+            filter_expr,
+            limit,
+            ["intention_id", "intention_name", "phrase"],
+            {"ef": max(self.search_ef, limit)} if self.search_ef else None # ef can not be smaller than limit
+        )
+        return results or []
+
+    def _allowed_hits(self, results: list) -> list[tuple[str, str, str, float]]:
+        """Hits of the allowed intentions, rows of other intentions returned by an open plan are dropped."""
+        hits = []
+        for hit in results: # hit is a Milvus hit object, similar to dict
+            entity = hit.get("entity", {})
+            if entity.get("intention_id", "") not in self.allowed_ids:
+                continue
+            hits.append((entity.get("intention_id", ""), entity.get("intention_name", ""),
+                         entity.get("phrase", ""), hit.get("distance", 0.0)))
+        return hits
+
+    async def find_most_similar(self, sentence: str, query_emb: list[float] | None = None) -> tuple[str, str, str, float]:
+        """
+        Find the most similar intention to the given sentence.
+        query_emb can be given when the sentence has already been embedded by the caller.
+
+        Returns:
+            tuple: (intention_id, intention_name, phrase, similarity_score)
+            Always returns a valid tuple even when no match is found
+        """
+        DEFAULT_RESULT = ("", "", "", 0.0)
+        if not self.intention_ids or (self.vector_index is None and self.filter_expr is None):
+            return DEFAULT_RESULT
+
+        try:
+            if query_emb is None:
+                # Generate query embedding, without blocking the event loop
+                query_emb = await aembed_query(sentence)
+            if hasattr(query_emb, 'tolist'):
+                query_emb = query_emb.tolist()
+
+            # Perform search
+            hits = await self.search(query_emb, limit=self.top_k)
+            ranked = aggregate_hits(hits, self.aggregation, self.threshold)
+            return ranked[0] if ranked else DEFAULT_RESULT
+
+        except Exception as e:
+            logger_chatflow.error(f"'{sentence}'查询失败: {str(e)}", exc_info=True)
+            # Final fallback
+            return DEFAULT_RESULT
+
+# TODO: Create a LLM inference matching class
+class LLMInferenceMatcher:
+    def __init__(self,
+                 config: NodeConfig,
+                 intentions: list,
+                 knowledge_infer_name: dict,
+                 knowledge_infer_description: dict,
+                 intention_priority: int):
+        self.config = config
+        self.intention_infer_name = {} # dict: intention_id -> intention_name
+        self.intention_infer_descriptions = {} # dict: intention_id -> intention_name - intention_description
+        if intentions:
+            for intention in intentions:
+                self.intention_infer_name[intention["intention_id"]] = intention["intention_name"]
+                intention_description = " ".join(intention["llm_description"]) if intention["llm_description"] else "无意图说明"
+                self.intention_infer_descriptions[intention["intention_id"]] = str(intention["intention_name"]) + " - " + intention_description
+
+        # remove the knowledge item that user specifically ask not to include via "nomatch_knowledge_ids"
+        nomatch_knowledge_ids = self.config.other_config.get("nomatch_knowledge_ids", [])
+        if not isinstance(nomatch_knowledge_ids, list):
+            e_m = f"{config.node_id}-{config.node_name}节点nomatch_knowledge_ids应为列表"
+            logger_chatflow.error(e_m)
+            raise TypeError(e_m)
+        self.knowledge_infer_name = {k:v for k, v in knowledge_infer_name.items() if k not in nomatch_knowledge_ids} # dict to store knowledge intention_id: intention_name
+        self.knowledge_infer_description = {k:v for k, v in knowledge_infer_description.items() if k in self.knowledge_infer_name} # dict to store knowledge intention_id : intention_name - intention_description
+
+        # background prompt
+        self.llm_role_description: str = getattr(config.agent_config, "llm_role_description", "")
+        self.llm_background_info: str = getattr(config.agent_config, "llm_background_info", "")
+
+        # prompts
+        # Role, rules, intention/knowledge lists and output examples never change for this node: they are joined once
+        # into the system message, and everything of the turn comes after it, so the provider or vLLM prefix cache hits
+        self.base_docstring: list = self._create_base_docstring(intention_priority) or []
+        self.system_message = SystemMessage(content="\n".join(self.base_docstring + docstring_tail))
+        # Identifies the node's prompt and model in the decision cache, a changed configuration never reuses old decisions
+        self.prompt_fingerprint = hashlib.sha256(
+            f"{config.node_id}\n{config.agent_config.llm_name}\n{self.system_message.content}".encode("utf-8")).hexdigest()
+
+        # select llm runnable
+        self.llm_runnable = self._select_llm(config.agent_config.llm_name)
+
+    def _select_llm(self, llm_name: str):
+        if llm_name == "qwen_llm":
+            return qwen_llm
+        elif llm_name == "local_llm":
+            return local_llm
+        elif llm_name == "deepseek_llm":
+            return deepseek_llm
+        elif llm_name == "glm_llm":
+            return glm_llm
+        return deepseek_llm
+
+    def _create_base_docstring(self, intention_priority: int) -> list:
+        """
+        Prepare the base docstring from the LLM
+        """
+        #Add intention priority
+        docstring_base = (
+                [
+                    "## === 你的角色描述和背景信息（仅供参考） ===",
+                    self.llm_role_description,
+                    self.llm_background_info,
+                    ""
+                ] +
+                docstring_base_raw +
+                [priority_map[intention_priority]] + priority_map[4:]
+        )
+
+        # Include the intention descriptions
+        docstring_base.append("**【意图库列表】**（- 意图id : 意图名称 - 意图说明）")
+        if self.intention_infer_descriptions:
+            for k, v in self.intention_infer_descriptions.items():
+                docstring_base.append(f"  - {k} : {v}")
+        else:
+            docstring_base.append("")
+
+        docstring_base.append("")
+        docstring_base.append("**【知识库列表】**（- 意图id : 意图名称 - 意图说明）")
+        if self.knowledge_infer_description: # if knowledge exists
+            for k, v in self.knowledge_infer_description.items():
+                docstring_base.append(f"  - {k} : {v}")
+        else: # if knowledge doesn't exist, append an empty string as a blank row later
+            docstring_base.append("")
+        docstring_base.append("")
+
+        return docstring_base
+
+    def _parse_llm_json_output(self, text: str) -> tuple[str, str]:
+        """
+        Parse LLM output robustly. Always returns (input_summary, intention_id).
+        """
+        text = text.strip()
+
+        if text.startswith("```"):
+            text = re.split(r"```(?:json)?", text, maxsplit=1)[-1]
+            text = text.rsplit("```", 1)[0] if "```" in text else text
+        text = text.strip()
+
+        # Try to parse
+        try:
+            data = ast.literal_eval(text)
+            if isinstance(data, dict):
+                summary = str(data.get("input_summary", "无"))[:10]
+                id_ = str(data.get("intention_id", "others"))
+            else:
+                summary, id_ = "无", "others"
+        except Exception as e:
+            logger_chatflow.error("大模型输出解析异常：%s", {e})
+            # Fallback: extract using regex
+            summary_match = re.search(r'[\'"`]input_summary[\'"`]\s*:\s*[\'"`](.*?)[\'"`]', text)
+            summary = summary_match.group(1)[:10] if summary_match else "无"
+
+            id_match = re.search(r'[\'"`]intention_id[\'"`]\s*:\s*[\'"`](.*?)[\'"`]', text)
+            id_ = id_match.group(1) if id_match else "others"
+
+        return summary, id_
+
+    @staticmethod
+    def _prompt_cache_usage(response_metadata: dict) -> tuple[int, int]:
+        """
+        (prompt tokens, prompt tokens served from the prefix cache) of a response.
+        OpenAI-compatible APIs (DashScope, vLLM, GLM) report prompt_tokens_details.cached_tokens,
+        DeepSeek reports prompt_cache_hit_tokens. 0 cached tokens when the provider reports neither.
+        """
+        token_usage = response_metadata.get("token_usage") or {}
+        prompt_tokens = int(token_usage.get("prompt_tokens") or 0)
+        cached_tokens = (token_usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached_tokens is None:
+            cached_tokens = token_usage.get("prompt_cache_hit_tokens")
+        return prompt_tokens, int(cached_tokens or 0)
+
+    def _decision_key(self, chat_history: list, analysis: TurnAnalysis) -> str:
+        """
+        Key of the LLM decision cache: the node's prompt, the normalized user input and the normalized history
+        sent with it (the last llm_context_rounds turns), so that only an identical turn of the same node hits.
+        """
+        history = [[msg.__class__.__name__, normalize_turn_text(msg.content or "")] for msg in chat_history
+                   if msg.__class__.__name__ in ("HumanMessage", "AIMessage")]
+        payload = json.dumps([self.prompt_fingerprint, analysis.normalized, history], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def llm_infer(self, chat_history: list, user_input: TurnAnalysis | str) -> tuple[str, str, str, str, int]:
+        """
+        Infer the user intention from the user input.
+        The decision of an identical turn is taken from llm_decision_cache, and costs no token.
+        """
+        analysis = TurnAnalysis.of(user_input)
+        llm_start = time.perf_counter()
+        if not self.llm_runnable:
+            e_m = "LLM推理工具未初始化"
+            logger_chatflow.error(e_m)
+
+        if LLM_DECISION_CACHE_ENABLED:
+            decision, source = await llm_decision_cache.get_or_compute(
+                self._decision_key(chat_history, analysis),
+                lambda: self._ask_llm(chat_history, analysis)
+            )
+            if source != "computed":
+                decision = {**decision, "token_used": 0}
+                logger_chatflow.info(f"{self.config.node_id}-{self.config.node_name}节点大模型意图缓存命中（{source}）：{analysis.normalized}")
+            analysis.llm_cache = source
+        else:
+            decision, _ = await self._ask_llm(chat_history, analysis)
+        intention_id, input_summary, token_used = decision["intention_id"], decision["input_summary"], decision["token_used"]
+
+        user_intention, inference_type = "其他", "无"
+        if intention_id in self.intention_infer_name:
+            user_intention = self.intention_infer_name[intention_id]
+            inference_type = "意图库"
+        elif intention_id in self.knowledge_infer_name:
+            user_intention = self.knowledge_infer_name[intention_id]
+            inference_type = "知识库"
+
+        print(f"大模型回复处理后内容：intention_id: {intention_id}, user_intention: {user_intention}, "
+              f"input_summary: {input_summary}, inference_type: {inference_type}")
+        analysis.add_timing("llm_ms", llm_start)
+        return intention_id, user_intention, input_summary, inference_type, token_used
+
+    async def _ask_llm(self, chat_history: list, analysis: TurnAnalysis) -> tuple[dict, bool]:
+        """
+        One LLM call. Returns the decision {"intention_id", "input_summary", "token_used"} and whether it can be cached:
+        a failed call falls back to "others", which is not a decision of the LLM.
+        """
+        user_input = analysis.text
+        # Initialize default values
+        intention_id, input_summary, token_used = "others", "无", 0
+        try:
+            # Create prompt of chat history
+            docstring_chat_history = []
+            for msg in chat_history:
+                if msg.__class__.__name__ == "HumanMessage":
+                    docstring_chat_history.append(f"- 【用户】{msg.content}")
+                elif msg.__class__.__name__ == "AIMessage":
+                    ai_message = msg.content
+                    if ai_message:
+                        docstring_chat_history.append(f"- 【智能客服】{ai_message}")
+            docstring_chat_history.append("")
+
+            # Create the per-turn prompt: the history grows at its end from turn to turn, the last input closes it
+            turn_docstring = (["### 智能助手和用户的全部对话历史（务必参考）"] +
+                              docstring_chat_history +
+                              [
+                                  "### **最后一次用户输入**",
+                                  user_input,
+                                  "",
+                                  docstring_final_instruction
+                              ])
+            turn_prompt = "\n".join(turn_docstring)
+            print(f"{self.config.node_id}-{self.config.node_name}节点的大模型提示词 \n{self.system_message.content}\n{turn_prompt}")
+            print()
+            # Invoke the llm
+            resp = await self.llm_runnable.ainvoke([self.system_message, HumanMessage(content=turn_prompt)])
+
+            # Get the tokens consumed per round of conversation including the preconfigured doc string, full chat history, AI reply, etc.
+            token_used = int(resp.response_metadata.get("token_usage", {}).get("total_tokens", 0))
+            prompt_tokens, cached_tokens = self._prompt_cache_usage(resp.response_metadata)
+            analysis.llm_prompt_tokens, analysis.llm_cached_tokens = prompt_tokens, cached_tokens
+            logger_chatflow.info(f"{self.config.node_id}-{self.config.node_name}节点大模型提示词token：{prompt_tokens}，"
+                                 f"命中前缀缓存：{cached_tokens}，未命中：{prompt_tokens - cached_tokens}")
+            print(f"大模型回复内容： {resp.content}")
+            input_summary, intention_id = self._parse_llm_json_output(resp.content)
+        except Exception as e:
+            logger_chatflow.error("LLM推理调用异常：%s", {e})
+            return {"intention_id": intention_id, "input_summary": input_summary, "token_used": token_used}, False
+
+        cacheable = (intention_id == "others" or intention_id in self.intention_infer_name
+                     or intention_id in self.knowledge_infer_name)
+        return {"intention_id": intention_id, "input_summary": input_summary, "token_used": token_used}, cacheable
\ No newline at end of file
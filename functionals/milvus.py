@@ -1,672 +1,1196 @@
-import hashlib
-import threading
-import time
-import asyncio
-from pymilvus import MilvusClient, AsyncMilvusClient, MilvusException
-from pymilvus.milvus_client import IndexParams
-from functionals.log_utils import logger_chatflow
-from functionals.embedding_functions import embed_query
-
-#TODO: sync Milvus client
-class LaunchMilvus:
-    def __init__(self, vector_db_url: str, collection_name: str, intentions: list = None, knowledge: list = None):
-        self.client = MilvusClient(uri = vector_db_url, secure=False)
-        self.collection_name = collection_name
-        self.merged_data = (intentions or []) + (knowledge or [])
-        self._ensure_collection_ready(self.merged_data)
-
-    def _generate_phrase_id(self, intention_id: str, phrase: str) -> int:
-        """Generate a deterministic ID for a phrase."""
-        hash_str = hashlib.sha256(f"{intention_id}:{phrase}".encode()).hexdigest()
-        # Convert to int and mask to 63 bits (safe for INT64)
-        return int(hash_str[:16], 16) & ((1 << 63) - 1)
-
-    def _ensure_collection_ready(self, merged_data: list = None):
-        """Ensure collection exists and is ready with data."""
-        # if collection doesn't exist, create it.
-        if not self.client.has_collection(self.collection_name):
-            self._create_collection()
-            self._create_hnsw_index()
-            logger_chatflow.info(f"已创建新的collection：{self.collection_name}和HNSW index")
-        else:
-            self._ensure_hnsw_index()
-            logger_chatflow.info(f"Collection：{self.collection_name}已存在，使用已有的HNSW index")
-
-        # Always upsert latest data
-        if merged_data:
-            self._upsert_intention_data(merged_data)
-
-        # Ensure the collection is loaded
-        self.client.load_collection(self.collection_name, timeout=30)
-
-    def _create_collection(self):
-        """Create the Milvus collection schema."""
-        self.client.create_collection(
-            collection_name=self.collection_name,
-            dimension = 1024, #This value has to be 1024 as it is the dimension of Qwen Embedding
-            metric_type="COSINE",
-            auto_id=False,  # We manage IDs by ourselves
-            primary_field="id",
-            extra_fields=[
-                {"name": "id", "data_type": "INT64", "is_primary": True},
-                {"name": "intention_id", "data_type": "VARCHAR", "max_length": 512},
-                {"name": "intention_name", "data_type": "VARCHAR", "max_length": 512},
-                {"name": "phrase", "data_type": "VARCHAR", "max_length": 4096},
-            ]
-        )
-        logger_chatflow.info(f"已创建向量数据库collection：{self.collection_name}")
-
-    def _create_hnsw_index(self):
-        """Create HNSW index - called only once when collection is created."""
-        try:
-            # First, drop any existing indexes on the vector field
-            existing_indexes = self.client.list_indexes(self.collection_name)
-            for index_name in existing_indexes:
-                try:
-                    self.client.release_collection(self.collection_name)
-                    self.client.drop_index(self.collection_name, index_name)
-                    logger_chatflow.info(f"向量数据库collection：{self.collection_name}已删除现有index：{index_name}")
-                except Exception as e:
-                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}删除index{index_name}时发生警告：{str(e)}")
-            # Create HNSW index
-            index_params = IndexParams()
-            index_params.add_index(
-                field_name="vector",
-                index_type="HNSW",
-                metric_type="COSINE",
-                params={"M": 16, "efConstruction": 200}
-            )
-            self.client.create_index(
-                collection_name=self.collection_name,
-                index_params=index_params
-            )
-            logger_chatflow.info(f"向量数据库collection：{self.collection_name}已创建向量数据库HNSW index")
-        except MilvusException as e:
-            logger_chatflow.error(f"向量数据库collection：{self.collection_name}创建HNSW index时发生错误：{str(e)}")
-            raise RuntimeError(str(e))
-
-    def _ensure_hnsw_index(self):
-        """Ensure HNSW index exists, create if missing or wrong type."""
-        try:
-            self.client.release_collection(self.collection_name)
-            existing_indexes = self.client.list_indexes(self.collection_name)
-
-            if not existing_indexes:
-                # No index exists, create HNSW
-                self._create_hnsw_index()
-                return
-
-            # Check if HNSW index exists
-            hnsw_exists = False
-            for index_name in existing_indexes:
-                try:
-                    index_info = self.client.describe_index(self.collection_name, index_name)
-                    if (index_info.get('index_type') == 'HNSW' and
-                            index_info.get('metric_type') == 'COSINE'):
-                        hnsw_exists = True
-                        logger_chatflow.info(f"向量数据库collection：{self.collection_name}HNSW index已存在，index名称为{index_name}")
-                        break
-                except Exception as e:
-                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}检查index{index_name}时发生警告: {str(e)}")
-
-            if not hnsw_exists:
-                # Existing index is not HNSW, replace it
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}现有index不是HNSW类型，替换为HNSW")
-                self._create_hnsw_index()
-
-        except Exception as e:
-            logger_chatflow.error(f"向量数据库collection：{self.collection_name}检查HNSW index时发生错误：{str(e)}")
-            raise RuntimeError(str(e))
-
-    def _upsert_intention_data(self, merged_data: list):
-        """Upsert intention data - index automatically handles new vectors."""
-        upsert_data = []
-        for item in merged_data:
-            intention_id = item.get("intention_id")
-            intention_name = item.get("intention_name")
-            for phrase in item.get("semantic", []):
-                if phrase.strip():  # skip empty
-                    # embedding = qwen3_embedding_model.embed_documents(phrase)
-                    embedding = embed_query(phrase)
-                    if hasattr(embedding, 'tolist'):#convert array-like objects into standard lists, required by Milvus
-                        embedding = embedding.tolist()
-                    if len(embedding)!=1024:
-                        e_m = f"向量数据库collection：{self.collection_name}向量为度应为1024，目前为{len(embedding)}"
-                        logger_chatflow.error(e_m)
-                        raise ValueError(e_m)
-
-                    phrase_id = self._generate_phrase_id(intention_id, phrase)
-                    upsert_data.append({
-                        "id": phrase_id,
-                        "vector": embedding,
-                        "intention_id": intention_id,
-                        "intention_name": intention_name,
-                        "phrase": phrase
-                    })
-
-        if not upsert_data:
-            logger_chatflow.info(f"没有问法短语插入向向量数据库collection：{self.collection_name}")
-            return
-
-        # Upsert (insert or replace)
-        self.client.upsert(collection_name=self.collection_name, data=upsert_data)
-        logger_chatflow.info(f"更新{len(upsert_data)}条问法短语到向量数据库collection：{self.collection_name}")
-
-    def get_index_info(self):
-        """Get information about current index."""
-        try:
-            existing_indexes = self.client.list_indexes(self.collection_name)
-            index_info_list = []
-            for index_name in existing_indexes:
-                index_info = self.client.describe_index(self.collection_name, index_name)
-                index_info_list.append({
-                    'name': index_name,
-                    'info': index_info
-                })
-            return index_info_list
-        except Exception as e:
-            logger_chatflow.error(f"向量数据库collection：{self.collection_name}获取index信息时发生错误：{str(e)}")
-            return []
-
-#TODO: async Milvus client
-class LaunchMilvusAsync:
-    def __init__(
-            self,
-            vector_db_url: str,
-            collection_name: str,
-            intentions: list|None = None,
-            knowledge: list|None = None
-    ):
-        self.client = AsyncMilvusClient(uri = vector_db_url, secure=False)
-        self.collection_name = collection_name
-        self.merged_data = (intentions or []) + (knowledge or [])
-        self.embedding_cache = {}  # Embedding cache to avoid redundant computation
-        self.embedding_semaphore = asyncio.Semaphore(10)
-        self._stats = {
-            "embeddings_generated": 0,
-            "embeddings_cached": 0,
-            "total_phrases_processed": 0
-        }
-        self._cache_lock = threading.RLock()
-        self._max_cache_size = 10000
-        self.limit = 10000 # limit for collection client query
-
-    def _generate_phrase_id(self, intention_id: str, phrase: str) -> int:
-        """Generate a deterministic ID for a phrase."""
-        hash_str = hashlib.sha256(f"{intention_id}:{phrase}".encode()).hexdigest()
-        # Convert to int and mask to 63 bits (safe for INT64)
-        return int(hash_str[:16], 16) & ((1 << 63) - 1)
-
-    async def ensure_collection_ready(self):
-        """Ensure collection exists and is ready with data."""
-        start_time = time.time()
-        logger_chatflow.info(f"开始处理向量数据库collection：{self.collection_name}")
-
-        # if collection doesn't exist, create it.
-        has_collection = await self.client.has_collection(self.collection_name)  # AWAIT
-        if not has_collection:
-            await self._create_collection()
-            await self._create_hnsw_index()
-            logger_chatflow.info(f"已创建新的向量数据库collection：{self.collection_name}和HNSW index")
-            try:
-                await self.client.load_collection(self.collection_name, timeout=30)
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已加载到内存")
-            except Exception as e:
-                logger_chatflow.warning(f"加载向量数据库collection：{self.collection_name}失败，尝试继续：{str(e)}")
-            # insert latest data
-            if self.merged_data:
-                await self._insert_all_data(self.merged_data)
-        else:
-            await self._ensure_hnsw_index()
-            logger_chatflow.info(f"向量数据库collection：{self.collection_name}已存在，使用已有的HNSW index")
-            # load collection before query
-            try:
-                await self.client.load_collection(self.collection_name, timeout=30)
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已加载到内存")
-            except Exception as e:
-                logger_chatflow.warning(f"向量数据库collection：{self.collection_name}失败，尝试继续：{str(e)}")
-            # update with latest data
-            if self.merged_data:
-                await self._incremental_sync_data(self.merged_data)
-
-        # Check duplicates
-        # await self.cleanup_duplicate_phrases()
-
-        elapsed = time.time() - start_time
-        logger_chatflow.info(f"向量数据库collection: {self.collection_name}处理完成，耗时：{elapsed:.3f}秒")
-
-    async def _create_collection(self):
-        """Create the Milvus collection schema."""
-        await self.client.create_collection(
-            collection_name=self.collection_name,
-            dimension = 1024, #Qwen Embedding 0.6B dimension
-            metric_type="COSINE",
-            auto_id=False,  # We manage IDs by ourselves
-            primary_field="id",
-            extra_fields=[
-                {"name": "id", "data_type": "INT64", "is_primary": True},
-                {"name": "intention_id", "data_type": "VARCHAR", "max_length": 512},
-                {"name": "intention_name", "data_type": "VARCHAR", "max_length": 512},
-                {"name": "phrase", "data_type": "VARCHAR", "max_length": 4096},
-            ]
-        )
-        logger_chatflow.info(f"已创建向量数据库collection：{self.collection_name}")
-
-    async def _create_hnsw_index(self):
-        """Create HNSW index - called only once when collection is created."""
-        try:
-            # First, drop any existing indexes on the vector field
-            existing_indexes = await self.client.list_indexes(self.collection_name)
-            for index_name in existing_indexes:
-                try:
-                    await self.client.release_collection(self.collection_name)
-                    await self.client.drop_index(self.collection_name, index_name)
-                    logger_chatflow.info(f"向量数据库collection：{self.collection_name}已删除现有index：{index_name}")
-                except Exception as e:
-                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}删除index {index_name}时发生警告：{str(e)}")
-            # Create HNSW index
-            index_params = IndexParams()
-            index_params.add_index(
-                field_name="vector",
-                index_type="HNSW",
-                metric_type="COSINE",
-                params={"M": 16, "efConstruction": 200}
-            )
-            await self.client.create_index(
-                collection_name=self.collection_name,
-                index_params=index_params
-            )
-            logger_chatflow.info(f"已创建向量数据库collection：{self.collection_name} HNSW index")
-        except MilvusException as e:
-            logger_chatflow.info(f"创建向量数据库collection：{self.collection_name} HNSW index时发生错误：{str(e)}")
-            raise RuntimeError(str(e))
-
-    async def _ensure_hnsw_index(self):
-        """确保HNSW索引存在，不存在则创建"""
-        try:
-            await self.client.release_collection(self.collection_name)
-            existing_indexes = await self.client.list_indexes(self.collection_name)
-
-            hnsw_exists = False
-            for index_name in existing_indexes:
-                try:
-                    index_info = await self.client.describe_index(self.collection_name, index_name)
-                    if (index_info.get('index_type') == 'HNSW' and index_info.get('metric_type') == 'COSINE'):
-                        hnsw_exists = True
-                        logger_chatflow.info(f"向量数据库collection：{self.collection_name} HNSW index已存在，索引名称为{index_name}")
-                        break
-                except Exception as e:
-                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}检查索引{index_name}时发生警告：{str(e)}")
-
-            if not hnsw_exists:
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}现有索引不是HNSW类型，替换为HNSW")
-                await self._create_hnsw_index()
-
-        except Exception as e:
-            logger_chatflow.error(f"向量数据库collection：{self.collection_name}检查HNSW索引时发生错误：{str(e)}")
-            raise RuntimeError(str(e))
-
-    async def _get_existing_phrase_ids_with_retry(self, max_retries: int = 3) -> set[int]:
-        """带重试机制的获取现有ID"""
-        for attempt in range(max_retries):
-            try:
-                return await self._get_existing_phrase_ids()
-            except Exception as e:
-                logger_chatflow.warning(f"向量数据库collection：{self.collection_name}获取现有ID失败 (尝试 {attempt + 1}/{max_retries})：{e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # 指数退避
-                else:
-                    logger_chatflow.error(f"向量数据库collection：{self.collection_name}获取现有ID最终失败：{e}")
-                    raise
-        return set()
-
-    async def _get_existing_phrase_ids(self) -> set[int]:
-        """Fetch all existing phrase_id values from Milvus (with pagination)."""
-        existing_ids = set()
-        try:
-            offset = 0
-            while True:
-                results = await self.client.query(
-                    collection_name=self.collection_name,
-                    filter="",
-                    output_fields=["id"],
-                    limit=self.limit,
-                    offset=0
-                )
-                if not results:
-                    break
-                for r in results:
-                    pid = r.get("id")
-                    if pid is not None and pid != -1:  # exclude metadata sentinel
-                        existing_ids.add(int(pid))
-                if len(results) < self.limit:
-                    break
-                offset += self.limit
-            return existing_ids
-        except Exception as e:
-            logger_chatflow.warning(f"无法获取现有向量数据库collection：{self.collection_name} phrase_id列表：{e}")
-            return set()
-
-    async def _prepare_target_data(self, merged_data: list[dict]) -> tuple[set[int], dict[int, dict]]:
-        """Prepare target data: compute IDs and build mapping."""
-        target_phrase_ids = set()
-        phrase_id_to_data = {}
-
-        for item in merged_data:
-            intention_id = item.get("intention_id")
-            intention_name = item.get("intention_name")
-            for phrase in item.get("semantic", []):
-                if not phrase.strip():
-                    continue
-                phrase_id = self._generate_phrase_id(intention_id, phrase)
-                target_phrase_ids.add(phrase_id)
-                phrase_id_to_data[phrase_id] = {
-                    "intention_id": intention_id,
-                    "intention_name": intention_name,
-                    "phrase": phrase,
-                }
-
-        logger_chatflow.info(f"向量数据库collection：{self.collection_name}目标数据包含{len(target_phrase_ids)}条短语")
-        return target_phrase_ids, phrase_id_to_data
-
-    async def _incremental_sync_data(self, merged_data: list[dict]):
-        """Incrementally sync data: insert new, delete obsolete."""
-        try:
-            logger_chatflow.info(f"向量数据库collection：{self.collection_name}开始增量同步数据...")
-            target_phrase_ids, phrase_id_to_data = await self._prepare_target_data(merged_data)
-            existing_phrase_ids = await self._get_existing_phrase_ids_with_retry()
-            logger_chatflow.info(f"向量数据库collection：{self.collection_name}现有数据包含{len(existing_phrase_ids)}条短语")
-
-            to_delete = existing_phrase_ids - target_phrase_ids
-            to_insert = target_phrase_ids - existing_phrase_ids
-
-            if to_delete:
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}删除{len(to_delete)}条过期问法短语")
-                await self._batch_delete_phrases(list(to_delete))
-
-            if to_insert:
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}插入{len(to_insert)}条新问法短语")
-                await self._batch_insert_phrases(to_insert, phrase_id_to_data)
-            else:
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}问法短语已同步，无需更新")
-
-            self._log_sync_stats(len(existing_phrase_ids), len(to_delete), len(to_insert), len(target_phrase_ids))
-
-        except Exception as e:
-            logger_chatflow.error(f"向量数据库collection：{self.collection_name}更新失败：{str(e)}")
-            raise
-
-    async def _batch_delete_phrases(self, phrase_ids: list[int], batch_size: int = 1000):
-        """Batch delete phrases (fallback to chunked deletion on failure)."""
-        if not phrase_ids:
-            return
-        try:
-            if len(phrase_ids)<=batch_size: # Try in one go for small amount deletion
-                await self.client.delete(collection_name=self.collection_name, ids=phrase_ids)
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}一次性删除{len(phrase_ids)}条短语")
-            else: # Delete in batches for large amount
-                for i in range(0, len(phrase_ids), batch_size):
-                    batch = phrase_ids[i:i + batch_size]
-                    await self.client.delete(collection_name=self.collection_name, ids=batch)
-                    logger_chatflow.info(f"向量数据库collection：{self.collection_name}正在分批删除，已删除批次 {i // batch_size + 1}: {len(batch)} 条")
-                    await asyncio.sleep(0.01)  # Delay a bit to reduce server pressure
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}分批删除完成，共{len(phrase_ids)}条")
-        except Exception as e:
-            logger_chatflow.warning(f"向量数据库collection：{self.collection_name}删除失败，尝试降级方案：{str(e)}")
-            await self._delete_with_filter_fallback(phrase_ids)
-
-    async def _delete_with_filter_fallback(self, phrase_ids: list[int]):
-        try:
-            id_str = ", ".join(str(pid) for pid in phrase_ids)
-            filter_expr = f"id in [{id_str}]"
-            await self.client.delete(
-                collection_name=self.collection_name,
-                filter=filter_expr
-            )
-        except Exception as e:
-            logger_chatflow.error(f"向量数据库collection：{self.collection_name} filter删除也失败，尝试逐个删除：{str(e)}")
-            # Delete one by one
-            success_count = 0
-            for pid in phrase_ids:
-                try:
-                    await self.client.delete(
-                        collection_name=self.collection_name,
-                        filter=f"id == {pid}"
-                    )
-                    success_count += 1
-                except Exception:
-                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}无法删除phrase_id {pid}")
-            logger_chatflow.info(f"向量数据库collection：{self.collection_name}逐个删除完成：{success_count}/{len(phrase_ids)}成功")
-
-    async def _batch_insert_phrases(self, phrase_ids_to_insert: set[int], phrase_id_to_data: dict[int, dict]):
-        """Batch insert phrases with cached embedding."""
-        if not phrase_ids_to_insert:
-            return
-
-        batch_size = 100
-        phrase_ids_list = list(phrase_ids_to_insert)
-
-        for i in range(0, len(phrase_ids_list), batch_size):
-            batch_ids = phrase_ids_list[i:i + batch_size]
-            batch_data = await self._prepare_insert_batch_with_concurrency(batch_ids, phrase_id_to_data, self.embedding_semaphore)
-            if batch_data:
-                try:
-                    await self.client.insert(collection_name=self.collection_name, data=batch_data)
-                    logger_chatflow.debug(f"向量数据库collection：{self.collection_name}已插入批次 {i // batch_size + 1}: {len(batch_data)} 条")
-                except Exception as e:
-                    logger_chatflow.error(f"向量数据库collection：{self.collection_name}批次插入失败：{str(e)}")
-            await asyncio.sleep(0)  # yield control
-
-    async def _prepare_insert_batch_with_concurrency(
-            self, phrase_ids: list[int],
-            phrase_id_to_data: dict[int, dict],
-            semaphore: asyncio.Semaphore
-    ) -> list[dict]:
-        """Prepare a batch of data with embeddings (cached)."""
-        tasks = []
-        for phrase_id in phrase_ids:
-            data = phrase_id_to_data.get(phrase_id)
-            if data:
-                task = self._prepare_single_phrase(phrase_id, data, semaphore)
-                tasks.append(task)
-
-        # run concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        batch_data = []
-        for result in results:
-            if isinstance(result, dict):
-                batch_data.append(result)
-        return batch_data
-
-    async def _prepare_single_phrase(
-            self,
-            phrase_id: int,
-            data: dict,
-            semaphore: asyncio.Semaphore
-    ) -> dict|None:
-        async with semaphore:
-            try:
-                phrase_text = data["phrase"]
-                cache_key = f"{data['intention_id']}:{phrase_text}"
-
-                # stats and cache limitation
-                with self._cache_lock:
-                    self._stats["total_phrases_processed"] += 1
-                    if cache_key in self.embedding_cache:
-                        embedding = self.embedding_cache[cache_key]
-                        self._stats["embeddings_cached"] += 1
-                    else:
-                        # Simple cache clearance
-                        if len(self.embedding_cache) >= self._max_cache_size:
-                            # Delete first 10% cache
-                            keys_to_remove = list(self.embedding_cache.keys())[:self._max_cache_size // 10]
-                            for key in keys_to_remove:
-                                del self.embedding_cache[key]
-
-                        embedding = embed_query(phrase_text)
-                        if hasattr(embedding, 'tolist'):
-                            embedding = embedding.tolist()
-                        if len(embedding) != 1024:
-                            logger_chatflow.error(f"向量数据库collection：{self.collection_name}向量维度错误: {len(embedding)}，跳过：{phrase_text[:50]}...")
-                            return None
-                        self.embedding_cache[cache_key] = embedding
-                        self._stats["embeddings_generated"] += 1
-
-                return {
-                    "id": phrase_id,
-                    "vector": embedding,
-                    "intention_id": data["intention_id"],
-                    "intention_name": data["intention_name"],
-                    "phrase": phrase_text
-                }
-            except Exception as e:
-                logger_chatflow.error(f"向量数据库collection：{self.collection_name}嵌入处理短语失败 '{phrase_text[:50]}...': {e}")
-                return None
-
-    async def _insert_all_data(self, merged_data: list[dict]):
-        """Insert all data on first-time collection creation."""
-        logger_chatflow.info(f"向量数据库collection：{self.collection_name}开始初始数据插入...")
-        all_items = []
-        for item in merged_data:
-            intention_id = item.get("intention_id")
-            intention_name = item.get("intention_name")
-            for phrase in item.get("semantic", []):
-                if phrase.strip():
-                    phrase_id = self._generate_phrase_id(intention_id, phrase)
-                    all_items.append({
-                        "id": phrase_id,
-                        "intention_id": intention_id,
-                        "intention_name": intention_name,
-                        "phrase": phrase
-                    })
-
-        batch_size = 200
-        for i in range(0, len(all_items), batch_size):
-            batch = all_items[i:i + batch_size]
-            data_map = {item["id"]: item for item in batch}
-            insert_batch = await self._prepare_insert_batch_with_concurrency(list(data_map.keys()), data_map, self.embedding_semaphore)
-            if insert_batch:
-                await self.client.insert(collection_name=self.collection_name, data=insert_batch)
-                logger_chatflow.debug(f"向量数据库collection：{self.collection_name}初始插入批次{i // batch_size + 1}: {len(insert_batch)}条")
-            await asyncio.sleep(0)
-
-        logger_chatflow.info(f"向量数据库collection：{self.collection_name}初始数据插入完成，共 {len(all_items)}条短语")
-
-    def _log_sync_stats(self, existing_count: int, deleted_count: int, inserted_count: int, final_count: int):
-        """Log sync statistics."""
-        # Calculate cache hit rate
-        total_embeddings = self._stats["embeddings_generated"] + self._stats["embeddings_cached"]
-        cache_hit_rate = 0
-        if total_embeddings > 0:
-            cache_hit_rate = self._stats["embeddings_cached"] / total_embeddings * 100
-
-        logger_chatflow.info(
-            f"向量数据库collection：{self.collection_name}更新数据同步统计:\n"
-            f"  原有记录: {existing_count}\n"
-            f"  删除记录: {deleted_count}\n"
-            f"  新增记录: {inserted_count}\n"
-            f"  最终记录: {final_count}\n"
-            f"  变化率: {(deleted_count + inserted_count) / max(existing_count, 1) * 100:.1f}%\n"
-            f"  嵌入性能统计:\n"
-            f"    总处理短语: {self._stats['total_phrases_processed']}\n"
-            f"    生成嵌入: {self._stats['embeddings_generated']}\n"
-            f"    缓存命中: {self._stats['embeddings_cached']}\n"
-            f"    缓存命中率: {cache_hit_rate:.1f}%"
-        )
-
-    async def get_index_info(self):
-        """Get information about current index."""
-        try:
-            existing_indexes = await self.client.list_indexes(self.collection_name)
-            return [
-                {
-                    'name': index_name,
-                    'info': await self.client.describe_index(self.collection_name, index_name)
-                }
-                for index_name in existing_indexes
-            ]
-        except Exception as e:
-            logger_chatflow.error(f"获取index信息时发生错误：{e}")
-            return []
-
-    async def cleanup_duplicate_phrases(self):
-        """Clean duplicated phrases"""
-        try:
-            await self.client.load_collection(self.collection_name, timeout=30)
-            offset = 0
-            all_data = []
-            while True:
-                results = await self.client.query(
-                    collection_name=self.collection_name,
-                    filter="",
-                    output_fields=["id", "phrase", "intention_id"],
-                    limit=self.limit,
-                    offset=offset
-                )
-                if not results:
-                    break
-                all_data += results
-                if len(results) < self.limit:
-                    break
-                offset += self.limit
-
-            if not all_data:
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}为空，无需检查重复记录")
-                return
-
-            # find duplicates
-            seen = {}
-            duplicates = []
-
-            for item in all_data:
-                key = f"{item['intention_id']}:{item['phrase']}"
-                if key in seen:
-                    duplicates.append(item['id'])
-                else:
-                    seen[key] = item['id']
-
-            if duplicates:
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}发现{len(duplicates)}条重复记录，正在清理...")
-                await self.client.delete(
-                    collection_name=self.collection_name,
-                    ids=duplicates
-                )
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已清理{len(duplicates)}条重复记录")
-            else:
-                logger_chatflow.info(f"向量数据库collection：{self.collection_name}未发现重复记录")
-
-        except Exception as e:
-            logger_chatflow.error(f"向量数据库collection：{self.collection_name}清理重复数据失败: {str(e)}")
-
-async def initialize_milvus_async(
-        vector_db_url: str,
-        collection_name: str,
-        intentions: list|None = None,
-        knowledge: list|None = None
-) -> AsyncMilvusClient:
-    milvus_launcher = LaunchMilvusAsync(vector_db_url, collection_name, intentions, knowledge)
-    await milvus_launcher.ensure_collection_ready()  # ONE-TIME SETUP
-    return milvus_launcher.client
-
-# test
-if __name__ == "__main__":
-    async def test_phrase_id():
-        # Test deterministic ID generation (no client needed)
-        launcher = LaunchMilvusAsync("http://127.0.0.1:19530", "test")
-        id1 = launcher._generate_phrase_id("001", "good")
-        id2 = launcher._generate_phrase_id("002", "good")
-        id3 = launcher._generate_phrase_id("001", "bad")
-        id4 = launcher._generate_phrase_id("002", "bad")
-        id5 = launcher._generate_phrase_id("001", "good")
-
-        print(f"id1: {id1}")
-        print(f"id2: {id2}")
-        print(f"id3: {id3}")
-        print(f"id4: {id4}")
-        print(f"id5: {id5}")
-
-        # Now test full async flow (optional)
-        await launcher.ensure_collection_ready()
-
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import asyncio
+import weakref
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+from pymilvus import MilvusClient, AsyncMilvusClient, MilvusException, CollectionSchema, DataType
+from pymilvus.client.types import LoadState
+from pymilvus.milvus_client import IndexParams
+from functionals.log_utils import logger_chatflow
+from data.paths import EMBED_MODEL_NAME, EMBED_STORE_DIMENSION, EMBED_SYNC_CHUNK_SIZE, EMBED_SYNC_WORKERS, MILVUS_SYNC_QUEUE_SIZE, MILVUS_MANIFEST_DIR, \
+    MILVUS_WARM_LOAD_CONCURRENCY, MILVUS_SHARED_COLLECTION_NAME, MILVUS_SHARED_NUM_PARTITIONS, MILVUS_SEARCH_BATCHING_ENABLED, MILVUS_SEARCH_BATCH_WINDOW_MS, MILVUS_SEARCH_BATCH_MAX_SIZE, MILVUS_SEARCH_TIMEOUT
+from functionals.batching import AsyncMicroBatcher
+from functionals.embedding_functions import embed_documents, aembed_documents_array, truncate_embeddings
+from functionals.embedding_store import phrase_embedding_store
+
+_UNSAFE_FILE_CHARS = re.compile(r"[^\w.-]")
+
+#TODO: Filter plans of the semantic searches
+class IntentionFilterPlanner:
+    """
+    Compile the intention filter of every SemanticMatcher once, at build time, instead of on every search.
+    Plans are cached by (collection, set of intention ids), so the nodes sharing a set share one expression.
+    When the intentions of a collection are known, the plan is:
+    - no filter at all if the set covers every intention of the collection
+    - "intention_id not in [...]" if the excluded intentions are fewer than the allowed ones
+    - "intention_id in [...]" over the allowed intentions that have phrases in the collection otherwise
+    - None if none of the allowed intentions has phrases, the search can be skipped
+    An agent in the shared layout is registered with the shared collection it is searched in
+    and the filter of its partition key, which then scopes every plan of the agent.
+    """
+    def __init__(self):
+        self._collection_ids: dict[str, frozenset] = {}
+        self._plans: dict[tuple[str, frozenset], str | None] = {}
+        self._search_collections: dict[str, str] = {} # agent collection_name -> collection actually searched
+        self._partition_filters: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def register(self, collection_name: str, merged_data: list, search_collection: str | None = None, partition_filter: str = ""):
+        """Record the intentions that have phrases in the collection, after each sync."""
+        intention_ids = frozenset(
+            item.get("intention_id") for item in merged_data
+            if any(phrase.strip() for phrase in item.get("semantic") or [])
+        )
+        with self._lock:
+            self._collection_ids[collection_name] = intention_ids
+            self._search_collections[collection_name] = search_collection or collection_name
+            self._partition_filters[collection_name] = partition_filter
+            self._plans = {key: plan for key, plan in self._plans.items() if key[0] != collection_name}
+
+    def search_collection(self, collection_name: str) -> str:
+        """The Milvus collection that holds the phrases of an agent."""
+        with self._lock:
+            return self._search_collections.get(collection_name, collection_name)
+
+    @staticmethod
+    def _expr(operator: str, intention_ids) -> str:
+        id_list_str = ",".join(json.dumps(id_) for id_ in sorted(intention_ids))
+        return f"intention_id {operator} [{id_list_str}]"
+
+    def plan(self, collection_name: str, intention_ids: set | list) -> str | None:
+        key = (collection_name, frozenset(intention_ids))
+        with self._lock:
+            if key in self._plans:
+                return self._plans[key]
+            allowed = key[1]
+            collection_ids = self._collection_ids.get(collection_name)
+            if collection_ids is None: # unknown collection content, filter on the whole set
+                plan = self._expr("in", allowed)
+            else:
+                allowed = allowed & collection_ids
+                excluded = collection_ids - allowed
+                if not allowed:
+                    plan = None
+                elif not excluded:
+                    plan = ""
+                elif len(excluded) < len(allowed):
+                    plan = self._expr("not in", excluded)
+                else:
+                    plan = self._expr("in", allowed)
+            plan = self._scoped(collection_name, plan)
+            self._plans[key] = plan
+            return plan
+
+    def explicit_plan(self, collection_name: str, intention_ids: set | list) -> str:
+        """
+        "intention_id in [...]" over the whole set, whatever the collection held at the last sync.
+        Used when rows of other intentions took the places of a search made with an open plan.
+        """
+        key = (collection_name, frozenset(intention_ids), "in")
+        with self._lock:
+            if key not in self._plans:
+                self._plans[key] = self._scoped(collection_name, self._expr("in", key[1]))
+            return self._plans[key]
+
+    def _scoped(self, collection_name: str, plan: str | None) -> str | None:
+        partition_filter = self._partition_filters.get(collection_name)
+        if partition_filter and plan is not None:
+            return f"{partition_filter} and ({plan})" if plan else partition_filter
+        return plan
+
+# Shared by all the SemanticMatchers of the process
+intention_filter_planner = IntentionFilterPlanner()
+
+#TODO: Batched Milvus searches
+class MilvusSearchBatcher:
+    """
+    Merge concurrent searches of different calls into one search(data=[nq vectors]) request.
+    Only searches that can share a request are merged: same client, collection, filter, limit, output fields
+    and search params, each such combination has its own AsyncMicroBatcher.
+    """
+    def __init__(self,
+                 max_wait_ms: float = MILVUS_SEARCH_BATCH_WINDOW_MS,
+                 max_batch_size: int = MILVUS_SEARCH_BATCH_MAX_SIZE,
+                 timeout: float = MILVUS_SEARCH_TIMEOUT,
+                 enabled: bool = MILVUS_SEARCH_BATCHING_ENABLED):
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self.enabled = enabled
+        # Batchers go away with their client when a model is destroyed
+        self._batchers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+
+    def _get_batcher(self, client: AsyncMilvusClient, key: tuple) -> AsyncMicroBatcher:
+        with self._lock:
+            per_client = self._batchers.setdefault(client, {})
+            batcher = per_client.get(key)
+            if batcher is None:
+                collection_name, filter_expr, limit, output_fields, search_params = key
+                client_ref = weakref.ref(client) # the batcher must not keep its client alive
+
+                async def search_batch(vectors: list) -> list:
+                    batch_client = client_ref()
+                    if batch_client is None:
+                        # Collected with its model, the searches still waiting in this batch fail together
+                        e_m = f"向量数据库连接已释放，无法检索collection：{collection_name}"
+                        logger_chatflow.error(e_m)
+                        raise RuntimeError(e_m)
+                    return await batch_client.search(
+                        collection_name=collection_name,
+                        data=vectors,
+                        filter=filter_expr,
+                        limit=limit,
+                        output_fields=list(output_fields),
+                        search_params=dict(search_params) if search_params else None,
+                        timeout=self.timeout
+                    )
+
+                batcher = AsyncMicroBatcher(search_batch, self.max_wait_ms, self.max_batch_size, name=f"milvus_search:{collection_name}")
+                per_client[key] = batcher
+            return batcher
+
+    async def search(self,
+                     client: AsyncMilvusClient,
+                     collection_name: str,
+                     query_emb: list[float],
+                     filter_expr: str,
+                     limit: int,
+                     output_fields: list[str],
+                     search_params: dict | None = None) -> list:
+        """Hits of one query vector, the same as results[0] of a single-vector search."""
+        if not self.enabled:
+            results = await client.search(collection_name=collection_name, data=[query_emb], filter=filter_expr, limit=limit,
+                                          output_fields=output_fields, search_params=search_params, timeout=self.timeout)
+            return results[0] if results else []
+        key = (collection_name, filter_expr, limit, tuple(output_fields), tuple(sorted(search_params.items())) if search_params else None)
+        return await self._get_batcher(client, key).submit(query_emb)
+
+    def forget(self, client: AsyncMilvusClient):
+        """Drop the batchers of a client that is being closed, later searches can not go through it."""
+        with self._lock:
+            self._batchers.pop(client, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            batchers = [batcher for per_client in self._batchers.values() for batcher in per_client.values()]
+        batches = sum(b.stats()["batches"] for b in batchers)
+        items = sum(b.stats()["items"] for b in batchers)
+        return {
+            "enabled": self.enabled,
+            "batchers": len(batchers),
+            "batches": batches,
+            "searches": items,
+            "avg_batch_size": round(items / batches, 3) if batches else 0.0,
+            "failed_batches": sum(b.stats()["failed_batches"] for b in batchers)
+        }
+
+# Shared by all the SemanticMatchers of the process
+milvus_search_batcher = MilvusSearchBatcher()
+
+#TODO: Shared Milvus clients
+class MilvusClientPool:
+    """
+    One AsyncMilvusClient per vector_db_url for the whole process, shared by every loaded model.
+    Each model acquires a reference when it is built and releases it when it is destroyed,
+    the client (and its gRPC channel) is closed when the last model using it goes away.
+    """
+    def __init__(self):
+        self._clients: dict[str, AsyncMilvusClient] = {}
+        self._refs: dict[str, int] = {}
+        self._urls: dict[int, str] = {} # id(client) -> vector_db_url
+        self._lock = threading.RLock()
+
+    def acquire(self, vector_db_url: str) -> AsyncMilvusClient:
+        with self._lock:
+            client = self._clients.get(vector_db_url)
+            if client is None:
+                client = AsyncMilvusClient(uri = vector_db_url, secure=False)
+                self._clients[vector_db_url] = client
+                self._refs[vector_db_url] = 0
+                self._urls[id(client)] = vector_db_url
+                logger_chatflow.info(f"向量数据库连接池：新建连接{vector_db_url}")
+            self._refs[vector_db_url] += 1
+            return client
+
+    async def release(self, client: AsyncMilvusClient | None):
+        """Give back one reference, the client is closed when nobody uses it any more."""
+        if client is None:
+            return
+        with self._lock:
+            vector_db_url = self._urls.get(id(client))
+            if vector_db_url is None or self._clients.get(vector_db_url) is not client:
+                vector_db_url = None # not from the pool, the caller owns it
+            else:
+                self._refs[vector_db_url] -= 1
+                if self._refs[vector_db_url] > 0:
+                    return
+                del self._clients[vector_db_url]
+                del self._refs[vector_db_url]
+                del self._urls[id(client)]
+        milvus_search_batcher.forget(client)
+        await client.close()
+        if vector_db_url:
+            logger_chatflow.info(f"向量数据库连接池：已关闭连接{vector_db_url}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "references": dict(self._refs)
+            }
+
+# Shared by all the models of the process
+milvus_client_pool = MilvusClientPool()
+
+#TODO: Sync manifests of the collections
+class MilvusSyncManifest:
+    """
+    Small local JSON file per (vector_db_url, collection) recording what the last successful sync wrote:
+    a content hash of the merged semantic phrases, embedding model and index settings, and the row count.
+    When the hash and the row count of the collection still match, the collection is already up to date
+    and the index check, id listing and diff of the sync are skipped.
+    """
+    def __init__(self, manifest_dir: str = MILVUS_MANIFEST_DIR):
+        self.manifest_dir = Path(manifest_dir)
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, vector_db_url: str, collection_name: str) -> Path:
+        url_hash = hashlib.sha256(vector_db_url.encode()).hexdigest()[:12]
+        return self.manifest_dir / f"{_UNSAFE_FILE_CHARS.sub('_', collection_name)}.{url_hash}.json"
+
+    def get(self, vector_db_url: str, collection_name: str) -> dict | None:
+        try:
+            with open(self._path(vector_db_url, collection_name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, vector_db_url: str, collection_name: str, content_hash: str, row_count: int):
+        path = self._path(vector_db_url, collection_name)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "collection_name": collection_name,
+                "content_hash": content_hash,
+                "row_count": row_count,
+                "updated_at": time.time()
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, path) # atomic, readers never see a half-written manifest
+
+    def delete(self, vector_db_url: str, collection_name: str):
+        self._path(vector_db_url, collection_name).unlink(missing_ok=True)
+
+# Shared by all the async launchers of the process
+milvus_sync_manifest = MilvusSyncManifest()
+
+def build_phrase_schema(dimension: int = 1024, partition_key: bool = False) -> CollectionSchema:
+    """
+    Schema of a phrase collection. With partition_key, the rows of many agents share the collection
+    and the tenant field (the agent's collection_name) decides the partition of each row.
+    """
+    schema = MilvusClient.create_schema(auto_id=False, enable_dynamic_field=True) # We manage IDs by ourselves
+    schema.add_field("id", DataType.INT64, is_primary=True)
+    schema.add_field("vector", DataType.FLOAT_VECTOR, dim=dimension)
+    schema.add_field("intention_id", DataType.VARCHAR, max_length=512)
+    schema.add_field("intention_name", DataType.VARCHAR, max_length=512)
+    schema.add_field("phrase", DataType.VARCHAR, max_length=4096)
+    if partition_key:
+        schema.add_field("tenant", DataType.VARCHAR, max_length=512, is_partition_key=True)
+    return schema
+
+DEFAULT_HNSW_PARAMS = {"M": 16, "efConstruction": 200}
+# Vector index types of the phrase collections and their extra build params, HNSW_SQ keeps int8 scalar-quantized vectors
+VECTOR_INDEX_TYPES = {
+    "HNSW": {},
+    "HNSW_SQ": {"sq_type": "SQ8"}
+}
+
+def hnsw_build_params(index_info: dict) -> dict:
+    """M and efConstruction of a described index, Milvus reports them either flat or under "params"."""
+    params = {**index_info, **(index_info.get("params") or {})}
+    return {key: int(params[key]) for key in DEFAULT_HNSW_PARAMS if key in params}
+
+def add_intention_id_index(index_params: IndexParams):
+    """Scalar index on intention_id, so that the filter of a search is an index lookup instead of a scan."""
+    index_params.add_index(field_name="intention_id", index_type="INVERTED")
+
+def has_intention_id_field(collection_info: dict) -> bool:
+    """Older collections keep intention_id as a dynamic field, which cannot have a scalar index."""
+    return any(field.get("name") == "intention_id" for field in collection_info.get("fields", []))
+
+async def ensure_collection_loaded(client: AsyncMilvusClient, collection_name: str, timeout: float = 30) -> bool:
+    """Load the collection unless it is loaded already, returns whether a load was needed."""
+    if await client.get_load_state(collection_name) == LoadState.Loaded:
+        return False
+    await client.load_collection(collection_name, timeout=timeout)
+    return True
+
+async def warm_load_collections(vector_db_url: str, collection_names: list[str], concurrency: int = MILVUS_WARM_LOAD_CONCURRENCY) -> int:
+    """
+    Load the given collections in parallel, e.g. those of all the models recovered at startup,
+    so that the models do not wait for their segment loads one after the other. Returns the number of collections loaded.
+    """
+    client = milvus_client_pool.acquire(vector_db_url)
+    semaphore = asyncio.Semaphore(concurrency)
+    start_time = time.time()
+
+    async def warm_load(collection_name: str) -> bool:
+        async with semaphore:
+            try:
+                if not await client.has_collection(collection_name):
+                    return False
+                return await ensure_collection_loaded(client, collection_name)
+            except Exception as e:
+                logger_chatflow.warning(f"预加载向量数据库collection：{collection_name}失败，模型初始化时再加载：{str(e)}")
+                return False
+
+    try:
+        loaded = sum(await asyncio.gather(*(warm_load(name) for name in collection_names)))
+    finally:
+        await milvus_client_pool.release(client)
+    logger_chatflow.info(f"向量数据库{vector_db_url}预加载完成：{len(collection_names)}个collection，新加载{loaded}个，耗时：{time.time() - start_time:.3f}秒")
+    return loaded
+
+#TODO: sync Milvus client
+class LaunchMilvus:
+    def __init__(self, vector_db_url: str, collection_name: str, intentions: list = None, knowledge: list = None,
+                 hnsw_params: dict | None = None, embedding_dim: int = EMBED_STORE_DIMENSION, index_type: str = "HNSW"):
+        self.client = MilvusClient(uri = vector_db_url, secure=False)
+        self.collection_name = collection_name
+        # Same index settings and Matryoshka truncation as LaunchMilvusAsync
+        self.hnsw_params = {**DEFAULT_HNSW_PARAMS, **(hnsw_params or {})}
+        self.embedding_dim = embedding_dim
+        self.index_type = index_type
+        self.merged_data = (intentions or []) + (knowledge or [])
+        self._ensure_collection_ready(self.merged_data)
+
+    def _generate_phrase_id(self, intention_id: str, phrase: str) -> int:
+        """Generate a deterministic ID for a phrase."""
+        hash_str = hashlib.sha256(f"{intention_id}:{phrase}".encode()).hexdigest()
+        # Convert to int and mask to 63 bits (safe for INT64)
+        return int(hash_str[:16], 16) & ((1 << 63) - 1)
+
+    def _ensure_collection_ready(self, merged_data: list = None):
+        """Ensure collection exists and is ready with data."""
+        # if collection doesn't exist, create it.
+        if not self.client.has_collection(self.collection_name):
+            self._create_collection()
+            self._create_hnsw_index()
+            logger_chatflow.info(f"已创建新的collection：{self.collection_name}和HNSW index")
+        else:
+            self._ensure_hnsw_index()
+            logger_chatflow.info(f"Collection：{self.collection_name}已存在，使用已有的HNSW index")
+
+        # Always upsert latest data
+        if merged_data:
+            self._upsert_intention_data(merged_data)
+        intention_filter_planner.register(self.collection_name, merged_data or [])
+
+        # Ensure the collection is loaded, a healthy collection usually still is
+        if self.client.get_load_state(self.collection_name).get("state") != LoadState.Loaded:
+            self.client.load_collection(self.collection_name, timeout=30)
+
+    def _create_collection(self):
+        """Create the Milvus collection schema."""
+        self.client.create_collection(
+            collection_name=self.collection_name,
+            schema=build_phrase_schema(self.embedding_dim) # at most 1024, the dimension of Qwen Embedding
+        )
+        logger_chatflow.info(f"已创建向量数据库collection：{self.collection_name}")
+
+    def _create_hnsw_index(self):
+        """Create HNSW index - called only once when collection is created."""
+        try:
+            # First, drop any existing indexes on the vector field
+            existing_indexes = self.client.list_indexes(self.collection_name)
+            if existing_indexes:
+                self.client.release_collection(self.collection_name) # indexes can only be dropped from a released collection
+            for index_name in existing_indexes:
+                try:
+                    self.client.drop_index(self.collection_name, index_name)
+                    logger_chatflow.info(f"向量数据库collection：{self.collection_name}已删除现有index：{index_name}")
+                except Exception as e:
+                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}删除index{index_name}时发生警告：{str(e)}")
+            # Create HNSW index
+            index_params = IndexParams()
+            index_params.add_index(
+                field_name="vector",
+                index_type=self.index_type,
+                metric_type="COSINE",
+                params={**self.hnsw_params, **VECTOR_INDEX_TYPES[self.index_type]}
+            )
+            if has_intention_id_field(self.client.describe_collection(self.collection_name)):
+                add_intention_id_index(index_params)
+            self.client.create_index(
+                collection_name=self.collection_name,
+                index_params=index_params
+            )
+            logger_chatflow.info(f"向量数据库collection：{self.collection_name}已创建向量数据库{self.index_type} index，参数：{self.hnsw_params}")
+        except MilvusException as e:
+            logger_chatflow.error(f"向量数据库collection：{self.collection_name}创建HNSW index时发生错误：{str(e)}")
+            raise RuntimeError(str(e))
+
+    def _ensure_hnsw_index(self):
+        """
+        Ensure HNSW index exists, create if missing or wrong type.
+        The indexes are only inspected, the collection is released only when an index has to be rebuilt or added.
+        """
+        try:
+            existing_indexes = self.client.list_indexes(self.collection_name)
+
+            if not existing_indexes:
+                # No index exists, create HNSW
+                self._create_hnsw_index()
+                return
+
+            # Check if HNSW index and intention_id index exist
+            hnsw_exists = False
+            hnsw_params_match = True
+            intention_id_index_exists = False
+            for index_name in existing_indexes:
+                try:
+                    index_info = self.client.describe_index(self.collection_name, index_name)
+                    if (index_info.get('index_type') in VECTOR_INDEX_TYPES and
+                            index_info.get('metric_type') == 'COSINE'):
+                        hnsw_exists = True
+                        built_params = hnsw_build_params(index_info)
+                        hnsw_params_match = (index_info.get('index_type') == self.index_type and
+                                             all(self.hnsw_params[key] == value for key, value in built_params.items()))
+                        logger_chatflow.info(f"向量数据库collection：{self.collection_name}{index_info.get('index_type')} index已存在，index名称为{index_name}，参数：{built_params}")
+                    elif index_info.get('field_name') == 'intention_id':
+                        intention_id_index_exists = True
+                except Exception as e:
+                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}检查index{index_name}时发生警告: {str(e)}")
+
+            if not hnsw_exists:
+                # Existing index is not HNSW, replace it
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}现有index不是HNSW类型，替换为HNSW")
+                self._create_hnsw_index()
+            elif not hnsw_params_match:
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}index已改为{self.index_type}，参数：{self.hnsw_params}，重建index")
+                self._create_hnsw_index()
+            elif not intention_id_index_exists and has_intention_id_field(self.client.describe_collection(self.collection_name)):
+                # Collections created before the intention_id index only miss the scalar index
+                index_params = IndexParams()
+                add_intention_id_index(index_params)
+                self.client.release_collection(self.collection_name)
+                self.client.create_index(collection_name=self.collection_name, index_params=index_params)
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已创建intention_id index")
+
+        except Exception as e:
+            logger_chatflow.error(f"向量数据库collection：{self.collection_name}检查HNSW index时发生错误：{str(e)}")
+            raise RuntimeError(str(e))
+
+    def _upsert_intention_data(self, merged_data: list):
+        """
+        Upsert intention data - index automatically handles new vectors.
+        Stored embeddings are upserted right away, the other phrases are embedded in chunks by a few workers
+        and each chunk is upserted as soon as its embeddings are back.
+        """
+        start_time = time.time()
+        rows = {}
+        for item in merged_data:
+            intention_id = item.get("intention_id")
+            intention_name = item.get("intention_name")
+            for phrase in item.get("semantic", []):
+                if phrase.strip():  # skip empty
+                    phrase_id = self._generate_phrase_id(intention_id, phrase)
+                    rows[phrase_id] = {
+                        "id": phrase_id,
+                        "intention_id": intention_id,
+                        "intention_name": intention_name,
+                        "phrase": phrase
+                    }
+
+        if not rows:
+            logger_chatflow.info(f"没有问法短语插入向向量数据库collection：{self.collection_name}")
+            return
+
+        # phrases embedded before, by any model or an earlier run, are read from the on-disk store
+        rows = list(rows.values())
+        stored = phrase_embedding_store.get_many([row["phrase"] for row in rows])
+        ready, missing = [], []
+        for row, embedding in zip(rows, stored):
+            if embedding is None:
+                missing.append(row)
+            else:
+                # The store keeps the full vectors, the collection gets them truncated to its dimension
+                ready.append(row | {"vector": truncate_embeddings(embedding, self.embedding_dim).tolist()})
+        for i in range(0, len(ready), EMBED_SYNC_CHUNK_SIZE):
+            self.client.upsert(collection_name=self.collection_name, data=ready[i:i + EMBED_SYNC_CHUNK_SIZE])
+
+        # Upsert (insert or replace) every chunk as soon as it is embedded
+        chunks = [missing[i:i + EMBED_SYNC_CHUNK_SIZE] for i in range(0, len(missing), EMBED_SYNC_CHUNK_SIZE)]
+        with ThreadPoolExecutor(max_workers=EMBED_SYNC_WORKERS) as executor:
+            futures = {executor.submit(embed_documents, [row["phrase"] for row in chunk]): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    embeddings = future.result()
+                except Exception as e:
+                    logger_chatflow.error(f"向量数据库collection：{self.collection_name}批量嵌入{len(chunk)}条问法短语失败：{str(e)}")
+                    raise
+                for embedding in embeddings:
+                    if len(embedding)!=EMBED_STORE_DIMENSION:
+                        e_m = f"向量数据库collection：{self.collection_name}向量为度应为{EMBED_STORE_DIMENSION}，目前为{len(embedding)}"
+                        logger_chatflow.error(e_m)
+                        raise ValueError(e_m)
+                phrase_embedding_store.put_many([row["phrase"] for row in chunk], embeddings)
+                vectors = truncate_embeddings(embeddings, self.embedding_dim)
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    data=[row | {"vector": vector.tolist()} for row, vector in zip(chunk, vectors)]
+                )
+
+        elapsed = time.time() - start_time
+        logger_chatflow.info(
+            f"更新{len(rows)}条问法短语到向量数据库collection：{self.collection_name}，"
+            f"其中新嵌入{len(missing)}条，耗时{elapsed:.3f}秒，{len(rows) / max(elapsed, 1e-6):.1f}条/秒"
+        )
+
+    def get_index_info(self):
+        """Get information about current index."""
+        try:
+            existing_indexes = self.client.list_indexes(self.collection_name)
+            index_info_list = []
+            for index_name in existing_indexes:
+                index_info = self.client.describe_index(self.collection_name, index_name)
+                index_info_list.append({
+                    'name': index_name,
+                    'info': index_info
+                })
+            return index_info_list
+        except Exception as e:
+            logger_chatflow.error(f"向量数据库collection：{self.collection_name}获取index信息时发生错误：{str(e)}")
+            return []
+
+#TODO: async Milvus client
+class LaunchMilvusAsync:
+    def __init__(
+            self,
+            vector_db_url: str,
+            collection_name: str,
+            intentions: list|None = None,
+            knowledge: list|None = None,
+            layout: str = "collection",
+            hnsw_params: dict | None = None,
+            embedding_dim: int = EMBED_STORE_DIMENSION,
+            index_type: str = "HNSW"
+    ):
+        self.client = milvus_client_pool.acquire(vector_db_url) # shared with the other models on the same Milvus
+        self.vector_db_url = vector_db_url
+        if layout == "shared":
+            # The agent is a partition of the shared collection, every query and count is scoped to it
+            self.collection_name = MILVUS_SHARED_COLLECTION_NAME
+            self.tenant = collection_name
+            self.tenant_filter = f"tenant == {json.dumps(collection_name)}"
+        else:
+            self.collection_name = collection_name
+            self.tenant = None
+            self.tenant_filter = ""
+        self.manifest_name = f"{self.collection_name}.{self.tenant}" if self.tenant else self.collection_name
+        self.hnsw_params = {**DEFAULT_HNSW_PARAMS, **(hnsw_params or {})}
+        # Phrase vectors are truncated to embedding_dim before they are written (Matryoshka), the index may quantize them
+        self.embedding_dim = embedding_dim
+        self.index_type = index_type
+        self.merged_data = (intentions or []) + (knowledge or [])
+        self.embedding_store = phrase_embedding_store  # on-disk embeddings, shared across models and restarts
+        self._stats = {
+            "embeddings_generated": 0,
+            "embeddings_cached": 0,
+            "total_phrases_processed": 0
+        }
+        self.limit = 10000 # limit for collection client query
+
+    def _generate_phrase_id(self, intention_id: str, phrase: str) -> int:
+        """Generate a deterministic ID for a phrase, unique across the agents of a shared collection."""
+        key = f"{intention_id}:{phrase}" if self.tenant is None else f"{self.tenant}\x00{intention_id}:{phrase}"
+        hash_str = hashlib.sha256(key.encode()).hexdigest()
+        # Convert to int and mask to 63 bits (safe for INT64)
+        return int(hash_str[:16], 16) & ((1 << 63) - 1)
+
+    def _scoped(self, expr: str = "") -> str:
+        """Restrict a filter expression to the rows of this agent."""
+        if not self.tenant_filter:
+            return expr
+        return f"{self.tenant_filter} and ({expr})" if expr else self.tenant_filter
+
+    async def ensure_collection_ready(self):
+        """Ensure collection exists and is ready with data."""
+        start_time = time.time()
+        logger_chatflow.info(f"开始处理向量数据库collection：{self.collection_name}" + (f"，分区键：{self.tenant}" if self.tenant else ""))
+        content_hash = self._content_hash(self.merged_data)
+
+        # if collection doesn't exist, create it.
+        has_collection = await self.client.has_collection(self.collection_name)  # AWAIT
+        manifest = milvus_sync_manifest.get(self.vector_db_url, self.manifest_name)
+        if has_collection and not (manifest and manifest.get("content_hash") == content_hash):
+            has_collection = await self._ensure_dimension()
+        if not has_collection:
+            milvus_sync_manifest.delete(self.vector_db_url, self.manifest_name)
+            if await self._create_collection():
+                await self._create_hnsw_index()
+            logger_chatflow.info(f"已创建新的向量数据库collection：{self.collection_name}和HNSW index")
+            await self._load_collection()
+            # insert latest data
+            if self.merged_data:
+                await self._insert_all_data(self.merged_data)
+            await self._save_manifest(content_hash)
+        else:
+            await self._load_collection()
+            if await self._manifest_matches(content_hash):
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}问法短语与上次同步一致，跳过索引检查和增量同步")
+            else:
+                # A sync that stops halfway must not leave the old manifest behind
+                milvus_sync_manifest.delete(self.vector_db_url, self.manifest_name)
+                await self._ensure_hnsw_index()
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已存在，使用已有的HNSW index")
+                # only reloads when an index had to be rebuilt
+                await self._load_collection()
+                # update with latest data
+                if self.merged_data:
+                    await self._incremental_sync_data(self.merged_data)
+                await self._save_manifest(content_hash)
+
+        # Check duplicates
+        # await self.cleanup_duplicate_phrases()
+
+        # The filter plans of the semantic matchers depend on the intentions now in the collection
+        intention_filter_planner.register(self.tenant or self.collection_name, self.merged_data, self.collection_name, self.tenant_filter)
+
+        elapsed = time.time() - start_time
+        logger_chatflow.info(f"向量数据库collection: {self.collection_name}处理完成，耗时：{elapsed:.3f}秒")
+
+    async def _ensure_dimension(self) -> bool:
+        """
+        Check the vector dimension of the existing collection against embedding_dim.
+        An agent's own collection is dropped when the dimension changed, as every vector has to be rewritten anyway,
+        returns whether the collection still exists.
+        """
+        dimension = None
+        for field in (await self.client.describe_collection(self.collection_name)).get("fields", []):
+            if field.get("name") == "vector":
+                dimension = int((field.get("params") or {}).get("dim", 0)) or None
+        if dimension is None or dimension == self.embedding_dim:
+            return True
+        if self.tenant is not None:
+            e_m = f"共享向量数据库collection：{self.collection_name}的向量维度为{dimension}，与{self.tenant}配置的向量维度{self.embedding_dim}不一致"
+            logger_chatflow.error(e_m)
+            raise ValueError(e_m)
+        logger_chatflow.warning(f"向量数据库collection：{self.collection_name}向量维度由{dimension}改为{self.embedding_dim}，重建collection")
+        await self.client.drop_collection(self.collection_name)
+        return False
+
+    async def _load_collection(self):
+        try:
+            if await ensure_collection_loaded(self.client, self.collection_name):
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已加载到内存")
+        except Exception as e:
+            logger_chatflow.warning(f"加载向量数据库collection：{self.collection_name}失败，尝试继续：{str(e)}")
+
+    def _content_hash(self, merged_data: list[dict]) -> str:
+        """Hash of everything a sync writes: the phrases with their intentions, the embedding model and the index settings."""
+        hasher = hashlib.sha256(json.dumps({
+            "model_name": EMBED_MODEL_NAME,
+            "dimension": self.embedding_dim,
+            "tenant": self.tenant,
+            "index": {"index_type": self.index_type, "metric_type": "COSINE", **self.hnsw_params}
+        }, sort_keys=True).encode())
+        for item in merged_data:
+            intention_id = item.get("intention_id")
+            intention_name = item.get("intention_name")
+            for phrase in item.get("semantic") or []:
+                if phrase.strip():
+                    hasher.update(f"{intention_id}\x00{intention_name}\x00{phrase}\x01".encode())
+        return hasher.hexdigest()
+
+    async def _count_rows(self) -> int:
+        results = await self.client.query(collection_name=self.collection_name, filter=self._scoped(), output_fields=["count(*)"],
+                                          consistency_level="Strong") # include the rows just written
+        return int(results[0]["count(*)"]) if results else 0
+
+    async def _manifest_matches(self, content_hash: str) -> bool:
+        """The last sync wrote the same content, and the collection still has the rows it wrote."""
+        manifest = milvus_sync_manifest.get(self.vector_db_url, self.manifest_name)
+        if not manifest or manifest.get("content_hash") != content_hash:
+            return False
+        try:
+            row_count = await self._count_rows()
+        except Exception as e:
+            logger_chatflow.warning(f"向量数据库collection：{self.collection_name}统计记录数失败，执行完整同步：{str(e)}")
+            return False
+        if row_count != manifest.get("row_count"):
+            logger_chatflow.warning(f"向量数据库collection：{self.collection_name}记录数{row_count}与上次同步的{manifest.get('row_count')}不一致，执行完整同步")
+            return False
+        return True
+
+    async def _save_manifest(self, content_hash: str):
+        """Record the sync, only when every phrase made it into the collection."""
+        try:
+            row_count = await self._count_rows()
+            expected_count = len(self._get_target_phrase_ids(self.merged_data))
+            if row_count != expected_count:
+                logger_chatflow.warning(f"向量数据库collection：{self.collection_name}记录数{row_count}，应为{expected_count}，不保存同步记录")
+                return
+            milvus_sync_manifest.put(self.vector_db_url, self.manifest_name, content_hash, row_count)
+        except Exception as e:
+            logger_chatflow.warning(f"向量数据库collection：{self.collection_name}保存同步记录失败，下次启动将重新同步：{str(e)}")
+
+    async def _create_collection(self) -> bool:
+        """Create the Milvus collection schema, returns False when the shared collection was created by another agent meanwhile."""
+        shared = self.tenant is not None
+        try:
+            await self.client.create_collection(
+                collection_name=self.collection_name,
+                schema=build_phrase_schema(self.embedding_dim, partition_key=shared), # at most 1024, the Qwen Embedding 0.6B dimension
+                **({"num_partitions": MILVUS_SHARED_NUM_PARTITIONS} if shared else {})
+            )
+        except MilvusException:
+            # Another agent may have just created the shared collection
+            if not (shared and await self.client.has_collection(self.collection_name)):
+                raise
+            return False
+        logger_chatflow.info(f"已创建向量数据库collection：{self.collection_name}")
+        return True
+
+    async def _create_hnsw_index(self):
+        """Create HNSW index - called only once when collection is created."""
+        try:
+            # First, drop any existing indexes on the vector field
+            existing_indexes = await self.client.list_indexes(self.collection_name)
+            if existing_indexes:
+                await self.client.release_collection(self.collection_name) # indexes can only be dropped from a released collection
+            for index_name in existing_indexes:
+                try:
+                    await self.client.drop_index(self.collection_name, index_name)
+                    logger_chatflow.info(f"向量数据库collection：{self.collection_name}已删除现有index：{index_name}")
+                except Exception as e:
+                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}删除index {index_name}时发生警告：{str(e)}")
+            # Create HNSW index
+            index_params = IndexParams()
+            index_params.add_index(
+                field_name="vector",
+                index_type=self.index_type,
+                metric_type="COSINE",
+                params={**self.hnsw_params, **VECTOR_INDEX_TYPES[self.index_type]}
+            )
+            if has_intention_id_field(await self.client.describe_collection(self.collection_name)):
+                add_intention_id_index(index_params)
+            await self.client.create_index(
+                collection_name=self.collection_name,
+                index_params=index_params
+            )
+            logger_chatflow.info(f"已创建向量数据库collection：{self.collection_name} {self.index_type} index，参数：{self.hnsw_params}")
+        except MilvusException as e:
+            logger_chatflow.info(f"创建向量数据库collection：{self.collection_name} HNSW index时发生错误：{str(e)}")
+            raise RuntimeError(str(e))
+
+    async def _ensure_hnsw_index(self):
+        """确保HNSW索引存在，不存在则创建。只检查索引，需要重建或补建索引时才释放collection"""
+        try:
+            existing_indexes = await self.client.list_indexes(self.collection_name)
+
+            hnsw_exists = False
+            hnsw_params_match = True
+            intention_id_index_exists = False
+            for index_name in existing_indexes:
+                try:
+                    index_info = await self.client.describe_index(self.collection_name, index_name)
+                    if (index_info.get('index_type') in VECTOR_INDEX_TYPES and index_info.get('metric_type') == 'COSINE'):
+                        hnsw_exists = True
+                        built_params = hnsw_build_params(index_info)
+                        hnsw_params_match = (index_info.get('index_type') == self.index_type and
+                                             all(self.hnsw_params[key] == value for key, value in built_params.items()))
+                        logger_chatflow.info(f"向量数据库collection：{self.collection_name} {index_info.get('index_type')} index已存在，索引名称为{index_name}，参数：{built_params}")
+                    elif index_info.get('field_name') == 'intention_id':
+                        intention_id_index_exists = True
+                except Exception as e:
+                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}检查索引{index_name}时发生警告：{str(e)}")
+
+            if not hnsw_exists:
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}现有索引不是HNSW类型，替换为HNSW")
+                await self._create_hnsw_index()
+            elif not hnsw_params_match and self.tenant is None:
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}索引已改为{self.index_type}，参数：{self.hnsw_params}，重建索引")
+                await self._create_hnsw_index()
+            elif not hnsw_params_match:
+                # The index of the shared collection belongs to every agent in it, one agent's settings do not rebuild it
+                logger_chatflow.warning(f"向量数据库collection：{self.collection_name}为共享collection，不按{self.tenant}的索引设置{self.index_type}，{self.hnsw_params}重建索引")
+            elif not intention_id_index_exists and has_intention_id_field(await self.client.describe_collection(self.collection_name)):
+                # Collections created before the intention_id index only miss the scalar index
+                index_params = IndexParams()
+                add_intention_id_index(index_params)
+                await self.client.release_collection(self.collection_name)
+                await self.client.create_index(collection_name=self.collection_name, index_params=index_params)
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已创建intention_id索引")
+
+        except Exception as e:
+            logger_chatflow.error(f"向量数据库collection：{self.collection_name}检查HNSW索引时发生错误：{str(e)}")
+            raise RuntimeError(str(e))
+
+    async def _get_existing_phrase_ids_with_retry(self, max_retries: int = 3) -> np.ndarray:
+        """带重试机制的获取现有ID"""
+        for attempt in range(max_retries):
+            try:
+                return await self._get_existing_phrase_ids()
+            except Exception as e:
+                logger_chatflow.warning(f"向量数据库collection：{self.collection_name}获取现有ID失败 (尝试 {attempt + 1}/{max_retries})：{e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)  # 指数退避
+                else:
+                    logger_chatflow.error(f"向量数据库collection：{self.collection_name}获取现有ID最终失败：{e}")
+                    raise
+        return np.empty(0, dtype=np.int64)
+
+    async def _iter_existing_phrase_ids(self):
+        """
+        Pages of the phrase ids in the collection, in id order.
+        AsyncMilvusClient has no query_iterator, so this pages the same way it does:
+        iterator mode returns each page sorted by primary key, and the next page starts after the last id.
+        """
+        cursor = -1 # phrase ids are non-negative, this also skips the metadata sentinel -1
+        while True:
+            results = await self.client.query(
+                collection_name=self.collection_name,
+                filter=self._scoped(f"id > {cursor}"),
+                output_fields=["id"],
+                limit=self.limit,
+                iterator="True",
+                reduce_stop_for_best="True"
+            )
+            if not results:
+                return
+            page = np.fromiter((r["id"] for r in results), dtype=np.int64, count=len(results))
+            yield page
+            if len(results) < self.limit:
+                return
+            cursor = int(page.max())
+
+    async def _get_existing_phrase_ids(self) -> np.ndarray:
+        """Sorted int64 array of all the phrase ids in the collection, 8 bytes per phrase."""
+        pages = [page async for page in self._iter_existing_phrase_ids()]
+        return np.unique(np.concatenate(pages)) if pages else np.empty(0, dtype=np.int64)
+
+    def _iter_target_rows(self, merged_data: list[dict]):
+        """(phrase_id, intention_id, intention_name, phrase) of every non-empty phrase, generated on the fly."""
+        for item in merged_data:
+            intention_id = item.get("intention_id")
+            intention_name = item.get("intention_name")
+            for phrase in item.get("semantic") or []:
+                if phrase.strip():
+                    yield self._generate_phrase_id(intention_id, phrase), intention_id, intention_name, phrase
+
+    def _get_target_phrase_ids(self, merged_data: list[dict]) -> np.ndarray:
+        """Sorted int64 array of the phrase ids the collection should contain."""
+        target_phrase_ids = np.unique(np.fromiter((row[0] for row in self._iter_target_rows(merged_data)), dtype=np.int64))
+        logger_chatflow.info(f"向量数据库collection：{self.collection_name}目标数据包含{len(target_phrase_ids)}条短语")
+        return target_phrase_ids
+
+    async def _incremental_sync_data(self, merged_data: list[dict]):
+        """Incrementally sync data: insert new, delete obsolete."""
+        try:
+            logger_chatflow.info(f"向量数据库collection：{self.collection_name}开始增量同步数据...")
+            target_phrase_ids = self._get_target_phrase_ids(merged_data)
+            existing_phrase_ids = await self._get_existing_phrase_ids_with_retry()
+            logger_chatflow.info(f"向量数据库collection：{self.collection_name}现有数据包含{len(existing_phrase_ids)}条短语")
+
+            # Both arrays are sorted and unique, the diffs are linear merges instead of Python set operations
+            to_delete = np.setdiff1d(existing_phrase_ids, target_phrase_ids, assume_unique=True)
+            to_insert = np.setdiff1d(target_phrase_ids, existing_phrase_ids, assume_unique=True)
+
+            if len(to_delete):
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}删除{len(to_delete)}条过期问法短语")
+                await self._batch_delete_phrases(to_delete.tolist())
+
+            if len(to_insert):
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}插入{len(to_insert)}条新问法短语")
+                await self._stream_insert(merged_data, to_insert)
+            else:
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}问法短语已同步，无需更新")
+
+            self._log_sync_stats(len(existing_phrase_ids), len(to_delete), len(to_insert), len(target_phrase_ids))
+
+        except Exception as e:
+            logger_chatflow.error(f"向量数据库collection：{self.collection_name}更新失败：{str(e)}")
+            raise
+
+    async def _batch_delete_phrases(self, phrase_ids: list[int], batch_size: int = 1000):
+        """Batch delete phrases (fallback to chunked deletion on failure)."""
+        if not phrase_ids:
+            return
+        try:
+            if len(phrase_ids)<=batch_size: # Try in one go for small amount deletion
+                await self.client.delete(collection_name=self.collection_name, ids=phrase_ids)
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}一次性删除{len(phrase_ids)}条短语")
+            else: # Delete in batches for large amount
+                for i in range(0, len(phrase_ids), batch_size):
+                    batch = phrase_ids[i:i + batch_size]
+                    await self.client.delete(collection_name=self.collection_name, ids=batch)
+                    logger_chatflow.info(f"向量数据库collection：{self.collection_name}正在分批删除，已删除批次 {i // batch_size + 1}: {len(batch)} 条")
+                    await asyncio.sleep(0.01)  # Delay a bit to reduce server pressure
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}分批删除完成，共{len(phrase_ids)}条")
+        except Exception as e:
+            logger_chatflow.warning(f"向量数据库collection：{self.collection_name}删除失败，尝试降级方案：{str(e)}")
+            await self._delete_with_filter_fallback(phrase_ids)
+
+    async def _delete_with_filter_fallback(self, phrase_ids: list[int]):
+        try:
+            id_str = ", ".join(str(pid) for pid in phrase_ids)
+            filter_expr = f"id in [{id_str}]"
+            await self.client.delete(
+                collection_name=self.collection_name,
+                filter=filter_expr
+            )
+        except Exception as e:
+            logger_chatflow.error(f"向量数据库collection：{self.collection_name} filter删除也失败，尝试逐个删除：{str(e)}")
+            # Delete one by one
+            success_count = 0
+            for pid in phrase_ids:
+                try:
+                    await self.client.delete(
+                        collection_name=self.collection_name,
+                        filter=f"id == {pid}"
+                    )
+                    success_count += 1
+                except Exception:
+                    logger_chatflow.warning(f"向量数据库collection：{self.collection_name}无法删除phrase_id {pid}")
+            logger_chatflow.info(f"向量数据库collection：{self.collection_name}逐个删除完成：{success_count}/{len(phrase_ids)}成功")
+
+    def _iter_insert_batches(self, merged_data: list[dict], phrase_ids: np.ndarray, batch_size: int):
+        """Batches of the rows whose id is in the sorted phrase_ids, each id once, without building the whole dataset."""
+        pending = np.ones(len(phrase_ids), dtype=bool)
+        rows = self._iter_target_rows(merged_data)
+        batch = []
+        while True:
+            candidates = list(islice(rows, batch_size))
+            if not candidates:
+                break
+            ids = np.fromiter((row[0] for row in candidates), dtype=np.int64, count=len(candidates))
+            positions = np.minimum(np.searchsorted(phrase_ids, ids), len(phrase_ids) - 1)
+            wanted = phrase_ids[positions] == ids
+            for (phrase_id, intention_id, intention_name, phrase), position, is_wanted in zip(candidates, positions, wanted):
+                if not is_wanted or not pending[position]:
+                    continue
+                pending[position] = False
+                row = {
+                    "id": phrase_id,
+                    "intention_id": intention_id,
+                    "intention_name": intention_name,
+                    "phrase": phrase
+                }
+                if self.tenant is not None:
+                    row["tenant"] = self.tenant
+                batch.append(row)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    async def _embed_batch(self, rows: list[dict]) -> list[dict]:
+        """Attach the vectors to a batch of rows: the stored ones, and one embedding request for the rest."""
+        phrases = [row["phrase"] for row in rows]
+        vectors = await self.embedding_store.aget_many(phrases)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            try:
+                embeddings = await aembed_documents_array([phrases[i] for i in missing])
+                if embeddings.shape != (len(missing), EMBED_STORE_DIMENSION):
+                    raise ValueError(f"向量维度错误: {embeddings.shape}")
+                await self.embedding_store.aput_many([phrases[i] for i in missing], embeddings)
+                for i, embedding in zip(missing, embeddings):
+                    vectors[i] = embedding
+                self._stats["embeddings_generated"] += len(missing)
+            except Exception as e:
+                logger_chatflow.error(f"向量数据库collection：{self.collection_name}嵌入处理{len(missing)}条短语失败，跳过：{e}")
+        self._stats["total_phrases_processed"] += len(rows)
+        self._stats["embeddings_cached"] += len(rows) - len(missing)
+        # The store keeps the full vectors, the collection gets them truncated to its dimension
+        rows = [row for row, vector in zip(rows, vectors) if vector is not None]
+        if not rows:
+            return []
+        vectors = truncate_embeddings([vector for vector in vectors if vector is not None], self.embedding_dim)
+        return [{**row, "vector": vector.tolist()} for row, vector in zip(rows, vectors)]
+
+    async def _stream_insert(self, merged_data: list[dict], phrase_ids: np.ndarray) -> int:
+        """
+        Embed and insert the given phrases as a pipeline: rows are generated batch by batch,
+        up to EMBED_SYNC_WORKERS batches are embedded at the same time, and embedded batches wait
+        for the insert stage in a queue of MILVUS_SYNC_QUEUE_SIZE, so memory does not grow with the knowledge base.
+        Returns the number of rows inserted.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=MILVUS_SYNC_QUEUE_SIZE)
+        inserted = 0
+
+        async def insert_stage():
+            nonlocal inserted
+            while (batch := await queue.get()) is not None:
+                try:
+                    await self.client.insert(collection_name=self.collection_name, data=batch)
+                    inserted += len(batch)
+                    logger_chatflow.debug(f"向量数据库collection：{self.collection_name}已插入{inserted}条")
+                except Exception as e:
+                    logger_chatflow.error(f"向量数据库collection：{self.collection_name}批次插入失败：{str(e)}")
+
+        inserter = asyncio.create_task(insert_stage())
+        embedding_tasks = deque()
+        try:
+            for rows in self._iter_insert_batches(merged_data, phrase_ids, EMBED_SYNC_CHUNK_SIZE):
+                embedding_tasks.append(asyncio.create_task(self._embed_batch(rows)))
+                if len(embedding_tasks) >= EMBED_SYNC_WORKERS:
+                    await queue.put(await embedding_tasks.popleft())
+            while embedding_tasks:
+                await queue.put(await embedding_tasks.popleft())
+            await queue.put(None)
+            await inserter
+        finally:
+            for task in (*embedding_tasks, inserter):
+                task.cancel()
+        return inserted
+
+    async def _insert_all_data(self, merged_data: list[dict]):
+        """Insert all data on first-time collection creation."""
+        logger_chatflow.info(f"向量数据库collection：{self.collection_name}开始初始数据插入...")
+        start_time = time.time()
+        target_phrase_ids = self._get_target_phrase_ids(merged_data)
+        inserted = await self._stream_insert(merged_data, target_phrase_ids)
+        elapsed = time.time() - start_time
+        logger_chatflow.info(f"向量数据库collection：{self.collection_name}初始数据插入完成，共 {inserted}/{len(target_phrase_ids)}条短语，"
+                             f"耗时：{elapsed:.3f}秒，{inserted / max(elapsed, 1e-6):.1f}条/秒")
+
+    def _log_sync_stats(self, existing_count: int, deleted_count: int, inserted_count: int, final_count: int):
+        """Log sync statistics."""
+        # Calculate cache hit rate
+        total_embeddings = self._stats["embeddings_generated"] + self._stats["embeddings_cached"]
+        cache_hit_rate = 0
+        if total_embeddings > 0:
+            cache_hit_rate = self._stats["embeddings_cached"] / total_embeddings * 100
+
+        logger_chatflow.info(
+            f"向量数据库collection：{self.collection_name}更新数据同步统计:\n"
+            f"  原有记录: {existing_count}\n"
+            f"  删除记录: {deleted_count}\n"
+            f"  新增记录: {inserted_count}\n"
+            f"  最终记录: {final_count}\n"
+            f"  变化率: {(deleted_count + inserted_count) / max(existing_count, 1) * 100:.1f}%\n"
+            f"  嵌入性能统计:\n"
+            f"    总处理短语: {self._stats['total_phrases_processed']}\n"
+            f"    生成嵌入: {self._stats['embeddings_generated']}\n"
+            f"    缓存命中: {self._stats['embeddings_cached']}\n"
+            f"    缓存命中率: {cache_hit_rate:.1f}%"
+        )
+
+    async def get_index_info(self):
+        """Get information about current index."""
+        try:
+            existing_indexes = await self.client.list_indexes(self.collection_name)
+            return [
+                {
+                    'name': index_name,
+                    'info': await self.client.describe_index(self.collection_name, index_name)
+                }
+                for index_name in existing_indexes
+            ]
+        except Exception as e:
+            logger_chatflow.error(f"获取index信息时发生错误：{e}")
+            return []
+
+    async def cleanup_duplicate_phrases(self):
+        """Clean duplicated phrases"""
+        try:
+            await self.client.load_collection(self.collection_name, timeout=30)
+            offset = 0
+            all_data = []
+            while True:
+                results = await self.client.query(
+                    collection_name=self.collection_name,
+                    filter=self._scoped(),
+                    output_fields=["id", "phrase", "intention_id"],
+                    limit=self.limit,
+                    offset=offset
+                )
+                if not results:
+                    break
+                all_data += results
+                if len(results) < self.limit:
+                    break
+                offset += self.limit
+
+            if not all_data:
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}为空，无需检查重复记录")
+                return
+
+            # find duplicates
+            seen = {}
+            duplicates = []
+
+            for item in all_data:
+                key = f"{item['intention_id']}:{item['phrase']}"
+                if key in seen:
+                    duplicates.append(item['id'])
+                else:
+                    seen[key] = item['id']
+
+            if duplicates:
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}发现{len(duplicates)}条重复记录，正在清理...")
+                await self.client.delete(
+                    collection_name=self.collection_name,
+                    ids=duplicates
+                )
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}已清理{len(duplicates)}条重复记录")
+            else:
+                logger_chatflow.info(f"向量数据库collection：{self.collection_name}未发现重复记录")
+
+        except Exception as e:
+            logger_chatflow.error(f"向量数据库collection：{self.collection_name}清理重复数据失败: {str(e)}")
+
+async def initialize_milvus_async(
+        vector_db_url: str,
+        collection_name: str,
+        intentions: list|None = None,
+        knowledge: list|None = None,
+        layout: str = "collection",
+        hnsw_params: dict | None = None,
+        embedding_dim: int = EMBED_STORE_DIMENSION,
+        index_type: str = "HNSW"
+) -> AsyncMilvusClient:
+    """Returns a client acquired from milvus_client_pool, give it back with milvus_client_pool.release when the model is destroyed."""
+    milvus_launcher = LaunchMilvusAsync(vector_db_url, collection_name, intentions, knowledge, layout, hnsw_params, embedding_dim, index_type)
+    try:
+        await milvus_launcher.ensure_collection_ready()  # ONE-TIME SETUP
+    except Exception:
+        await milvus_client_pool.release(milvus_launcher.client)
+        raise
+    return milvus_launcher.client
+
+# test
+if __name__ == "__main__":
+    async def test_phrase_id():
+        # Test deterministic ID generation (no client needed)
+        launcher = LaunchMilvusAsync("http://127.0.0.1:19530", "test")
+        id1 = launcher._generate_phrase_id("001", "good")
+        id2 = launcher._generate_phrase_id("002", "good")
+        id3 = launcher._generate_phrase_id("001", "bad")
+        id4 = launcher._generate_phrase_id("002", "bad")
+        id5 = launcher._generate_phrase_id("001", "good")
+
+        print(f"id1: {id1}")
+        print(f"id2: {id2}")
+        print(f"id3: {id3}")
+        print(f"id4: {id4}")
+        print(f"id5: {id5}")
+
+        # Now test full async flow (optional)
+        await launcher.ensure_collection_ready()
+        await milvus_client_pool.release(launcher.client)
+
     asyncio.run(test_phrase_id())
\ No newline at end of file
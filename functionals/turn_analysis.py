@@ -0,0 +1,105 @@
+import asyncio
+import re
+import time
+from typing import Any
+from functionals.embedding_cache import embedding_cache, normalize_text
+from functionals.embedding_functions import aembed_query
+
+# Hesitation sounds of the ASR transcript at both ends of an utterance, they carry no intention.
+# Only a filler standing alone is removed, set apart from the rest by punctuation or a space.
+# 额 and 那个 are not fillers here, they also begin or end words (额度, 余额, 那个人)
+_ASR_FILLERS = re.compile(r"^(?:嗯|呃|啊|哦|噢|唔|诶)+(?:[\s，,。.、！!？?]+|$)|(?:^|[\s，,。.、]+)(?:嗯|呃|啊|哦|噢|唔)+$")
+
+def strip_fillers(text: str) -> str:
+    """Remove the ASR fillers at both ends, an utterance made only of fillers is kept as it is."""
+    stripped = _ASR_FILLERS.sub("", text)
+    return stripped or text
+
+def normalize_turn_text(text: str) -> str:
+    """The normalized form of TurnAnalysis, for other texts of the conversation (e.g. the history in cache keys)."""
+    return strip_fillers(normalize_text(text))
+
+#TODO: What one user turn is analyzed into, shared by the matchers of the intention node
+class TurnAnalysis:
+    """
+    Built once per IntentionNode.__call__ from the last user input, and handed to every matching stage.
+    - text: the user input as received, used by the keyword matchers and in the LLM prompt
+    - normalized: NFKC folding, lower case, collapsed spaces, edge punctuation and ASR fillers removed,
+      the text that is embedded, and the key of the caches
+    - keyword hits are computed once per matcher, the embedding once per turn, both only when a stage asks for them
+    - timings: milliseconds spent per stage, for the logs
+    """
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.normalized = normalize_turn_text(self.text)
+        self.timings: dict[str, float] = {}
+        self.embedding_cached: bool | None = None # whether the embedding came from the shared cache
+        self.llm_prompt_tokens = 0 # prompt tokens of the LLM stage, and how many of them hit the prefix cache
+        self.llm_cached_tokens = 0
+        self.llm_cache: str | None = None # where the LLM decision came from: local, redis, coalesced or computed
+        self._keyword_hits: dict[int, dict[str, dict[str, Any]]] = {}
+        self._embedding_task: asyncio.Task | None = None
+
+    @classmethod
+    def of(cls, turn: "TurnAnalysis | str") -> "TurnAnalysis":
+        """Callers may still pass the raw user input, it is analyzed on the spot."""
+        return turn if isinstance(turn, TurnAnalysis) else cls(turn)
+
+    def keyword_hits(self, matcher) -> dict[str, dict[str, Any]]:
+        """analyze_sentence of a keyword matcher (or matcher view) on this turn, computed once per matcher."""
+        hits = self._keyword_hits.get(id(matcher))
+        if hits is None:
+            start = time.perf_counter()
+            hits = matcher.analyze_sentence(self.text)
+            self._keyword_hits[id(matcher)] = hits
+            self.add_timing("keyword_ms", start)
+        return hits
+
+    async def embedding(self) -> list[float]:
+        """The query embedding of the normalized text, requested once however many stages await it."""
+        if self._embedding_task is None:
+            self._embedding_task = asyncio.ensure_future(self._embed())
+        # shield, so that a stage timing out does not cancel the embedding other stages are waiting for
+        return await asyncio.shield(self._embedding_task)
+
+    async def _embed(self) -> list[float]:
+        start = time.perf_counter()
+        self.embedding_cached = embedding_cache.contains(self.normalized)
+        query_emb = await aembed_query(self.normalized)
+        if hasattr(query_emb, 'tolist'):
+            query_emb = query_emb.tolist()
+        self.add_timing("embed_ms", start)
+        return query_emb
+
+    def add_timing(self, stage: str, start: float):
+        self.timings[stage] = round(self.timings.get(stage, 0.0) + (time.perf_counter() - start) * 1000, 3)
+
+    def timed(self, stage: str) -> "_StageTimer":
+        """with analysis.timed("semantic_ms"): ... adds the time of the block to the timings."""
+        return _StageTimer(self, stage)
+
+    def summary(self) -> dict:
+        return {
+            "normalized": self.normalized,
+            "keyword_matchers": len(self._keyword_hits),
+            "embedded": self._embedding_task is not None,
+            "embedding_cached": self.embedding_cached,
+            "llm_prompt_tokens": self.llm_prompt_tokens,
+            "llm_cached_tokens": self.llm_cached_tokens,
+            "llm_cache": self.llm_cache,
+            **self.timings
+        }
+
+class _StageTimer:
+    def __init__(self, analysis: TurnAnalysis, stage: str):
+        self.analysis = analysis
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.analysis
+
+    def __exit__(self, exc_type, exc, tb):
+        self.analysis.add_timing(self.stage, self.start)
+        return False
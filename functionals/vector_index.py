@@ -0,0 +1,105 @@
+import time
+import numpy as np
+from data.paths import EMBED_WARMUP_BATCH_SIZE
+from functionals.embedding_functions import aembed_documents_array
+from functionals.embedding_store import phrase_embedding_store
+from functionals.log_utils import logger_chatflow
+
+#TODO: In-process vector index
+class InProcessVectorIndex:
+    """
+    All the semantic phrases of one agent held in memory, as an alternative to a Milvus collection.
+    Phrase vectors are rows of one contiguous L2-normalized float32 matrix, so a search is a single
+    matrix-vector product, and a node only looks at its own intentions through a precomputed boolean mask.
+    Scores are cosine similarities, the same as the COSINE metric of the Milvus collections.
+    """
+    def __init__(self, name: str, rows: list[dict], vectors: np.ndarray):
+        self.name = name
+        self.intention_ids = [row["intention_id"] for row in rows]
+        self.intention_names = [row["intention_name"] for row in rows]
+        self.phrases = [row["phrase"] for row in rows]
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(rows), -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        self.matrix = np.ascontiguousarray(vectors / np.maximum(norms, 1e-12))
+        self._intention_id_array = np.asarray(self.intention_ids, dtype=object)
+
+    @classmethod
+    async def from_data(cls, name: str, intentions: list | None = None, knowledge: list | None = None,
+                        dimension: int | None = None) -> "InProcessVectorIndex":
+        """
+        Build the index from the semantic phrases of intentions and knowledge, reusing the stored embeddings.
+        With dimension, only the leading components of the vectors are kept (Matryoshka truncation).
+        """
+        start_time = time.time()
+        rows = {}
+        for item in (intentions or []) + (knowledge or []):
+            for phrase in item.get("semantic") or []:
+                if phrase.strip(): # skip empty
+                    rows[(item.get("intention_id"), phrase)] = {
+                        "intention_id": item.get("intention_id"),
+                        "intention_name": item.get("intention_name"),
+                        "phrase": phrase
+                    }
+        rows = list(rows.values())
+
+        phrases = [row["phrase"] for row in rows]
+        vectors = await phrase_embedding_store.aget_many(phrases)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        for i in range(0, len(missing), EMBED_WARMUP_BATCH_SIZE):
+            batch = missing[i:i + EMBED_WARMUP_BATCH_SIZE]
+            embeddings = await aembed_documents_array([phrases[j] for j in batch])
+            await phrase_embedding_store.aput_many([phrases[j] for j in batch], embeddings)
+            for j, embedding in zip(batch, embeddings):
+                vectors[j] = embedding
+
+        vectors = np.asarray(vectors, dtype=np.float32)[:, :dimension] if rows else np.empty((0, 0), dtype=np.float32)
+        index = cls(name, rows, vectors)
+        logger_chatflow.info(f"内存向量索引：{name}已加载{len(rows)}条问法短语，新嵌入{len(missing)}条，耗时：{time.time() - start_time:.3f}秒")
+        return index
+
+    def build_mask(self, intention_ids: set | list) -> np.ndarray:
+        """Boolean mask of the rows that belong to the given intentions, computed once per matcher."""
+        return np.isin(self._intention_id_array, list(intention_ids))
+
+    def scores(self, query_emb) -> np.ndarray:
+        """Cosine similarity of the query to every phrase, the query is truncated to the dimension of the index."""
+        query = np.asarray(query_emb, dtype=np.float32)[:self.matrix.shape[1]]
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        return self.matrix @ query
+
+    def _hit(self, row: int, scores: np.ndarray) -> tuple[str, str, str, float]:
+        return self.intention_ids[row], self.intention_names[row], self.phrases[row], float(scores[row])
+
+    def search(self, query_emb, mask: np.ndarray | None = None) -> tuple[str, str, str, float]:
+        """Return (intention_id, intention_name, phrase, similarity_score) of the closest phrase within the mask."""
+        hits = self.search_top_k(query_emb, mask, 1)
+        return hits[0] if hits else ("", "", "", 0.0)
+
+    def _top_k(self, scores: np.ndarray, mask: np.ndarray | None, k: int) -> list[tuple[str, str, str, float]]:
+        if not self.phrases or (mask is not None and not mask.any()):
+            return []
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(len(scores))
+        k = min(k, len(rows))
+        top = rows[np.argpartition(-scores[rows], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+        return [self._hit(int(row), scores) for row in top]
+
+    def search_top_k(self, query_emb, mask: np.ndarray | None = None, k: int = 1) -> list[tuple[str, str, str, float]]:
+        """The k closest phrases within the mask, best first."""
+        if not self.phrases:
+            return []
+        return self._top_k(self.scores(query_emb), mask, k)
+
+    def search_many(self, query_emb, masks: list[np.ndarray | None], k: int = 1) -> list[list[tuple[str, str, str, float]]]:
+        """The k closest phrases within each mask, all computed from one matrix-vector product."""
+        if not self.phrases:
+            return [[] for _ in masks]
+        scores = self.scores(query_emb)
+        return [self._top_k(scores, mask, k) for mask in masks]
+
+    def __len__(self):
+        return len(self.phrases)
+
+    async def close(self):
+        """Nothing to release, kept so that callers can close it like a Milvus client."""
+        pass
@@ -0,0 +1,57 @@
+# embedding_stub_service.py
+# 本地向量服务替身 - 与正式向量服务相同的 /embed 接口，用于联调和返回格式的性能测试
+import asyncio
+import hashlib
+import logging
+import numpy as np
+from quart import Quart, request, jsonify, Response
+from hypercorn.config import Config
+from hypercorn.asyncio import serve
+from functionals.embedding_backends import EMBED_CONTENT_TYPES, encode_embeddings
+from functionals.log_utils import logger_chatflow
+
+app = Quart(__name__)
+
+STUB_EMBED_DIM = 1024 # same dimension as Qwen3-Embedding-0.6B
+
+def stub_embedding(text: str, dim: int = STUB_EMBED_DIM) -> np.ndarray:
+    """Deterministic unit vector of a text, the same text always gets the same vector."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    vector = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+def response_format_of(accept: str) -> str:
+    """Pick the response format from the Accept header, JSON unless a binary format is asked for."""
+    for response_format, content_type in EMBED_CONTENT_TYPES.items():
+        if content_type in accept:
+            return response_format
+    return "json"
+
+@app.route('/embed', methods=['POST'])
+async def embed():
+    data = await request.get_json()
+    texts = data.get("input") if data else None
+    if isinstance(texts, str):
+        texts = [texts]
+    if not texts or not all(isinstance(t, str) for t in texts):
+        return jsonify({'error': 'input应为字符串或字符串列表'}), 400
+
+    embeddings = np.stack([stub_embedding(text) for text in texts])
+    body, headers = encode_embeddings(embeddings, response_format_of(request.headers.get("Accept", "")))
+    return Response(body, headers=headers)
+
+@app.route('/health', methods=['GET'])
+async def health():
+    return jsonify({'status': 'healthy', 'service': 'embedding_stub', 'dimension': STUB_EMBED_DIM, 'formats': list(EMBED_CONTENT_TYPES)})
+
+def start_embedding_stub_service(port=8081):
+    """启动本地向量服务替身"""
+    logger_chatflow.info(f"启动本地向量服务替身，端口: {port}，支持返回格式：{list(EMBED_CONTENT_TYPES)}")
+    config = Config()
+    config.bind = [f"0.0.0.0:{port}"]
+    config.accesslog = logging.getLogger("hypercorn.access")
+    config.use_reloader = False
+    asyncio.run(serve(app, config))
+
+if __name__ == '__main__':
+    start_embedding_stub_service()
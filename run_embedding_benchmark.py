@@ -0,0 +1,55 @@
+import argparse
+import statistics
+import time
+import numpy as np
+import requests
+from data.paths import EMBED_SERVICE_URL
+from functionals.embedding_backends import EMBED_CONTENT_TYPES, decode_embeddings
+
+"""
+Compare the response formats of the embedding service: the same requests are sent in every format,
+and the round trip and the client-side decoding into a float32 array are timed separately.
+Start the local stand-in first (python main.py embedding_stub) or point --url at a service that supports the formats.
+"""
+
+def benchmark_format(session: requests.Session, url: str, response_format: str, texts: list[str], rounds: int) -> dict:
+    total_ms, decode_ms, sizes = [], [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        resp = session.post(f"{url}/embed", json={"input": texts}, headers={"Accept": EMBED_CONTENT_TYPES[response_format]})
+        resp.raise_for_status()
+        received = time.perf_counter()
+        embeddings = np.asarray(decode_embeddings(resp.headers, resp.content), dtype=np.float32)
+        done = time.perf_counter()
+        if embeddings.shape[0] != len(texts):
+            raise ValueError(f"{response_format}格式返回{embeddings.shape[0]}条向量，应为{len(texts)}条")
+        total_ms.append((done - start) * 1000)
+        decode_ms.append((done - received) * 1000)
+        sizes.append(len(resp.content))
+    return {
+        "format": response_format,
+        "served_as": resp.headers.get("Content-Type", ""),
+        "bytes": int(statistics.mean(sizes)),
+        "total_ms_p50": statistics.median(total_ms),
+        "decode_ms_p50": statistics.median(decode_ms)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='向量服务返回格式性能测试')
+    parser.add_argument('--url', default=EMBED_SERVICE_URL, help='向量服务地址')
+    parser.add_argument('--batch-sizes', default="1,8,32,128", help='每次请求的文本数量，逗号分隔')
+    parser.add_argument('--rounds', type=int, default=50, help='每种格式每个批量的请求次数')
+    args = parser.parse_args()
+
+    session = requests.Session()
+    print(f"{'batch':>6} {'format':>8} {'bytes':>10} {'total p50 ms':>13} {'decode p50 ms':>14}  served as")
+    for batch_size in (int(x) for x in args.batch_sizes.split(",")):
+        texts = [f"这是第{i}条测试问法，请问你们的活动什么时候开始" for i in range(batch_size)]
+        for response_format in EMBED_CONTENT_TYPES:
+            benchmark_format(session, args.url, response_format, texts, 2) # warm up the connection
+            result = benchmark_format(session, args.url, response_format, texts, args.rounds)
+            print(f"{batch_size:>6} {result['format']:>8} {result['bytes']:>10} {result['total_ms_p50']:>13.3f} "
+                  f"{result['decode_ms_p50']:>14.3f}  {result['served_as']}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+import argparse
+import hashlib
+import importlib
+import statistics
+import time
+import uuid
+import numpy as np
+from pymilvus import MilvusClient
+from pymilvus.milvus_client import IndexParams
+from data.simulated_data_lt_simplified import agent_data
+from functionals.embedding_functions import truncate_embeddings
+from functionals.milvus import DEFAULT_HNSW_PARAMS, VECTOR_INDEX_TYPES, build_phrase_schema
+
+"""
+Recall against latency of the settings of the semantic index (embedding_dim, milvus_index_type, hnsw_m,
+hnsw_ef_construction and hnsw_ef in AgentConfig).
+The semantic phrases of the simulated data are indexed in a temporary Milvus collection for every (dimension, index type,
+M, efConstruction), each query is a phrase with a character dropped, and the top-1 of every search ef is compared to
+a brute-force exact search over the full vectors, so the cost of truncation and quantization is part of the agreement.
+Settings whose top-1 agreement stays above --min-agreement are safe to lower to.
+By default the vectors come from a stand-in embedding (hashed character n-grams), --embedding service uses the embedding service.
+The stand-in has no Matryoshka structure, measure the cost of smaller dimensions with --embedding service.
+"""
+
+def ngram_embedding(text: str, dim: int) -> np.ndarray:
+    """Stand-in embedding: signed hashing of character unigrams and bigrams, phrases sharing characters are close."""
+    vector = np.zeros(dim, dtype=np.float32)
+    for gram in list(text) + [text[i:i + 2] for i in range(len(text) - 1)]:
+        h = int.from_bytes(hashlib.md5(gram.encode()).digest()[:8], "little")
+        vector[h % dim] += 1.0 if (h >> 63) & 1 else -1.0
+    return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+def embed(texts: list[str], embedding: str, dim: int) -> np.ndarray:
+    if embedding == "service":
+        from functionals.embedding_functions import embed_documents
+        vectors = [np.asarray(v, dtype=np.float32) for i in range(0, len(texts), 64) for v in embed_documents(texts[i:i + 64])]
+        vectors = np.stack(vectors)
+    else:
+        vectors = np.stack([ngram_embedding(text, dim) for text in texts])
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+def load_phrases(modules: list[str], synthetic: int, rng: np.random.Generator) -> list[str]:
+    phrases = []
+    for module_name in modules:
+        module = importlib.import_module(f"data.{module_name}")
+        for item in getattr(module, "intentions", []) + getattr(module, "knowledge", []):
+            phrases += [phrase for phrase in item.get("semantic") or [] if phrase.strip()]
+    phrases = list(dict.fromkeys(phrases))
+    # Random phrases made of the same characters, to grow the index to the size of a large knowledge base
+    alphabet = sorted(set("".join(phrases)))
+    for _ in range(synthetic):
+        phrases.append("".join(rng.choice(alphabet, size=int(rng.integers(4, 17)))))
+    return phrases
+
+def make_queries(phrases: list[str], count: int, rng: np.random.Generator) -> list[str]:
+    queries = []
+    for i in rng.choice(len(phrases), size=min(count, len(phrases)), replace=False):
+        phrase = phrases[i]
+        drop = int(rng.integers(len(phrase))) if len(phrase) > 2 else len(phrase)
+        queries.append(phrase[:drop] + phrase[drop + 1:])
+    return queries
+
+def build_collection(client: MilvusClient, vectors: np.ndarray, index_type: str, m: int, ef_construction: int) -> tuple[str, float]:
+    collection_name = f"hnsw_benchmark_{uuid.uuid4().hex[:8]}"
+    client.create_collection(collection_name=collection_name, schema=build_phrase_schema(vectors.shape[1]))
+    for i in range(0, len(vectors), 1000):
+        client.insert(collection_name=collection_name, data=[
+            {"id": j, "vector": vectors[j].tolist(), "intention_id": "", "intention_name": "", "phrase": ""}
+            for j in range(i, min(i + 1000, len(vectors)))
+        ])
+    client.flush(collection_name) # sealed segments, so that every row is in the HNSW graph
+    start = time.perf_counter()
+    index_params = IndexParams()
+    index_params.add_index(field_name="vector", index_type=index_type, metric_type="COSINE",
+                           params={"M": m, "efConstruction": ef_construction, **VECTOR_INDEX_TYPES[index_type]})
+    client.create_index(collection_name=collection_name, index_params=index_params)
+    client.load_collection(collection_name)
+    return collection_name, time.perf_counter() - start
+
+def benchmark_ef(client: MilvusClient, collection_name: str, queries: np.ndarray,
+                 full_vectors: np.ndarray, full_queries: np.ndarray, exact_scores: np.ndarray, ef: int | None) -> dict:
+    search_params = {"ef": ef} if ef else None
+    for query in queries[:10]: # warm up
+        client.search(collection_name=collection_name, data=[query.tolist()], limit=1, search_params=search_params)
+    latencies, agreed = [], 0
+    for query, full_query, exact_score in zip(queries, full_queries, exact_scores):
+        start = time.perf_counter()
+        results = client.search(collection_name=collection_name, data=[query.tolist()], limit=1, search_params=search_params)
+        latencies.append((time.perf_counter() - start) * 1000)
+        # The returned phrase is judged with the full vectors, ties are agreements too, only a worse top-1 is a miss
+        if results and results[0] and float(full_vectors[results[0][0]["id"]] @ full_query) >= exact_score - 1e-5:
+            agreed += 1
+    latencies.sort()
+    return {
+        "agreement": agreed / len(queries),
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='HNSW参数召回率与检索耗时测试')
+    parser.add_argument('--url', default=agent_data.get("vector_db_url"), help='Milvus地址')
+    parser.add_argument('--data', default="simulated_data_lt_simplified,simulated_data_xyp20251222", help='data目录下的模拟数据模块，逗号分隔')
+    parser.add_argument('--synthetic', type=int, default=20000, help='额外生成的随机问法数量，模拟大型知识库')
+    parser.add_argument('--queries', type=int, default=500, help='查询数量')
+    parser.add_argument('--embedding', choices=['ngram', 'service'], default='ngram', help='替身嵌入或向量服务')
+    parser.add_argument('--dim', type=int, default=1024, help='替身嵌入的维度')
+    parser.add_argument('--dims', default="1024,512,256", help='索引保留的向量维度，逗号分隔')
+    parser.add_argument('--index-types', default="HNSW,HNSW_SQ", help=f'索引类型，逗号分隔，可选{list(VECTOR_INDEX_TYPES)}')
+    parser.add_argument('--m', default="8,16,32", help='HNSW M，逗号分隔')
+    parser.add_argument('--ef-construction', default="100,200", help='HNSW efConstruction，逗号分隔')
+    parser.add_argument('--ef', default="default,16,32,64,128", help='检索ef，逗号分隔，default为Milvus默认值')
+    parser.add_argument('--min-agreement', type=float, default=0.99, help='与精确检索top-1一致率的最低要求')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    phrases = load_phrases(args.data.split(","), args.synthetic, rng)
+    queries = make_queries(phrases, args.queries, rng)
+    vectors = embed(phrases, args.embedding, args.dim)
+    query_vectors = embed(queries, args.embedding, args.dim)
+    exact_scores = (query_vectors @ vectors.T).max(axis=1) # brute-force top-1 score of every query
+    print(f"{len(phrases)} phrases, {len(queries)} queries, dimension {vectors.shape[1]}, embedding {args.embedding}")
+
+    client = MilvusClient(uri=args.url)
+    efs = [None if ef == "default" else int(ef) for ef in args.ef.split(",")]
+    results = []
+    print(f"{'dim':>5} {'index':>8} {'vec MB':>7} {'M':>4} {'efC':>5} {'ef':>8} {'build s':>8} {'top-1 agree':>12} {'p50 ms':>8} {'p99 ms':>8}")
+    for dim in (int(x) for x in args.dims.split(",")):
+        dim_vectors = truncate_embeddings(vectors, dim)
+        dim_queries = truncate_embeddings(query_vectors, dim)
+        for index_type in args.index_types.split(","):
+            # Raw vector memory of the index: float32, or one byte per component with SQ8
+            vector_mb = len(phrases) * dim_vectors.shape[1] * (1 if index_type == "HNSW_SQ" else 4) / 1e6
+            for m in (int(x) for x in args.m.split(",")):
+                for ef_construction in (int(x) for x in args.ef_construction.split(",")):
+                    collection_name, build_s = build_collection(client, dim_vectors, index_type, m, ef_construction)
+                    try:
+                        for ef in efs:
+                            result = {"dim": dim_vectors.shape[1], "index_type": index_type, "M": m, "efConstruction": ef_construction,
+                                      "ef": ef, "build_s": build_s, "vector_mb": vector_mb,
+                                      **benchmark_ef(client, collection_name, dim_queries, vectors, query_vectors, exact_scores, ef)}
+                            results.append(result)
+                            print(f"{result['dim']:>5} {index_type:>8} {vector_mb:>7.1f} {m:>4} {ef_construction:>5} {str(ef or 'default'):>8} "
+                                  f"{build_s:>8.2f} {result['agreement']:>12.2%} {result['p50_ms']:>8.3f} {result['p99_ms']:>8.3f}")
+                    finally:
+                        client.drop_collection(collection_name)
+
+    safe = sorted((r for r in results if r["agreement"] >= args.min_agreement), key=lambda r: (r["p50_ms"], r["vector_mb"]))
+    print(f"\nSettings with top-1 agreement >= {args.min_agreement:.0%}, fastest first "
+          f"(current default: embedding_dim=1024, HNSW, {DEFAULT_HNSW_PARAMS}, ef default):")
+    for r in safe:
+        print(f"  embedding_dim={r['dim']}, milvus_index_type={r['index_type']}, hnsw_m={r['M']}, hnsw_ef_construction={r['efConstruction']}, "
+              f"hnsw_ef={r['ef']}: {r['agreement']:.2%}, p50 {r['p50_ms']:.3f} ms, p99 {r['p99_ms']:.3f} ms, vectors {r['vector_mb']:.1f} MB")
+    if not safe:
+        print("  none, keep the current settings or raise ef")
+
+if __name__ == '__main__':
+    main()
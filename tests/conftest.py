@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The modules are imported from the project root, as in main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
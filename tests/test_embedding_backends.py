@@ -0,0 +1,102 @@
+import asyncio
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+tokenizers = pytest.importorskip("tokenizers")
+
+from onnx import TensorProto, helper
+from functionals.embedding_backends import EmbeddingBackend, OnnxEmbeddingBackend
+
+VOCAB = {"<|endoftext|>": 0, "[UNK]": 1, "报名": 2, "活动": 3, "时间": 4, "地点": 5, "费用": 6}
+DIM = 4
+# One row per token id, the pad row is large so that pooling on a pad token would show
+TABLE = np.array([
+    [9.0, 9.0, 9.0, 9.0],
+    [0.1, 0.1, 0.1, 0.1],
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+    [1.0, 1.0, 0.0, 0.0],
+], dtype=np.float32)
+
+def _export_model(path, pooled: bool = False):
+    """Tiny stand-in of an exported embedding model: last hidden states are a lookup of the input ids."""
+    input_ids = helper.make_tensor_value_info("input_ids", TensorProto.INT64, ["batch", "seq"])
+    attention_mask = helper.make_tensor_value_info("attention_mask", TensorProto.INT64, ["batch", "seq"])
+    table = helper.make_tensor("table", TensorProto.FLOAT, TABLE.shape, TABLE.flatten().tolist())
+    nodes = [helper.make_node("Gather", ["table", "input_ids"], ["hidden"], axis=0)]
+    if pooled: # sentence embeddings of shape (batch, dim): the first token
+        nodes.append(helper.make_node("Gather", ["hidden", "zero"], ["output"], axis=1))
+        initializers = [table, helper.make_tensor("zero", TensorProto.INT64, [], [0])]
+        output = helper.make_tensor_value_info("output", TensorProto.FLOAT, ["batch", DIM])
+    else:
+        nodes.append(helper.make_node("Identity", ["hidden"], ["output"]))
+        initializers = [table]
+        output = helper.make_tensor_value_info("output", TensorProto.FLOAT, ["batch", "seq", DIM])
+    # attention_mask is declared but unused, as the backend always feeds it
+    graph = helper.make_graph(nodes, "tiny_embedding", [input_ids, attention_mask], [output], initializers)
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+
+def _save_tokenizer(path):
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(VOCAB, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer.save(str(path))
+
+@pytest.fixture
+def backend(tmp_path):
+    _export_model(tmp_path / "model.onnx")
+    _save_tokenizer(tmp_path / "tokenizer.json")
+    backend = OnnxEmbeddingBackend(str(tmp_path / "model.onnx"), str(tmp_path / "tokenizer.json"), batch_size=8, workers=1)
+    yield backend
+    asyncio.run(backend.aclose())
+
+def _normalized(row):
+    return row / np.linalg.norm(row)
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        EmbeddingBackend()
+
+def test_right_padding(backend):
+    batch = backend._run_batch(["报名", "活动 时间 地点"])
+    assert batch.shape == (2, DIM)
+    # The short row is padded with <|endoftext|>, its vector is still the one of its last real token
+    np.testing.assert_allclose(batch[0], _normalized(TABLE[VOCAB["报名"]]), atol=1e-6)
+
+def test_last_token_pooling(backend):
+    vectors = backend.embed_documents_array(["活动 时间", "报名 活动 费用", "地点"])
+    np.testing.assert_allclose(vectors[0], _normalized(TABLE[VOCAB["时间"]]), atol=1e-6)
+    np.testing.assert_allclose(vectors[1], _normalized(TABLE[VOCAB["费用"]]), atol=1e-6)
+    np.testing.assert_allclose(vectors[2], _normalized(TABLE[VOCAB["地点"]]), atol=1e-6)
+
+def test_batching_keeps_input_order(backend):
+    texts = ["报名 活动 费用", "地点", "活动 时间", "报名"]
+    together = backend.embed_documents_array(texts)
+    backend.batch_size = 1
+    one_by_one = backend.embed_documents_array(texts)
+    np.testing.assert_allclose(together, one_by_one, atol=1e-6)
+    assert backend.embed_query("地点") == pytest.approx(together[1].tolist())
+
+def test_async_matches_sync(backend):
+    texts = ["活动 时间", "报名"]
+    vectors = asyncio.run(backend.aembed_documents(texts))
+    np.testing.assert_allclose(np.asarray(vectors), backend.embed_documents_array(texts), atol=1e-6)
+    assert asyncio.run(backend.aembed_documents([])) == []
+
+def test_pooled_output(tmp_path):
+    _export_model(tmp_path / "pooled.onnx", pooled=True)
+    _save_tokenizer(tmp_path / "tokenizer.json")
+    backend = OnnxEmbeddingBackend(str(tmp_path / "pooled.onnx"), str(tmp_path / "tokenizer.json"), workers=1)
+    vectors = backend.embed_documents_array(["时间 地点"])
+    np.testing.assert_allclose(vectors[0], _normalized(TABLE[VOCAB["时间"]]), atol=1e-6)
+    asyncio.run(backend.aclose())
+
+def test_missing_model(tmp_path):
+    _save_tokenizer(tmp_path / "tokenizer.json")
+    with pytest.raises(FileNotFoundError):
+        OnnxEmbeddingBackend(str(tmp_path / "missing.onnx"), str(tmp_path / "tokenizer.json"))
@@ -0,0 +1,36 @@
+import pytest
+from functionals.turn_analysis import TurnAnalysis, normalize_turn_text, strip_fillers
+
+@pytest.mark.parametrize("text", [
+    "额度是多少",
+    "查一下余额",
+    "我想问下金额",
+    "那个人是谁",
+    "哦哦哦是什么活动",
+    "好啊",
+    "是嗯",
+])
+def test_words_keep_their_characters(text):
+    assert normalize_turn_text(text) == text
+
+@pytest.mark.parametrize("text, expected", [
+    ("嗯，好的。", "好的"),
+    ("呃 我想报名", "我想报名"),
+    ("啊啊，什么时间", "什么时间"),
+    ("诶？地点在哪", "地点在哪"),
+    ("好的，嗯", "好的"),
+    ("可以的 哦", "可以的"),
+    ("嗯，额度是多少", "额度是多少"),
+    ("那个，查一下余额，嗯", "那个,查一下余额"),
+])
+def test_standalone_fillers_are_removed(text, expected):
+    assert normalize_turn_text(text) == expected
+
+def test_filler_only_utterance_is_kept():
+    assert strip_fillers("嗯嗯") == "嗯嗯"
+    assert normalize_turn_text("嗯。") == "嗯"
+
+def test_turn_analysis_uses_the_same_normalization():
+    analysis = TurnAnalysis("嗯，额度是多少？")
+    assert analysis.text == "嗯，额度是多少？"
+    assert analysis.normalized == "额度是多少"